@@ -1,4 +1,5 @@
 import streamlit as st
+from contextlib import nullcontext
 from textwrap import dedent
 import utils as U
 import kinematics as K
@@ -69,18 +70,41 @@ st.success("### Parameters ⚙️")
 with st.expander("Input Parameters 📥", expanded=False):
     st.json(params)
 
-with st.container():
+solve_cache = U.get_solve_cache()
+solve_stats = K.SolveStats()
+instrumentation = K.collect(solve_stats) if Defaults.USE_DEBUG_MODE else nullcontext()
+
+with st.container(), instrumentation:
     try:
         # k1 = K.Kinematics1D(vi=205, vf=315, t=10.0)
-        k1 = K.Kinematics1D(**params)
-        result, steps = k1.solve(steps_params=dict(debug=Defaults.USE_DEBUG_MODE))
+        k1, update = U.update_session_solver(params, cache=solve_cache)
+        result, steps = update.result, list(update.steps)
+        if Defaults.USE_DEBUG_MODE:
+            update.steps.show(debug=True)
 
         with st.expander("Evaluated Parameters 🎁", expanded=True):
+            if update.changed:
+                st.caption(f"Changed: {', '.join(update.changed)} ({len(update.recomputed)} step(s) evaluated)")
             U.display_result(result, known = known)
 
+        with st.expander("Uncertainty (Monte Carlo) 🎲", expanded=False):
+            U.show_uncertainty(k1, known=known, result=result)
+
         st.info("### Mathematical Steps 🎈🎉")
         U.show_math_steps(steps)
 
+        st.info("### Trajectory 📈")
+        n_points = st.select_slider(
+            label="Number of samples 👇",
+            options=Defaults.TRAJECTORY_POINTS,
+            value=Defaults.TRAJECTORY_POINTS[2],
+            help="Samples over [0, t]; the plots are downsampled on the server.",
+        )
+        U.show_trajectory(k1, n_points=n_points)
+
+        st.info("### Parameter Sweep 🔍")
+        U.show_sweep(k1, known=known)
+
     except ValueError as ve:
         st.error(dedent(f"""#### Insufficient Parameters :fire:
 
@@ -98,6 +122,9 @@ with st.container():
 
         """))
 
+if Defaults.USE_DEBUG_MODE:
+    U.show_debug_info(cache=solve_cache, stats=solve_stats)
+
 
 # st.latex(r'''
 # \begin{aligned}
@@ -0,0 +1,97 @@
+"""Arrow input/output versus the dict paths.
+
+Solves a ``pyarrow.Table`` of ``--rows`` problems (a null per row marks the
+unknown; ``--chunks`` record batches) and reports the time of:
+
+- ``pylist``: ``Table.to_pylist()`` and one ``calculate1D`` per row dict
+  (on ``--scalar-rows`` rows, extrapolated),
+- ``pydict``: ``Table.to_pydict()`` into ``calculate1D_batch`` (lists of
+  Python floats, ``None`` for nulls) and back with ``pa.table``,
+- ``arrow``: ``calculate1D_batch(table)``: buffers viewed as NumPy, validity
+  bitmaps as unknowns, results handed back to Arrow without copies.
+
+Run from ``apps/kinematics1d``:
+
+    python benchmarks/bench_arrow.py [--rows 1000000] [--chunks 4]
+
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pyarrow as pa  # noqa: E402
+
+import kinematics as K  # noqa: E402
+from kinematics.plans import PARAMS  # noqa: E402
+
+
+def make_table(rows: int, chunks: int, seed: int=0) -> pa.Table:
+    rng = np.random.default_rng(seed)
+    vi = rng.uniform(-50, 50, rows)
+    a = rng.uniform(0.5, 5, rows)
+    t = rng.uniform(0.5, 20, rows)
+    solved = K.calculate1D_batch(vi=vi, a=a, t=t, ndigits=None)
+    # Three knowns per row: hide one of vi, a, t and one of the others.
+    hidden = rng.integers(0, 3, rows)
+    columns = dict()
+    for name in PARAMS:
+        values = solved[name]
+        mask = np.ones(rows, dtype=bool)
+        if name in ("vi", "a", "t"):
+            mask = hidden != ("vi", "a", "t").index(name)
+        elif name == "vf":
+            mask = hidden == 2
+        elif name == "Dx":
+            mask = hidden != 2
+        else:
+            mask = np.zeros(rows, dtype=bool)
+        columns[name] = pa.array(values, mask=~mask)
+    table = pa.table(columns)
+    size = -(-rows // chunks)
+    return pa.Table.from_batches([b for i in range(chunks) for b in table.slice(i * size, size).to_batches()])
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(rows: int=1000000, chunks: int=4, scalar_rows: int=20000):
+    table = make_table(rows, chunks)
+    print(f"rows: {rows:,}, record batches: {table.column(0).num_chunks}")
+    print(f"{'path':<10}{'seconds':>10}{'rows/s':>14}")
+
+    def pylist():
+        out = []
+        for row in table.slice(0, scalar_rows).to_pylist():
+            out.append(K.calculate1D(**dict((k, v) for k, v in row.items() if v is not None))[0])
+        return out
+
+    seconds, _ = timed(pylist)
+    seconds *= rows / min(rows, scalar_rows)
+    print(f"{'pylist':<10}{seconds:>10.2f}{rows / seconds:>14,.0f}  (extrapolated from {min(rows, scalar_rows):,} rows)")
+
+    def pydict():
+        data = dict((k, np.array(v, dtype=float)) for k, v in table.to_pydict().items())
+        return pa.table(dict((k, v.tolist()) for k, v in K.calculate1D_batch(data, ndigits=None).items()))
+
+    seconds, expected = timed(pydict)
+    print(f"{'pydict':<10}{seconds:>10.2f}{rows / seconds:>14,.0f}")
+
+    seconds, result = timed(lambda: K.calculate1D_batch(table, ndigits=None))
+    print(f"{'arrow':<10}{seconds:>10.2f}{rows / seconds:>14,.0f}")
+    assert result.select(list(PARAMS)).equals(expected.select(list(PARAMS)).cast(result.select(list(PARAMS)).schema))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--chunks", type=int, default=4)
+    parser.add_argument("--scalar-rows", type=int, default=20000)
+    args = parser.parse_args()
+    main(rows=args.rows, chunks=args.chunks, scalar_rows=args.scalar_rows)
@@ -0,0 +1,63 @@
+"""Import-time benchmark of ``import kinematics`` (based on ``python -X importtime``).
+
+Fails (exit code 1) when the best cumulative import time over ``--repeat`` runs
+exceeds ``--budget-ms``, or when an optional heavy dependency (IPython, NumPy,
+pandas) gets imported by ``import kinematics``.
+
+Run from ``apps/kinematics1d``:
+
+    python benchmarks/bench_import.py [--budget-ms 50] [--repeat 7]
+
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import-time budget of ``import kinematics`` (cumulative, in milliseconds).
+BUDGET_MS = 50.0
+HEAVY_MODULES = ("IPython", "numpy", "pandas")
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def import_times(module: str="kinematics"):
+    """Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter
+    and returns the cumulative time (ms) of each imported module.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+    )
+    times = dict()
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2)) / 1000.0
+    return times
+
+
+def main(budget_ms: float=BUDGET_MS, repeat: int=7) -> int:
+    runs = [import_times("kinematics") for _ in range(repeat)]
+    best = min(run["kinematics"] for run in runs)
+    heavy = sorted(set(name.split(".")[0] for name in runs[0]) & set(HEAVY_MODULES))
+    print(f"import kinematics: {best:.2f} ms (best of {repeat}), budget: {budget_ms:.2f} ms")
+    status = 0
+    if heavy:
+        print(f"FAIL: heavy optional modules imported: {heavy}")
+        status = 1
+    if best > budget_ms:
+        print("FAIL: import time over budget")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+    sys.exit(main(budget_ms=args.budget_ms, repeat=args.repeat))
@@ -0,0 +1,66 @@
+"""Allocation profile of solving many problems with the different result forms.
+
+Compares, for ``--rows`` problems, the peak traced memory (``tracemalloc``),
+the memory retained by the results and the number of garbage collections of:
+
+- ``calculate1D``: a rounded ``dict`` and a ``steps`` list per row,
+- ``solve1D``: a ``KinematicsResult`` per row (shared step trace),
+- ``calculate1D_batch(as_recarray=True)``: one structured array.
+
+Run from ``apps/kinematics1d``:
+
+    python benchmarks/bench_memory.py [--rows 1000000]
+
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+import kinematics as K  # noqa: E402
+
+
+def _gc_collections() -> int:
+    return sum(stat["collections"] for stat in gc.get_stats())
+
+
+def profile(name: str, func):
+    gc.collect()
+    collections = _gc_collections()
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = func()
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    collections = _gc_collections() - collections
+    del results
+    print(f"{name:<12}{elapsed:>10.2f}{peak / 2**20:>12.1f}{retained / 2**20:>14.1f}{collections:>8}")
+
+
+def main(rows: int=1000000, seed: int=0):
+    rng = np.random.default_rng(seed)
+    vi = rng.uniform(-50, 50, rows)
+    vf = rng.uniform(-50, 50, rows)
+    t = rng.uniform(0.5, 20, rows)
+    vi_list, vf_list, t_list = vi.tolist(), vf.tolist(), t.tolist()
+
+    print(f"rows: {rows}")
+    print(f"{'form':<12}{'seconds':>10}{'peak MiB':>12}{'retained MiB':>14}{'gc':>8}")
+    profile("dict", lambda: [K.calculate1D(vi=a, vf=b, t=c) for a, b, c in zip(vi_list, vf_list, t_list)])
+    profile("record", lambda: [K.solve1D(vi=a, vf=b, t=c) for a, b, c in zip(vi_list, vf_list, t_list)])
+    profile("recarray", lambda: K.calculate1D_batch(vi=vi, vf=vf, t=t, ndigits=None, as_recarray=True))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    main(rows=args.rows, seed=args.seed)
@@ -0,0 +1,61 @@
+"""Scaling benchmark of ``calculate1D_batch(workers=N)`` from 1 to all cores.
+
+Run from ``apps/kinematics1d``:
+
+    python benchmarks/bench_parallel.py [--rows 5000000] [--max-workers 8]
+
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+import kinematics as K  # noqa: E402
+
+
+def make_problems(rows: int, seed: int=0):
+    """Mixed known-patterns: a third each of (vi, vf, t), (vi, a, Dx), (vf, a, t)."""
+    rng = np.random.default_rng(seed)
+    vi = rng.uniform(-50, 50, rows)
+    a = rng.uniform(0.5, 5, rows)
+    t = rng.uniform(0.5, 20, rows)
+    vf = vi + a * t
+    Dx = 0.5 * (vi + vf) * t
+    group = np.arange(rows) % 3
+    nan = np.nan
+    return dict(
+        vi=np.where(group == 2, nan, vi),
+        vf=np.where(group == 1, nan, vf),
+        t=np.where(group == 1, nan, t),
+        a=np.where(group == 0, nan, a),
+        Dx=np.where(group == 1, Dx, nan),
+    )
+
+
+def main(rows: int=5000000, max_workers: int=0, repeat: int=3):
+    columns = make_problems(rows)
+    max_workers = max_workers or os.cpu_count() or 1
+    print(f"rows: {rows:,}, cores: {os.cpu_count()}")
+    print(f"{'workers':>8}{'seconds':>10}{'Mrows/s':>10}{'speedup':>10}")
+    base = None
+    for workers in range(1, max_workers + 1):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            K.calculate1D_batch(columns, ndigits=None, workers=workers)
+            best = min(best, time.perf_counter() - start)
+        base = base or best
+        print(f"{workers:>8}{best:>10.3f}{rows / best / 1e6:>10.2f}{base / best:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000000)
+    parser.add_argument("--max-workers", type=int, default=0, help="default: all cores")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(rows=args.rows, max_workers=args.max_workers, repeat=args.repeat)
@@ -0,0 +1,135 @@
+"""Load generator for the solve service (``python -m kinematics serve``).
+
+Opens ``--connections`` keep-alive connections, each sending ``--requests``
+single-problem ``POST /solve`` requests back to back, and reports the
+throughput and p50/p90/p99 latency, along with the service's own metrics
+(e.g. the mean batch size).
+
+Run from ``apps/kinematics1d``, against a running service:
+
+    python -m kinematics serve --port 8000 &
+    python benchmarks/bench_service.py --port 8000 [--connections 64] [--requests 200]
+
+or let it start (and stop) one:
+
+    python benchmarks/bench_service.py --spawn [--max-batch-size 1024] [--max-delay-ms 2]
+
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.dirname(HERE)
+sys.path.insert(0, APP)
+
+import numpy as np  # noqa: E402
+
+from bench_parallel import make_problems  # noqa: E402
+
+
+def problems(rows: int):
+    columns = make_problems(rows)
+    return [
+        json.dumps(dict((name, float(col[i])) for name, col in columns.items() if not np.isnan(col[i]))).encode()
+        for i in range(rows)
+    ]
+
+
+async def request(reader, writer, host: str, method: str, path: str, body: bytes=b""):
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.decode("latin-1").split("\r\n"):
+        if line.lower().startswith("content-length:"):
+            length = int(line.split(":", 1)[1])
+    return head.split(b" ", 2)[1], await reader.readexactly(length)
+
+
+async def client(host: str, port: int, bodies, n: int, offset: int, latencies, failures):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(n):
+            body = bodies[(offset + i) % len(bodies)]
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, host, "POST", "/solve", body)
+            latencies.append(time.perf_counter() - start)
+            if status != b"200":
+                failures.append(status)
+    finally:
+        writer.close()
+
+
+async def wait_ready(host: str, port: int, timeout: float=30.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            await request(reader, writer, host, "GET", "/health")
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def run(host: str, port: int, connections: int, requests: int):
+    await wait_ready(host, port)
+    bodies = problems(3000)
+    latencies, failures = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, bodies, requests, i * requests, latencies, failures)
+        for i in range(connections)
+    ))
+    seconds = time.perf_counter() - start
+    reader, writer = await asyncio.open_connection(host, port)
+    _, metrics = await request(reader, writer, host, "GET", "/metrics")
+    writer.close()
+
+    p50, p90, p99 = np.percentile(np.array(latencies), [50, 90, 99]) * 1e3
+    print(f"requests: {len(latencies):,} over {connections} connections in {seconds:.2f} s "
+          f"({len(latencies) / seconds:,.0f} req/s), failures: {len(failures)}")
+    print(f"latency (ms): p50 {p50:.2f}, p90 {p90:.2f}, p99 {p99:.2f}, max {max(latencies) * 1e3:.2f}")
+    metrics = json.loads(metrics)
+    print(f"service: {metrics['batches']:,} batches, mean batch size {metrics['mean_batch_size']:.1f}, "
+          f"max {metrics['max_batch_size']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=200, help="requests per connection")
+    parser.add_argument("--spawn", action="store_true", help="start a service for the run")
+    parser.add_argument("--max-batch-size", type=int, default=1024, help="with --spawn")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="with --spawn")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "kinematics", "serve", "--host", args.host, "--port", str(args.port),
+             "--max-batch-size", str(args.max_batch_size), "--max-delay-ms", str(args.max_delay_ms)],
+            cwd=APP,
+        )
+    try:
+        asyncio.run(run(args.host, args.port, args.connections, args.requests))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
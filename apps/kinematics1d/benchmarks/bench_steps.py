@@ -0,0 +1,44 @@
+"""Microbenchmark of the ``steps`` modes of ``Kinematics1D.solve``.
+
+``lazy_payload`` builds the payload of a fresh trace on every call (the
+cost of the first access); ``lazy_cached`` reads the payload already built
+on the shared trace of the plan.
+
+Run from ``apps/kinematics1d``:
+
+    python benchmarks/bench_steps.py [--number 20000]
+
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kinematics as K  # noqa: E402
+
+
+def main(number: int=20000, repeat: int=5):
+    k1 = K.Kinematics1D(vi=205, vf=315, t=10.0)
+    cases = dict(
+        eager=lambda: k1.solve(steps="eager"),
+        lazy=lambda: k1.solve(steps="lazy"),
+        none=lambda: k1.solve(steps="none"),
+        lazy_payload=lambda: K.StepTrace(k1.solve(steps="lazy")[1].ids).payload,
+        lazy_cached=lambda: k1.solve(steps="lazy")[1].payload,
+    )
+    baseline = None
+    print(f"{'mode':<14}{'us/call':>10}{'vs eager':>10}")
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+        baseline = baseline or best
+        print(f"{name:<14}{best:>10.2f}{baseline / best:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(number=args.number, repeat=args.repeat)
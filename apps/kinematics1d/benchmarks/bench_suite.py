@@ -0,0 +1,196 @@
+"""Regression benchmark suite of the scalar solver (``kinematics.k1d``).
+
+Times the ``calculate1D`` solve of every plan (one per known set), the
+``show_steps`` payload of every plan, and scalar vs. batch throughput. Results can be saved as a JSON
+baseline and later checked against it. Every run also checks that the batch
+results equal the scalar ones to the last (rounded) digit, and exits 1
+otherwise.
+
+Run from ``apps/kinematics1d``:
+
+    python benchmarks/bench_suite.py --save              # record a baseline
+    python benchmarks/bench_suite.py --check             # compare, exit 1 on regression
+    python benchmarks/bench_suite.py --check --threshold 0.1 --filter calculate1D/
+
+Baselines are machine specific: record one per box, and compare only runs
+made on the same machine.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from typing import Callable, Dict, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import numpy as np  # noqa: E402
+
+import kinematics as K  # noqa: E402
+from kinematics.plans import PLAN_FORMULAS, PLANS  # noqa: E402
+from bench_parallel import make_problems  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+
+# A consistent problem: every known set picks its values from here.
+PROBLEM = dict(Dx=2600.0, a=11.0, v_avg=260.0, vi=205.0, vf=315.0, t=10.0)
+
+
+def _short(plan_name: str) -> str:
+    return plan_name[len("known_"):] if plan_name.startswith("known_") else plan_name
+
+
+def micro_cases() -> Dict[str, Callable[[], object]]:
+    """Per-call cases (timed in us/call)."""
+    cases = dict()
+    for plan in PLANS:
+        kwargs = dict((name, PROBLEM[name]) for name in plan.known)
+        cases[f"calculate1D/{_short(plan.name)}"] = lambda kwargs=kwargs: K.calculate1D(**kwargs)
+    for plan in PLANS:
+        formulas = list(PLAN_FORMULAS[plan.mask])
+        cases[f"show_steps/{_short(plan.name)}"] = lambda formulas=formulas: K.show_steps(formulas)
+    return cases
+
+
+def throughput_cases(rows: int) -> Dict[str, Callable[[], object]]:
+    """Whole-workload cases over ``rows`` problems (timed in us/row)."""
+    columns = make_problems(rows)
+    problems = [
+        dict((name, float(column[i])) for name, column in columns.items() if not np.isnan(column[i]))
+        for i in range(rows)
+    ]
+
+    def scalar():
+        for kwargs in problems:
+            K.calculate1D(**kwargs)
+
+    return dict(
+        scalar=scalar,
+        batch=lambda: K.calculate1D_batch(columns),
+    )
+
+
+def check_parity(rows: int) -> int:
+    """Returns the number of rows whose ``calculate1D_batch`` result differs
+    from ``calculate1D`` (both rounded to the default digits). The knowns
+    get six decimals, so that many values sit on a rounding half.
+    """
+    columns = dict((name, np.round(column, 6)) for name, column in make_problems(rows).items())
+    batch = K.calculate1D_batch(columns)
+    mismatches = 0
+    for i in range(rows):
+        kwargs = dict((name, float(column[i])) for name, column in columns.items() if not np.isnan(column[i]))
+        scalar = K.calculate1D(**kwargs)[0]
+        mismatches += any(
+            scalar[name] != batch[name][i] and not (np.isnan(scalar[name]) and np.isnan(batch[name][i]))
+            for name in scalar
+        )
+    return mismatches
+
+
+def measure(func: Callable[[], object], repeat: int, min_time: float) -> float:
+    """Best-of-``repeat`` seconds per call, each repeat lasting about ``min_time``."""
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time or number >= 10**7:
+            break
+        number *= 10
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(name_filter: str="", rows: int=20000, repeat: int=5, min_time: float=0.05) -> Dict[str, float]:
+    """Runs the suite and returns ``{case: microseconds}``."""
+    results = dict()
+    for name, func in micro_cases().items():
+        if name_filter in name:
+            results[name] = measure(func, repeat, min_time) * 1e6
+    for name, func in throughput_cases(rows).items():
+        name = f"throughput/{name}"
+        if name_filter in name:
+            results[name] = measure(func, repeat, min_time) * 1e6 / rows
+    return results
+
+
+def machine() -> Dict[str, str]:
+    return dict(
+        python=platform.python_version(),
+        numpy=np.__version__,
+        platform=platform.platform(),
+        processor=platform.processor() or platform.machine(),
+    )
+
+
+def save(path: str, results: Dict[str, float], rows: int):
+    data = dict(
+        created=time.strftime("%Y-%m-%dT%H:%M:%S"),
+        machine=machine(),
+        rows=rows,
+        unit="us (per call; per row for throughput/*)",
+        results=results,
+    )
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(baseline: Dict[str, float], results: Dict[str, float], threshold: float) -> Tuple[Dict[str, float], int]:
+    """Returns ``{case: current / baseline}`` and the number of regressions."""
+    ratios = dict()
+    for name, value in results.items():
+        if baseline.get(name):
+            ratios[name] = value / baseline[name]
+    return ratios, sum(ratio > 1.0 + threshold for ratio in ratios.values())
+
+
+def report(results: Dict[str, float], baseline: Dict[str, float], threshold: float):
+    ratios, _ = compare(baseline, results, threshold)
+    print(f"{'case':<36}{'us':>10}{'baseline':>10}{'ratio':>8}")
+    for name, value in results.items():
+        if name in ratios:
+            flag = "  REGRESSION" if ratios[name] > 1.0 + threshold else ""
+            print(f"{name:<36}{value:>10.3f}{baseline[name]:>10.3f}{ratios[name]:>8.2f}{flag}")
+        else:
+            print(f"{name:<36}{value:>10.3f}{'-':>10}{'-':>8}")
+    if "throughput/scalar" in results and "throughput/batch" in results:
+        speedup = results["throughput/scalar"] / results["throughput/batch"]
+        print(f"\nbatch vs scalar: {speedup:.1f}x faster per row")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="save the results as the baseline")
+    parser.add_argument("--check", action="store_true", help="exit 1 if any case regressed")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown (0.2: 20%%)")
+    parser.add_argument("--filter", default="", help="only run cases containing this string")
+    parser.add_argument("--rows", type=int, default=20000, help="problems for the throughput cases")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    baseline = dict()
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+    elif args.check:
+        parser.error(f"no baseline at {args.baseline} (record one with --save)")
+
+    mismatches = check_parity(args.rows)
+    print(f"batch vs scalar rounding: {mismatches} of {args.rows} rows differ ({'ok' if not mismatches else 'FAILED'})\n")
+    results = run(name_filter=args.filter, rows=args.rows, repeat=args.repeat)
+    report(results, baseline, args.threshold)
+    if args.save:
+        save(args.baseline, results, args.rows)
+        print(f"\nbaseline saved to {args.baseline}")
+    if args.check:
+        _, regressions = compare(baseline, results, args.threshold)
+        print(f"\n{regressions} regression(s) beyond {args.threshold:.0%}")
+        return 1 if regressions or mismatches else 0
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
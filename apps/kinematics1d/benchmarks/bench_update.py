@@ -0,0 +1,71 @@
+"""Microbenchmark of ``Kinematics1D.update``: full solve, incremental
+re-solve and cache hit (the app's rerun with unchanged inputs).
+
+Also checks that repeated identical inputs through ``update()`` are served
+by the solve cache, and that the incremental re-solve is faster than the
+full one (exits 1 otherwise).
+
+Run from ``apps/kinematics1d``:
+
+    python benchmarks/bench_update.py [--number 20000]
+
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kinematics as K  # noqa: E402
+
+PARAMS = dict(vi=205, vf=315, t=10.0)
+
+
+def check_cache_hits(repeats: int=3) -> bool:
+    cache = K.SolveCache()
+    k1 = K.Kinematics1D(cache=cache)
+    for _ in range(repeats):
+        update = k1.update(**PARAMS)
+    stats = cache.stats()
+    ok = stats["misses"] == 1 and stats["hits"] == repeats - 1 and update.recomputed == ()
+    print(f"cache after {repeats} identical updates: {stats['hits']} hits, {stats['misses']} misses "
+          f"({'ok' if ok else 'FAILED'})")
+    return ok
+
+
+def main(number: int=20000, repeat: int=5) -> int:
+    ok = check_cache_hits()
+
+    def full():
+        K.Kinematics1D().update(**PARAMS)
+
+    k_inc = K.Kinematics1D()
+    k_inc.update(**PARAMS)
+    times = iter((10.0, 20.0) * (number * repeat))
+
+    def incremental():
+        k_inc.update(t=next(times))
+
+    k_hit = K.Kinematics1D(cache=K.SolveCache())
+    k_hit.update(**PARAMS)
+
+    def cached():
+        k_hit.update(**PARAMS)
+
+    print(f"{'case':<14}{'us/call':>10}")
+    best = dict()
+    for name, func in dict(full=full, incremental=incremental, cache_hit=cached).items():
+        best[name] = min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+        print(f"{name:<14}{best[name]:>10.2f}")
+    faster = best["incremental"] < best["full"]
+    print(f"incremental faster than full: {'ok' if faster else 'FAILED'}")
+    return 0 if ok and faster else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    sys.exit(main(number=args.number, repeat=args.repeat))
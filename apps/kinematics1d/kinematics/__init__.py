@@ -1,7 +1,89 @@
-from .k1d import calculate1D, show_steps, Kinematics1D
+from .k1d import calculate1D, solve1D, show_steps, Kinematics1D, KinematicsResult, SolveUpdate, StepTrace
+from .cache import SolveCache
+from .instrument import collect, SolveStats
+from .plans import get_plan, supported_known_sets
 
 __all__ = [
     "calculate1D",
+    "calculate1D_batch",
+    "calculate1D_branches",
+    "calculate1D_units",
+    "collect",
+    "create_store",
+    "design",
+    "expand_steps",
+    "fit1D",
+    "generate_problems",
+    "get_plan",
+    "grade",
+    "open_store",
+    "propagate",
     "show_steps",
+    "solve1D",
+    "solve_arrow",
+    "solve_quadratic",
+    "solve_to_store",
+    "SolveCache",
+    "SolveStats",
+    "SolveUpdate",
+    "supported_known_sets",
+    "to_recarray",
+    "write_problems",
+    "BranchSolution",
+    "DesignResult",
+    "GradeResult",
     "Kinematics1D",
+    "KinematicsResult",
+    "MotionFit",
+    "MotionFitter",
+    "Normal",
+    "PiecewiseMotion",
+    "StepTrace",
+    "SweepResult",
+    "UncertaintyResult",
+    "Uniform",
 ]
+
+# NumPy-backed names, imported on first access so that ``import kinematics``
+# stays cheap for callers that only need the scalar solver.
+_LAZY = dict(
+    calculate1D_batch=".batch",
+    to_recarray=".batch",
+    expand_steps=".batch",
+    fit1D=".fit",
+    MotionFit=".fit",
+    MotionFitter=".fit",
+    PiecewiseMotion=".segments",
+    SweepResult=".sweep",
+    create_store=".store",
+    open_store=".store",
+    solve_to_store=".store",
+    Normal=".uncertainty",
+    Uniform=".uncertainty",
+    UncertaintyResult=".uncertainty",
+    propagate=".uncertainty",
+    BranchSolution=".quadratic",
+    calculate1D_branches=".quadratic",
+    solve_quadratic=".quadratic",
+    calculate1D_units=".units",
+    solve_arrow=".arrow",
+    design=".inverse",
+    DesignResult=".inverse",
+    generate_problems=".problems",
+    write_problems=".problems",
+    grade=".grading",
+    GradeResult=".grading",
+)
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,101 @@
+"""Apache Arrow input/output for the batch solver.
+
+Float64 columns are viewed as NumPy arrays straight from their Arrow data
+buffers (no Python objects, no copy when they have no nulls); nulls are
+unknowns, read from the validity bitmap. The results are handed back to
+Arrow the same way: each result column becomes the data buffer of an Arrow
+array, with a validity bitmap built from its NaNs.
+"""
+import numpy as np
+from typing import Dict, Optional
+
+from .batch import calculate1D_batch
+from .plans import PARAMS
+
+
+def _import_arrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("pyarrow is required for Arrow input/output (pip install pyarrow).") from e
+    return pa
+
+
+def arrow_to_numpy(array) -> np.ndarray:
+    """Returns an Arrow array as float64 NumPy, nulls as NaN.
+
+    A float64 array without nulls is returned as a read-only view of its data
+    buffer (zero-copy); with nulls, the values are masked through the
+    validity bitmap (one pass, no Python objects). Other numeric types are
+    cast to float64 first.
+    """
+    pa = _import_arrow()
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if array.type != pa.float64():
+        array = array.cast(pa.float64())
+    validity, data = array.buffers()
+    n, offset = len(array), array.offset
+    if data is None:  # e.g. an all-null array with no data buffer
+        return np.full(n, np.nan)
+    values = np.frombuffer(data, dtype=np.float64, count=n, offset=offset * 8)
+    if array.null_count == 0:
+        return values
+    valid = np.unpackbits(np.frombuffer(validity, dtype=np.uint8), count=offset + n, bitorder="little")[offset:]
+    return np.where(valid.view(bool), values, np.nan)
+
+
+def numpy_to_arrow(column: np.ndarray):
+    """Returns a float64 NumPy column as an Arrow array backed by the same
+    memory (zero-copy), with NaN marked null through a validity bitmap.
+    """
+    pa = _import_arrow()
+    column = np.ascontiguousarray(column, dtype=np.float64)
+    valid = ~np.isnan(column)
+    n, nulls = len(column), len(column) - int(np.count_nonzero(valid))
+    bitmap = pa.py_buffer(np.packbits(valid, bitorder="little")) if nulls else None
+    return pa.Array.from_buffers(pa.float64(), n, [bitmap, pa.py_buffer(column)], null_count=nulls)
+
+
+def _solve_batch(batch, ndigits: Optional[int], errors: str):
+    pa = _import_arrow()
+    columns: Dict[str, np.ndarray] = dict(
+        (name, arrow_to_numpy(batch.column(name))) for name in PARAMS if name in batch.schema.names
+    )
+    if batch.num_rows == 0:
+        result = dict((name, np.empty(0)) for name in PARAMS)
+    else:
+        result = calculate1D_batch(columns, ndigits=ndigits, errors=errors)
+    names = list(PARAMS) + [name for name in batch.schema.names if name not in PARAMS]
+    arrays = [numpy_to_arrow(np.ravel(result[name])) for name in PARAMS]
+    arrays += [batch.column(name) for name in names[len(PARAMS):]]
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def solve_arrow(data, ndigits: Optional[int]=5, errors: str="raise"):
+    """Solves a ``pyarrow.Table`` or ``RecordBatch`` of problems.
+
+    Parameters:
+        data: the problems, with any of the (numeric) columns ``Dx, a, v_avg,
+            vi, vf, t``; nulls are unknowns, missing columns are unknown.
+        ndigits: digits to round the results to (``None`` to skip rounding).
+        errors: as in :func:`kinematics.batch.calculate1D_batch`; with
+            ``"coerce"``, the unknowns of unsolvable rows are null.
+
+    Returns the same kind of object: the six parameter columns (float64),
+    followed by the other input columns, passed through. A table is solved
+    record batch by record batch, so its chunks are never concatenated.
+
+    Usage:
+
+        table = pa.table(dict(vi=[205.0, 0.0], vf=[315.0, None], t=[10.0, 2.0], a=[None, 5.0]))
+        solve_arrow(table).column("a")      # [11, 5]
+
+    """
+    pa = _import_arrow()
+    if isinstance(data, pa.RecordBatch):
+        return _solve_batch(data, ndigits, errors)
+    batches = [_solve_batch(batch, ndigits, errors) for batch in data.to_batches()]
+    if not batches:
+        batches = [_solve_batch(pa.RecordBatch.from_pylist([], schema=data.schema), ndigits, errors)]
+    return pa.Table.from_batches(batches)
@@ -0,0 +1,266 @@
+import math
+import numpy as np
+from functools import partial
+from typing import Any, Mapping, Optional
+
+from .plans import (
+    DEPENDENT_MASKS, NO_PLAN, PARAMS, PLAN_IDS, PLANS, SOLVE_PLANS, _final_velocity_root, _initial_velocity_root,
+)
+
+# Record layout of a batch result (one float64 field per parameter).
+RESULT_DTYPE = np.dtype([(name, np.float64) for name in PARAMS])
+
+
+# Whole-array forms of the plan equations whose root takes a sign: the same
+# functions, with NumPy's square root.
+_VECTORIZED = dict(
+    vf_from_vi_a_Dx=partial(_final_velocity_root, sqrt=np.sqrt),
+    vi_from_vf_a_Dx=partial(_initial_velocity_root, sqrt=np.sqrt),
+)
+
+# Whether each known-mask (0 to 63) has a solve plan, and its number of knowns.
+SOLVABLE = np.array([mask in SOLVE_PLANS for mask in range(1 << len(PARAMS))])
+KNOWN_COUNT = np.array([bin(mask).count("1") for mask in range(1 << len(PARAMS))])
+# Whether each known-mask is a dependent (underdetermined) triple.
+DEPENDENT = np.array([mask in DEPENDENT_MASKS for mask in range(1 << len(PARAMS))])
+
+# Plan id (``PLAN_IDS``, or ``NO_PLAN``) of each known-mask.
+PLAN_ID = np.array(
+    [PLAN_IDS[SOLVE_PLANS[mask].mask] if mask in SOLVE_PLANS else NO_PLAN for mask in range(1 << len(PARAMS))],
+    dtype=np.uint8,
+)
+# Step formula ids (``FORMULAS``) of each plan id, padded with ``NO_PLAN``;
+# the last row is the (empty) trace of ``NO_PLAN``.
+STEP_IDS = np.full((len(PLANS) + 1, max(len(plan.equations) for plan in PLANS)), NO_PLAN, dtype=np.uint8)
+for _i, _plan in enumerate(PLANS):
+    STEP_IDS[_i, :len(_plan.formula_ids)] = _plan.formula_ids
+del _i, _plan
+
+# ``(target, func, inputs)`` steps of every plan, keyed by the plan's mask.
+_BATCH_PLANS = dict(
+    (plan.mask, tuple((eq.target, _VECTORIZED.get(eq.name, eq.func), eq.inputs) for eq in plan.equations))
+    for plan in PLANS
+)
+
+
+def round_column(values: Any, ndigits: int) -> np.ndarray:
+    """Rounds a float column exactly like the built-in ``round`` (that is,
+    like :func:`kinematics.k1d.prepare_result`), so that batch and scalar
+    results agree to the last digit.
+
+    ``np.round`` scales by ``10**ndigits`` before rounding; the scaled
+    product is itself rounded, which flips the result of values close to a
+    half (about 0.3% of them at 5 digits). Those values, and the ones too
+    large for the scaled product to be exact, are rounded with ``round``;
+    NaN and infinities are kept.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    shape, values = values.shape, values.reshape(-1)
+    if ndigits < 0:
+        return np.array([round(v, ndigits) if math.isfinite(v) else v for v in values.tolist()]).reshape(shape)
+    scale = 10.0 ** ndigits
+    with np.errstate(all="ignore"):
+        scaled = values * scale
+        result = np.rint(scaled)
+        # Distance of the scaled product to the half, against a few ulps.
+        distance = np.abs(scaled - result)
+        distance -= 0.5
+        np.abs(distance, out=distance)
+        np.abs(scaled, out=scaled)
+        scaled *= 2.0 ** -50
+        fallback = distance <= scaled
+        fallback |= np.abs(values) >= 2.0 ** 49 / scale
+        result /= scale
+    if fallback.any():
+        result[fallback] = [round(v, ndigits) if math.isfinite(v) else v for v in values[fallback].tolist()]
+    return result.reshape(shape)
+
+
+def _is_dataframe(data: Any) -> bool:
+    return type(data).__module__.startswith("pandas") and hasattr(data, "columns")
+
+
+def _is_arrow(data: Any) -> bool:
+    return type(data).__module__.startswith("pyarrow") and hasattr(data, "schema")
+
+
+def known_pattern(columns: Mapping[str, np.ndarray]) -> np.ndarray:
+    """Returns the known-parameter bitmask of each row (bit ``i`` is set
+    when ``PARAMS[i]`` is known, i.e. not NaN). Missing columns are unknown.
+    """
+    pattern = None
+    for i, name in enumerate(PARAMS):
+        if name not in columns:
+            continue
+        bit = (~np.isnan(np.asarray(columns[name], dtype=float))).astype(np.uint8) << i
+        pattern = bit if pattern is None else (pattern | bit)
+    if pattern is None:
+        raise ValueError(f"None of the columns {PARAMS} were given.")
+    return pattern
+
+
+def solve_columns(columns: Mapping[str, np.ndarray], pattern: Optional[np.ndarray]=None):
+    """Solves flat float columns in place, group by group of known-pattern.
+
+    Rows without a solve plan are left untouched. Returns the pattern.
+    """
+    if pattern is None:
+        pattern = known_pattern(columns)
+    with np.errstate(all="ignore"):
+        for mask in np.unique(pattern):
+            plan = SOLVE_PLANS.get(int(mask))
+            if plan is None:
+                continue
+            rows = np.flatnonzero(pattern == mask)
+            p = dict((k, col[rows]) for k, col in columns.items())
+            for target, func, inputs in _BATCH_PLANS[plan.mask]:
+                p[target] = func(*(p[k] for k in inputs))
+                columns[target][rows] = p[target]
+    return pattern
+
+
+def plan_ids(pattern: np.ndarray) -> np.ndarray:
+    """Returns the ``uint8`` plan id of each known-pattern: one byte per row
+    stands for its whole step trace (``NO_PLAN`` for unsolvable rows).
+    """
+    return PLAN_ID[pattern]
+
+
+def step_ids(plans: np.ndarray) -> np.ndarray:
+    """Returns the step formula ids (``uint8``, shape ``plans.shape + (3,)``)
+    of each plan id; unused slots hold ``NO_PLAN``.
+    """
+    return STEP_IDS[np.where(np.asarray(plans) == NO_PLAN, len(PLANS), plans)]
+
+
+def expand_steps(plans: Any) -> list:
+    """Expands plan ids to the LaTeX step formulas of each row, on demand
+    (the formulas are shared ``StepTrace`` objects, one per plan; ``None``
+    for rows without a plan).
+
+    Usage:
+
+        result, plans = calculate1D_batch(vi=[205, 0], vf=[315, 10], t=[10.0, 2.0], return_steps=True)
+        expand_steps(plans[:1])[0].formulas     # the LaTeX of row 0
+
+    """
+    from .k1d import PLAN_TRACES
+    traces = [PLAN_TRACES[plan.mask] for plan in PLANS] + [None] * (256 - len(PLANS))
+    return [traces[i] for i in np.ravel(plans).tolist()]
+
+
+def to_recarray(columns: Mapping[str, Any]) -> np.recarray:
+    """Packs columnar results into a structured ``np.recarray`` (``RESULT_DTYPE``)."""
+    shape = np.shape(columns[PARAMS[0]])
+    records = np.empty(shape, dtype=RESULT_DTYPE)
+    for name in PARAMS:
+        records[name] = columns[name]
+    return records.view(np.recarray)
+
+
+def broadcast_columns(data: Optional[Mapping[str, Any]]=None, **kwargs):
+    """Returns the inputs (``data`` columns, overridden by ``kwargs``) as flat,
+    writable float columns for every name in ``PARAMS`` (NaN when missing),
+    and their broadcast shape.
+    """
+    source = dict()
+    if data is not None:
+        source.update((k, data[k]) for k in PARAMS if k in data)
+    source.update((k, v) for k, v in kwargs.items() if v is not None)
+    unexpected = set(source) - set(PARAMS)
+    if unexpected:
+        raise TypeError(f"Unexpected parameters: {sorted(unexpected)}.")
+
+    arrays = [np.asarray(source[k], dtype=float) if k in source else np.array(np.nan) for k in PARAMS]
+    shape = np.broadcast_shapes(*(arr.shape for arr in arrays))
+    columns = dict((k, np.array(np.broadcast_to(arr, shape), dtype=float).ravel()) for k, arr in zip(PARAMS, arrays))
+    return columns, shape
+
+
+def calculate1D_batch(data: Optional[Mapping[str, Any]]=None, ndigits: Optional[int]=5, errors: str="raise", as_recarray: bool=False, workers: int=1, out: Optional[np.ndarray]=None, return_steps: bool=False, **kwargs):
+    """Vectorized :func:`kinematics.k1d.calculate1D` over whole arrays.
+
+    Parameters:
+        data: a mapping (``dict``, ``pandas.DataFrame``) with any of the
+            columns ``Dx, a, v_avg, vi, vf, t``. Unknown values are NaN (or
+            ``None``), missing columns are treated as unknown. A
+            ``pyarrow.Table``/``RecordBatch`` (nulls are unknowns) is solved
+            by :func:`kinematics.arrow.solve_arrow` and returned as Arrow.
+        ndigits: digits to round the results to (``None`` to skip rounding),
+            exactly as ``calculate1D`` does (see :func:`round_column`).
+        errors: ``"raise"`` to raise ``ValueError``/``NotImplementedError``
+            (as ``calculate1D`` does) when any row cannot be solved, or
+            ``"coerce"`` to leave the unknowns of such rows as NaN.
+        as_recarray: return a structured ``np.recarray`` (``RESULT_DTYPE``)
+            instead of columns.
+        workers: number of worker processes; with more than one, the rows are
+            solved in chunks by a process pool over shared memory (see
+            :func:`kinematics.parallel.solve_parallel`).
+        out: a preallocated ``RESULT_DTYPE`` array of the (broadcast) input
+            shape, e.g. a memory-mapped store from
+            :func:`kinematics.store.create_store`; the results are written
+            into it and it is returned.
+        return_steps: also return the step traces, as a ``uint8`` array of
+            plan ids of the input shape (see :func:`expand_steps` and
+            :func:`step_ids`): ``(result, plans)``.
+        **kwargs: columns given as keyword arguments (they override ``data``).
+
+    Rows are grouped by their known-parameter pattern and each group is
+    evaluated with the whole-array form of the solve plan that
+    ``calculate1D`` would pick for it. Inputs are broadcast against each other,
+    so scalars may be mixed with arrays.
+
+    Usage:
+
+        result = calculate1D_batch(vi=[205, 0], vf=[315, 10], t=[10.0, 2.0])
+        result["a"]  # array([11., 5.])
+
+    Returns a ``dict`` of arrays keyed by parameter name (a ``DataFrame`` with
+    the same index when ``data`` is a ``DataFrame``). Pass ``ndigits=None`` to
+    keep full precision and round at display time.
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce', got {errors!r}.")
+    if _is_arrow(data):
+        if kwargs or as_recarray or workers > 1 or out is not None or return_steps:
+            raise TypeError("Arrow input only supports the ndigits and errors options.")
+        from .arrow import solve_arrow
+        return solve_arrow(data, ndigits=ndigits, errors=errors)
+    columns, shape = broadcast_columns(data, **kwargs)
+
+    pattern = known_pattern(columns)
+    if workers > 1:
+        from .parallel import solve_parallel
+        columns = solve_parallel(columns, workers=workers)
+    else:
+        solve_columns(columns, pattern)
+    unsolved = ~SOLVABLE[pattern]
+
+    if errors == "raise" and unsolved.any():
+        too_few = KNOWN_COUNT[pattern[unsolved]] < 3
+        if too_few.any():
+            raise ValueError(f"At least three appropriate parameters are necessary ({int(too_few.sum())} rows).")
+        dependent = DEPENDENT[pattern[unsolved]]
+        if dependent.any():
+            raise ValueError(f"The known parameters are not independent ({int(dependent.sum())} rows).")
+        raise NotImplementedError(f"No implementation exists for {int(unsolved.sum())} rows.")
+
+    if ndigits is not None:
+        columns = dict((k, round_column(col, ndigits)) for k, col in columns.items())
+    columns = dict((k, col.reshape(shape)) for k, col in columns.items())
+    if out is not None:
+        if out.dtype != RESULT_DTYPE or out.shape != shape:
+            raise ValueError(f"out must be a RESULT_DTYPE array of shape {shape}, got {out.dtype} {out.shape}.")
+        for name in PARAMS:
+            out[name] = columns[name]
+        result = out
+    elif as_recarray:
+        result = to_recarray(columns)
+    elif _is_dataframe(data):
+        import pandas as pd
+        result = pd.DataFrame(columns, index=data.index)
+    else:
+        result = columns
+    if return_steps:
+        return result, plan_ids(pattern).reshape(shape)
+    return result
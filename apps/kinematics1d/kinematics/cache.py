@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from .plans import PARAMS
+
+
+class SolveCache(object):
+    """Bounded LRU cache of solved problems, with hit/miss/eviction counters.
+
+    Entries are keyed on the normalized tuple of known parameters (in
+    ``PARAMS`` order, ``None`` for the unknowns) and ``ndigits``. The cache is
+    opt-in: pass it to :func:`kinematics.k1d.calculate1D` or
+    :class:`kinematics.k1d.Kinematics1D`.
+
+    Usage:
+
+        ```python
+        cache = SolveCache(maxsize=128)
+        result, steps = calculate1D(vi=205, vf=315, t=10.0, cache=cache)
+        cache.stats()  # {'hits': 0, 'misses': 1, 'evictions': 0, ...}
+        ```
+    """
+
+    def __init__(self, maxsize: int=1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(params: Dict[str, Optional[float]], ndigits: int) -> Tuple[Hashable, ...]:
+        """Returns the cache key of a problem (ints and floats of equal value share a key)."""
+        return tuple(None if params[k] is None else float(params[k]) for k in PARAMS) + (ndigits,)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drops all entries and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+            hit_rate=round(self.hits / lookups, 4) if lookups else 0.0,
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"SolveCache({self.stats()})"
@@ -0,0 +1,137 @@
+"""Command line interface: ``python -m kinematics <command>``."""
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+
+def _print_progress(stats):
+    print(
+        f"\r{stats['rows']:,} rows ({stats['rejected']:,} rejected), "
+        f"{stats['rows_per_sec']:,.0f} rows/s",
+        end="", file=sys.stderr, flush=True,
+    )
+
+
+def _units(spec: str):
+    from .units import parse_units, scale_factors
+
+    try:
+        units = parse_units(spec)
+        scale_factors(units)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return units
+
+
+def _solve(args) -> int:
+    from .stream import default_rejects_path, solve_file
+
+    rejects = args.rejects or default_rejects_path(args.output)
+    stats = solve_file(
+        args.input,
+        args.output,
+        rejects=rejects,
+        chunk_size=args.chunk_size,
+        ndigits=None if args.ndigits < 0 else args.ndigits,
+        progress=None if args.quiet else _print_progress,
+        units=args.units,
+        output_units=args.output_units,
+    )
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(
+        f"Solved {stats['solved']:,} of {stats['rows']:,} rows in {stats['seconds']:.2f} s "
+        f"({stats['rows_per_sec']:,.0f} rows/s); {stats['rejected']:,} rejected -> {rejects}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _serve(args) -> int:
+    from .service import serve
+
+    print(
+        f"Serving on http://{args.host}:{args.port} (POST /solve, GET /metrics; "
+        f"max batch {args.max_batch_size}, max delay {args.max_delay_ms} ms)",
+        file=sys.stderr,
+    )
+    serve(
+        host=args.host,
+        port=args.port,
+        max_batch_size=args.max_batch_size,
+        max_delay=args.max_delay_ms / 1e3,
+        ndigits=None if args.ndigits < 0 else args.ndigits,
+    )
+    return 0
+
+
+def _generate(args) -> int:
+    from .problems import write_problems
+
+    start = time.perf_counter()
+    rows = write_problems(args.output, args.rows, seed=args.seed, chunk_size=args.chunk_size, ndigits=None if args.ndigits < 0 else args.ndigits)
+    seconds = time.perf_counter() - start
+    print(f"Wrote {rows:,} problems to {args.output} in {seconds:.2f} s ({rows / seconds if seconds else 0:,.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m kinematics", description="Kinematics 1D solver.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve = commands.add_parser(
+        "solve",
+        help="solve a CSV/Parquet file of problems, streaming it in chunks",
+        description=(
+            "Solve a CSV or Parquet file of problems (columns Dx, a, v_avg, vi, vf, t; "
+            "empty cells/nulls are unknowns) chunk by chunk, with constant memory. "
+            "Rows that cannot be solved go to the reject file."
+        ),
+    )
+    solve.add_argument("input", help="input file (.csv, .parquet)")
+    solve.add_argument("output", help="output file (.csv, .parquet)")
+    solve.add_argument("--rejects", help="reject file (default: <output>.rejects.<ext>)")
+    solve.add_argument("--chunk-size", type=int, default=100000, help="rows per chunk (default: %(default)s)")
+    solve.add_argument("--ndigits", type=int, default=5, help="digits to round to, -1 to skip rounding (default: %(default)s)")
+    solve.add_argument("--units", type=_units, help="units of the input columns, e.g. 'vi=km/h,Dx=ft,t=min' or a unit system (default: SI)")
+    solve.add_argument("--output-units", type=_units, help="units of the output columns, as --units (default: SI)")
+    solve.add_argument("--quiet", action="store_true", help="do not report progress")
+    solve.set_defaults(func=_solve)
+
+    serve = commands.add_parser(
+        "serve",
+        help="run a local HTTP/JSON solve service with micro-batching",
+        description=(
+            "Serve POST /solve (one JSON problem or a list of them) and GET /metrics. "
+            "Concurrent requests are coalesced into vectorized batches."
+        ),
+    )
+    serve.add_argument("--host", default="127.0.0.1", help="address to bind (default: %(default)s)")
+    serve.add_argument("--port", type=int, default=8000, help="port to bind (default: %(default)s)")
+    serve.add_argument("--max-batch-size", type=int, default=1024, help="problems per batch at most (default: %(default)s)")
+    serve.add_argument("--max-delay-ms", type=float, default=2.0, help="how long a problem waits for a batch to fill (default: %(default)s)")
+    serve.add_argument("--ndigits", type=int, default=5, help="digits to round to, -1 to skip rounding (default: %(default)s)")
+    serve.set_defaults(func=_serve)
+
+    generate = commands.add_parser(
+        "generate",
+        help="generate a seeded bank of practice problems with their answers",
+        description=(
+            "Write random, consistent problems (three shown knowns per row, the other "
+            "cells empty) with their <name>_answer columns to a CSV or Parquet file, "
+            "chunk by chunk. The same seed and chunk size give the same problems."
+        ),
+    )
+    generate.add_argument("output", help="output file (.csv, .parquet)")
+    generate.add_argument("--rows", type=int, default=1000, help="problems to generate (default: %(default)s)")
+    generate.add_argument("--seed", type=int, help="random seed (default: fresh entropy)")
+    generate.add_argument("--chunk-size", type=int, default=100000, help="rows per chunk (default: %(default)s)")
+    generate.add_argument("--ndigits", type=int, default=2, help="digits of the shown knowns, -1 to skip rounding (default: %(default)s)")
+    generate.set_defaults(func=_generate)
+    return parser
+
+
+def main(argv: Optional[List[str]]=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,175 @@
+import math
+import numpy as np
+from typing import Any, Dict, NamedTuple, Optional
+
+# Largest condition number accepted for the normal equations (with their
+# columns scaled to unit diagonal, so that the check does not depend on units).
+MAX_CONDITION = 1e12
+# Smallest span of the sample times relative to their magnitude: below it, the
+# times relative to the first sample keep less than half of the float digits.
+MIN_RELATIVE_SPAN = 1e-8
+
+
+class MotionFit(NamedTuple):
+    """Least-squares fit of ``x(t) = x0 + vi (t - t0) + a (t - t0)^2 / 2``.
+
+    ``vi``/``vf`` are the fitted velocities at the first/last sample time,
+    ``t`` the covered duration, ``Dx``/``v_avg`` the fitted displacement and
+    average velocity over it. ``rss``, ``rmse``, ``sigma`` (residual standard
+    error, ``n - 3`` degrees of freedom) and ``r_squared`` describe the residuals.
+    """
+    Dx: float
+    a: float
+    v_avg: float
+    vi: float
+    vf: float
+    t: float
+    x0: float
+    t0: float
+    n: int
+    rss: float
+    rmse: float
+    sigma: float
+    r_squared: float
+
+    def as_dict(self) -> Dict[str, float]:
+        """Returns the kinematics parameters (``Dx, a, v_avg, vi, vf, t``)."""
+        return dict(Dx=self.Dx, a=self.a, v_avg=self.v_avg, vi=self.vi, vf=self.vf, t=self.t)
+
+
+class MotionFitter(object):
+    """One-pass (streaming) least-squares estimator of ``vi`` and ``a`` from
+    sampled positions ``(t, x)``.
+
+    Only running power sums are kept (O(1) memory), so a long stream can be fed
+    chunk by chunk with :meth:`update`; each chunk is reduced with whole-array
+    sums. Times and positions are taken relative to the first sample to keep
+    the sums well conditioned.
+
+    Usage:
+
+        fitter = MotionFitter()
+        for t_chunk, x_chunk in stream:
+            fitter.update(t_chunk, x_chunk)
+        fit = fitter.result()
+        fit.vi, fit.a, fit.rmse
+
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.t_ref: Optional[float] = None
+        self.x_ref: Optional[float] = None
+        self.t_min = math.inf
+        self.t_max = -math.inf
+        # sums of tau^k (k = 1..4), of tau^k * x (k = 0..2) and of x^2
+        self._tau = np.zeros(5)
+        self._tau_x = np.zeros(3)
+        self._xx = 0.0
+
+    def update(self, t: Any, x: Any) -> "MotionFitter":
+        """Adds a chunk of samples (array-likes of equal length)."""
+        t = np.asarray(t, dtype=np.float64).ravel()
+        x = np.asarray(x, dtype=np.float64).ravel()
+        if t.shape != x.shape:
+            raise ValueError(f"t and x must have the same length, got {len(t)} and {len(x)}.")
+        if not len(t):
+            return self
+        if self.t_ref is None:
+            self.t_ref, self.x_ref = float(t[0]), float(x[0])
+        tau = t - self.t_ref
+        dx = x - self.x_ref
+        tau2 = tau * tau
+        self._tau += (len(t), tau.sum(), tau2.sum(), (tau2 * tau).sum(), (tau2 * tau2).sum())
+        self._tau_x += (dx.sum(), (tau * dx).sum(), (tau2 * dx).sum())
+        self._xx += float(dx @ dx)
+        self.n += len(t)
+        self.t_min = min(self.t_min, float(t.min()))
+        self.t_max = max(self.t_max, float(t.max()))
+        return self
+
+    def result(self) -> MotionFit:
+        """Solves the normal equations for ``(x0, vi, a)`` and derives the rest.
+
+        Raises ``ValueError`` when the fit is ill-posed: fewer than three
+        samples, sample times spanning less than ``MIN_RELATIVE_SPAN`` of
+        their magnitude, or normal equations whose (scaled) condition number
+        exceeds ``MAX_CONDITION`` (e.g. samples at only two distinct times,
+        give or take rounding).
+        """
+        if self.n < 3:
+            raise ValueError("At least three samples are necessary to fit vi and a.")
+        span = self.t_max - self.t_min
+        if span <= MIN_RELATIVE_SPAN * max(abs(self.t_min), abs(self.t_max)):
+            raise ValueError(
+                f"The sample times are too close together to fit vi and a "
+                f"(span {span:g} around t = {self.t_min:g})."
+            )
+        s0, s1, s2, s3, s4 = self._tau.tolist()
+        sx, stx, st2x = self._tau_x.tolist()
+        # columns of the design matrix: 1, tau, tau^2 / 2
+        xtx = np.array([
+            [s0, s1, s2 / 2],
+            [s1, s2, s3 / 2],
+            [s2 / 2, s3 / 2, s4 / 4],
+        ])
+        xty = np.array([sx, stx, st2x / 2])
+        scale = 1.0 / np.sqrt(np.diag(xtx))
+        condition = np.linalg.cond(xtx * scale[:, None] * scale[None, :])
+        if not condition < MAX_CONDITION:
+            raise ValueError(
+                f"At least three distinct sample times are necessary to fit vi and a "
+                f"(the normal equations are near-singular, condition number {condition:.3g})."
+            )
+        try:
+            beta = np.linalg.solve(xtx, xty)
+        except np.linalg.LinAlgError as e:
+            raise ValueError("At least three distinct sample times are necessary to fit vi and a.") from e
+        x0, v_ref, a = (float(b) for b in beta)
+
+        rss = max(self._xx - float(beta @ xty), 0.0)
+        tss = self._xx - sx * sx / s0
+        tau_start, tau_end = self.t_min - self.t_ref, self.t_max - self.t_ref
+        vi = v_ref + a * tau_start
+        vf = v_ref + a * tau_end
+        t = tau_end - tau_start
+        Dx = vi * t + 0.5 * a * t * t
+        return MotionFit(
+            Dx=Dx,
+            a=a,
+            v_avg=Dx / t if t else math.nan,
+            vi=vi,
+            vf=vf,
+            t=t,
+            x0=self.x_ref + x0 + v_ref * tau_start + 0.5 * a * tau_start**2,
+            t0=self.t_min,
+            n=self.n,
+            rss=rss,
+            rmse=math.sqrt(rss / self.n),
+            sigma=math.sqrt(rss / (self.n - 3)) if self.n > 3 else math.nan,
+            r_squared=1.0 - rss / tss if tss > 0 else math.nan,
+        )
+
+
+def fit1D(t: Any, x: Any, chunk_size: Optional[int]=None) -> MotionFit:
+    """Estimates ``vi`` and ``a`` (and ``vf``, ``v_avg``, ``Dx``, ``t``) from
+    noisy position samples ``x`` at times ``t``, by linear least squares.
+
+    Parameters:
+        t: sample times (units: s).
+        x: sampled positions (units: m).
+        chunk_size: reduce the samples this many at a time (``None``: all at once).
+
+    Usage:
+
+        fit = fit1D(t, x)
+        Kinematics1D(**fit.as_dict())
+
+    """
+    fitter = MotionFitter()
+    t = np.asarray(t, dtype=np.float64).ravel()
+    x = np.asarray(x, dtype=np.float64).ravel()
+    step = chunk_size or max(len(t), 1)
+    for start in range(0, len(t), step):
+        fitter.update(t[start:start + step], x[start:start + step])
+    return fitter.result()
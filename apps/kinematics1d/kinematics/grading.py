@@ -0,0 +1,152 @@
+import numpy as np
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+
+from .batch import _is_arrow, calculate1D_batch
+from .plans import PARAMS
+
+ANSWER_SUFFIX = "_answer"
+
+
+class GradeResult(NamedTuple):
+    """Per-row grading of submitted answers (arrays of the input length).
+
+    ``expected`` holds the solution of each row's given knowns, ``error`` the
+    signed error ``submitted - expected`` of each graded answer (NaN
+    elsewhere), ``graded`` marks the answers graded (a hidden parameter with
+    a submission) and ``correct`` those within tolerance. ``score`` is the
+    fraction of correct answers of each row, ``all_correct`` whether every
+    graded answer of the row is correct, ``solvable`` whether its givens
+    have a finite solution. ``unique`` is the number of distinct problems
+    solved.
+    """
+    expected: Dict[str, np.ndarray]
+    error: Dict[str, np.ndarray]
+    graded: Dict[str, np.ndarray]
+    correct: Dict[str, np.ndarray]
+    score: np.ndarray
+    all_correct: np.ndarray
+    solvable: np.ndarray
+    unique: int
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the overall counts: rows, distinct problems, fully correct
+        rows, and per parameter the answers graded and correct.
+        """
+        return dict(
+            rows=len(self.score),
+            unique=self.unique,
+            unsolvable=int((~self.solvable).sum()),
+            all_correct=int(self.all_correct.sum()),
+            mean_score=float(np.nanmean(self.score)) if np.isfinite(self.score).any() else float("nan"),
+            graded=dict((name, int(mask.sum())) for name, mask in self.graded.items()),
+            correct=dict((name, int(mask.sum())) for name, mask in self.correct.items()),
+        )
+
+
+def _column(data: Any, name: str) -> Optional[np.ndarray]:
+    if _is_arrow(data):
+        if name not in data.schema.names:
+            return None
+        from .arrow import arrow_to_numpy
+        return arrow_to_numpy(data.column(name))
+    if name not in data or data[name] is None:
+        return None
+    return np.asarray(data[name], dtype=np.float64)
+
+
+def unique_problems(given: Mapping[str, np.ndarray]):
+    """Deduplicates rows of given knowns. Returns the distinct problems (as
+    columns) and, for every row, the index of its problem.
+
+    Rows are compared by their bytes (NaN and -0.0 made canonical first), so
+    the dedup is one ``np.unique`` over fixed-size records.
+    """
+    matrix = np.column_stack([given[name] for name in PARAMS])
+    matrix = np.where(np.isnan(matrix), np.nan, matrix + 0.0)
+    records = np.ascontiguousarray(matrix).view(np.dtype((np.void, matrix.dtype.itemsize * len(PARAMS)))).ravel()
+    _, first, inverse = np.unique(records, return_index=True, return_inverse=True)
+    problems = matrix[first]
+    return dict((name, problems[:, i]) for i, name in enumerate(PARAMS)), inverse.ravel()
+
+
+def grade(
+        data: Any,
+        submitted: Optional[Any]=None,
+        atol: float=1e-2,
+        rtol: float=1e-2,
+    ) -> GradeResult:
+    """Grades submitted answers against the solver, in bulk.
+
+    Every distinct set of given knowns is solved once (see
+    :func:`unique_problems`), in one vectorized
+    :func:`kinematics.batch.calculate1D_batch` call; the answers are then
+    compared all at once: an answer is correct when
+    ``|submitted - expected| <= atol + rtol * |expected|``.
+
+    Parameters:
+        data: the given knowns, columns ``Dx, a, v_avg, vi, vf, t`` (NaN,
+            null or missing for the hidden ones), as a ``dict``,
+            ``DataFrame`` or Arrow table.
+        submitted: the submitted answers, same column names (NaN where not
+            answered). By default, the ``<name>_answer`` columns of ``data``
+            (the layout of :func:`kinematics.problems.write_problems`).
+        atol, rtol: absolute and relative tolerances.
+
+    Only hidden parameters with a submission are graded; rows whose givens
+    have no finite solution grade as incorrect. Raises ``ValueError`` if a
+    column of answers does not have one entry per problem.
+
+    Usage:
+
+        res = grade(dict(vi=[205, 205], vf=[315, 315], t=[10, 10]), dict(a=[11.0, 12.0]))
+        res.correct["a"], res.error["a"]    # [True, False], [0., 1.]
+
+    """
+    given = dict()
+    for name in PARAMS:
+        column = _column(data, name)
+        if column is not None:
+            given[name] = column
+    if not given:
+        raise ValueError(f"None of the columns {PARAMS} were given.")
+    n = len(next(iter(given.values())))
+    given = dict((name, given[name] if name in given else np.full(n, np.nan)) for name in PARAMS)
+    if submitted is None:
+        answers = dict((name, _column(data, name + ANSWER_SUFFIX)) for name in PARAMS)
+    else:
+        answers = dict((name, _column(submitted, name)) for name in PARAMS)
+    answers = dict((name, column) for name, column in answers.items() if column is not None)
+    if not answers:
+        raise ValueError("No submitted answers to grade.")
+    for name, column in answers.items():
+        if column.shape != (n,):
+            raise ValueError(f"{column.size} submitted answers for {name}, but {n} problems.")
+
+    problems, inverse = unique_problems(given)
+    solved = calculate1D_batch(problems, ndigits=None, errors="coerce")
+    expected = dict((name, np.asarray(solved[name])[inverse]) for name in PARAMS)
+    solvable = np.logical_and.reduce([np.isfinite(expected[name]) for name in PARAMS])
+
+    error, graded, correct = dict(), dict(), dict()
+    n_graded = np.zeros(n, dtype=np.int64)
+    n_correct = np.zeros(n, dtype=np.int64)
+    for name, answer in answers.items():
+        graded[name] = np.isnan(given[name]) & ~np.isnan(answer)
+        with np.errstate(invalid="ignore"):
+            diff = answer - expected[name]
+            correct[name] = graded[name] & solvable & (np.abs(diff) <= atol + rtol * np.abs(expected[name]))
+        error[name] = np.where(graded[name], diff, np.nan)
+        n_graded += graded[name]
+        n_correct += correct[name]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        score = np.where(n_graded > 0, n_correct / n_graded, np.nan)
+    return GradeResult(
+        expected=expected,
+        error=error,
+        graded=graded,
+        correct=correct,
+        score=score,
+        all_correct=(n_graded > 0) & (n_correct == n_graded),
+        solvable=solvable,
+        unique=len(problems[PARAMS[0]]),
+    )
@@ -0,0 +1,103 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Dict, Iterator, Optional
+
+
+class SolveStats(object):
+    """Statistics collected while solving inside :func:`collect`.
+
+    - ``solves``: number of plans evaluated (cache hits are not evaluated).
+    - ``plans``: how often each solve plan was chosen.
+    - ``calls`` / ``seconds``: per equation node (e.g. ``"vf_from_vi_a_t"``,
+      see :data:`kinematics.plans.EQUATIONS`), number of evaluations and
+      total time.
+    - ``steps_builds`` / ``steps_seconds``: ``show_steps`` payloads built and
+      the time spent building them.
+    """
+
+    def __init__(self):
+        self.solves = 0
+        self.plans: Dict[str, int] = dict()
+        self.calls: Dict[str, int] = dict()
+        self.seconds: Dict[str, float] = dict()
+        self.steps_builds = 0
+        self.steps_seconds = 0.0
+
+    def record_plan(self, name: str):
+        self.solves += 1
+        self.plans[name] = self.plans.get(name, 0) + 1
+
+    def record_equation(self, name: str, seconds: float):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def record_steps(self, seconds: float):
+        self.steps_builds += 1
+        self.steps_seconds += seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the statistics as a JSON-friendly dict (times in microseconds)."""
+        equations = dict(
+            (name, dict(
+                calls=calls,
+                total_us=self.seconds[name] * 1e6,
+                mean_us=self.seconds[name] * 1e6 / calls,
+            ))
+            for name, calls in sorted(self.calls.items())
+        )
+        return dict(
+            solves=self.solves,
+            plans=dict(self.plans),
+            equations=equations,
+            steps=dict(
+                builds=self.steps_builds,
+                total_us=self.steps_seconds * 1e6,
+                mean_us=self.steps_seconds * 1e6 / self.steps_builds if self.steps_builds else 0.0,
+            ),
+        )
+
+    def __repr__(self):
+        return (f"SolveStats(solves={self.solves}, equations={sum(self.calls.values())}, "
+                f"steps_builds={self.steps_builds})")
+
+
+# The active collector of the current context (thread / task); ``None`` when
+# instrumentation is off, which is the only thing the solver checks.
+_STATS: ContextVar[Optional[SolveStats]] = ContextVar("kinematics_solve_stats", default=None)
+
+
+def active_stats() -> Optional[SolveStats]:
+    """Returns the collector of the current context, if any."""
+    return _STATS.get()
+
+
+@contextmanager
+def collect(stats: Optional[SolveStats]=None) -> Iterator[SolveStats]:
+    """Collects solve statistics within the block (and only within the current
+    context: other threads and asyncio tasks are unaffected).
+
+    Pass ``stats`` to keep accumulating into an existing collector.
+
+    Usage:
+
+        with collect() as stats:
+            Kinematics1D(vi=205, vf=315, t=10.0).solve()
+        stats.as_dict()
+
+    """
+    if stats is None:
+        stats = SolveStats()
+    token = _STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _STATS.reset(token)
+
+
+def timed(stats: SolveStats, name: str, func, *args):
+    """Evaluates ``func(*args)``, recording its duration under ``name``."""
+    start = perf_counter()
+    value = func(*args)
+    stats.record_equation(name, perf_counter() - start)
+    return value
@@ -0,0 +1,179 @@
+import numpy as np
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from .batch import calculate1D_batch
+from .k1d import solve1D
+from .plans import PARAMS, get_plan
+
+Bounds = Tuple[Optional[float], Optional[float]]
+
+# Coarse-grid points solved per vectorized pass (bounds the memory of a search).
+GRID_CHUNK = 65536
+
+
+class DesignResult(NamedTuple):
+    """Optimal feasible design: the solved ``params`` (unrounded), the
+    ``known`` parameters that produce them (fixed and optimal free values),
+    the ``objective`` value, the solve ``steps`` (LaTeX) of the optimum,
+    the number of ``feasible`` coarse-grid points and of problems solved
+    in total (``evaluations``).
+    """
+    params: Dict[str, float]
+    known: Dict[str, float]
+    objective: float
+    steps: List[str]
+    feasible: int
+    evaluations: int
+
+
+def _feasible(values: Mapping[str, np.ndarray], constraints: Mapping[str, Bounds]) -> np.ndarray:
+    ok = np.logical_and.reduce([np.isfinite(values[name]) for name in PARAMS])
+    for name, (low, high) in constraints.items():
+        if low is not None:
+            ok &= values[name] >= low
+        if high is not None:
+            ok &= values[name] <= high
+    return ok
+
+
+def design(
+        objective: str,
+        free: Mapping[str, Bounds],
+        fixed: Optional[Mapping[str, Optional[float]]]=None,
+        constraints: Optional[Mapping[str, Bounds]]=None,
+        sense: str="min",
+        grid: int=201,
+        tol: float=1e-12,
+        max_iter: int=100,
+    ) -> DesignResult:
+    """Inverse design: the free parameter values, within their bounds, that
+    minimize (or maximize) ``objective`` subject to ``constraints``.
+
+    The free parameters are searched on a coarse grid (``grid`` points per
+    parameter, every combination solved in vectorized passes of
+    ``GRID_CHUNK`` points; only a feasibility flag per point is kept). Each pair of
+    neighbouring grid points across the feasibility boundary is then refined
+    by bisection, all brackets at once (one vectorized solve per iteration),
+    until the brackets are narrower than ``tol`` times the parameter's range.
+    The best feasible point, grid or boundary, wins; an optimum strictly
+    inside the feasible region is only located to the grid spacing.
+
+    Parameters:
+        objective: the parameter to optimize (any of ``Dx, a, v_avg, vi, vf, t``).
+        free: ``{name: (low, high)}`` search ranges of the free parameters.
+        fixed: the other known parameters; with the free ones, they must
+            form a solvable known set (e.g. three parameters) whose solve
+            plan reads every free parameter.
+        constraints: ``{name: (low, high)}`` bounds on any parameter,
+            ``None`` for an open side.
+        sense: ``"min"`` or ``"max"``.
+
+    Raises ``ValueError`` if a free parameter would be ignored by the solve
+    plan (e.g. ``a`` free with ``vi, vf, t`` fixed) or if no grid point is
+    feasible.
+
+    Usage:
+
+        # Smallest a covering 500 m within 12 s from vi = 5 m/s
+        res = design("a", dict(a=(0, 20)), fixed=dict(vi=5, Dx=500), constraints=dict(t=(None, 12)))
+        res.known["a"], res.params["t"]     # 6.1111..., 12.0
+
+    """
+    if sense not in ("min", "max"):
+        raise ValueError(f"sense must be 'min' or 'max', got {sense!r}.")
+    constraints = dict(constraints or dict())
+    fixed = dict((name, value) for name, value in (fixed or dict()).items() if value is not None and name not in free)
+    unknown = (set(free) | set(fixed) | set(constraints) | {objective}) - set(PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {sorted(unknown)}.")
+    if not free:
+        raise ValueError("At least one free parameter is necessary.")
+    plan = get_plan(set(fixed) | set(free))
+    if plan is None:
+        raise ValueError(f"The fixed and free parameters {sorted(set(fixed) | set(free))} are not a solvable known set.")
+    if not plan.known.issuperset(free):
+        raise ValueError(
+            f"The free parameters {sorted(set(free) - plan.known)} have no effect: the known parameters "
+            f"{sorted(set(fixed) | set(free))} are solved from {sorted(plan.known)}. "
+            f"Remove the conflicting fixed parameters."
+        )
+    if grid < 2:
+        raise ValueError("grid must be at least 2.")
+    dims = tuple(free)
+    low = np.array([free[dim][0] for dim in dims], dtype=np.float64)
+    high = np.array([free[dim][1] for dim in dims], dtype=np.float64)
+    if not (np.isfinite(low).all() and np.isfinite(high).all() and (low < high).all()):
+        raise ValueError("The free parameters need finite ranges with low < high.")
+
+    def evaluate(points: np.ndarray) -> Dict[str, np.ndarray]:
+        columns = dict(fixed)
+        columns.update((dim, points[:, i]) for i, dim in enumerate(dims))
+        return calculate1D_batch(columns, ndigits=None, errors="coerce")
+
+    # Coarse grid, solved GRID_CHUNK points at a time: only the feasibility
+    # mask and the best feasible point are kept.
+    axes = [np.linspace(lo, hi, grid) for lo, hi in zip(low, high)]
+    shape = (grid,) * len(dims)
+    size = grid ** len(dims)
+    ok = np.empty(size, dtype=bool)
+    best, best_score = None, np.inf
+    for start in range(0, size, GRID_CHUNK):
+        flat = np.unravel_index(np.arange(start, min(start + GRID_CHUNK, size)), shape)
+        points = np.column_stack([axis[i] for axis, i in zip(axes, flat)])
+        values = evaluate(points)
+        feasible = ok[start:start + len(points)] = _feasible(values, constraints)
+        score = np.where(feasible, values[objective] if sense == "min" else -values[objective], np.inf)
+        i = int(np.argmin(score))
+        if score[i] < best_score:
+            best, best_score = points[i], score[i]
+    evaluations = size
+    if not ok.any():
+        raise ValueError("No feasible design within the bounds.")
+
+    # Brackets across the feasibility boundary, along every grid axis.
+    ok = ok.reshape(shape)
+    inside, outside = [], []
+    for axis in range(len(dims)):
+        before = np.take(ok, np.arange(grid - 1), axis=axis)
+        crossing = before != np.take(ok, np.arange(1, grid), axis=axis)
+        index = np.nonzero(crossing)
+        first = np.column_stack([axes[j][i] for j, i in enumerate(index)])
+        second = first.copy()
+        second[:, axis] = axes[axis][index[axis] + 1]
+        first_ok = before[crossing][:, None]
+        inside.append(np.where(first_ok, first, second))
+        outside.append(np.where(first_ok, second, first))
+    inside, outside = np.concatenate(inside), np.concatenate(outside)
+
+    # Vectorized bisection of all the brackets.
+    span = high - low
+    for _ in range(max_iter):
+        if not len(inside) or (np.abs(outside - inside) <= tol * span).all():
+            break
+        middle = 0.5 * (inside + outside)
+        feasible = _feasible(evaluate(middle), constraints)[:, None]
+        evaluations += len(middle)
+        inside = np.where(feasible, middle, inside)
+        outside = np.where(feasible, outside, middle)
+
+    if len(inside):
+        values = evaluate(inside)
+        evaluations += len(inside)
+        score = values[objective] if sense == "min" else -values[objective]
+        score = np.where(_feasible(values, constraints), score, np.inf)
+        i = int(np.argmin(score))
+        if score[i] < best_score:
+            best = inside[i]
+
+    known = dict((name, float(value)) for name, value in fixed.items())
+    known.update((dim, float(best[i])) for i, dim in enumerate(dims))
+    result = solve1D(**known)
+    params = dict((name, getattr(result, name)) for name in PARAMS)
+    return DesignResult(
+        params=params,
+        known=known,
+        objective=params[objective],
+        steps=list(result.steps),
+        feasible=int(ok.sum()),
+        evaluations=evaluations,
+    )
@@ -1,786 +1,275 @@
+from functools import lru_cache
 from textwrap import dedent
-from IPython.display import display, Markdown, Latex
-from typing import Dict, Optional
+from time import perf_counter
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .cache import SolveCache
+from .instrument import _STATS, timed
+from .plans import (
+    COMPILED_PLANS, DEPENDENT_MASKS, FORMULAS, PARAM_BITS, PLAN_DEPENDENTS, PLAN_FORMULAS, PLANS, SOLVE_PLANS, SolvePlan,
+)
 
 
 def prepare_result(ndigits: int=2, **kwargs):
     return dict((k, round(v, ndigits)) for k, v in kwargs.items())
 
 
-def eval_average_velocity(
-        vi: Optional[float]=None,
-        vf: Optional[float]=None,
-        a: Optional[float]=None,
-        Dx: Optional[float]=None,
-        v_avg: Optional[float]=None,
-        t: Optional[float]=None,
-        using: str="vi,vf"
-    ):
-    formula = ""
-    v_avg = None
-    if (set(using.strip().split(",")) == {"vi", "vf"}) and (vi is not None) and (vf is not None):
-        v_avg = 0.5 * (vi + vf)
-        formula = r"v_{avg} &= \frac{\left( v_{i} + v_{f} \right)}{2}"
-    elif set(using.strip().split(",")) == {"Dx", "t"} and (Dx is not None) and (t is not None):
-        v_avg = Dx / t
-        formula = r"v_{avg} &= \frac{\Delta x}{t}"
-    return dict(value=v_avg, formula=formula)
-
-
-def eval_displacement(v_avg: float, t: float):
-    Dx = v_avg * t
-    formula = r"\Delta x &= v_{avg} t"
-    return dict(value=Dx, formula=formula)
-
-
-def eval_acceleration(vi: float, vf: float, t: float):
-    a = (vf - vi) / t
-    formula = r"a &= \frac{\left( v_{f} - v_{i} \right)}{t}"
-    return dict(value=a, formula=formula)
-
-
-def eval_initial_velocity(
-        vi: Optional[float]=None,
-        vf: Optional[float]=None,
-        t: Optional[float] = None,
-        a: Optional[float]=None,
-        Dx: Optional[float]=None,
-        v_avg: Optional[float]=None,
-        using: str="v_avg,a,t",
-    ):
-    formula = ""
-    vi = None
-    if set(using.strip().split(",")) == {"v_avg", "a", "t"}:
-        vi = 0.5 * (v_avg - a * t)
-        formula = r"v_{i} &= \frac{1}{2} \left( v_{avg} - a t \right)"
-    elif set(using.strip().split(",")) == {"vf", "a", "t"}:
-        vi = 0.5 * (v_avg - a * t)
-        formula = r"v_{i} &= v_{f} - a t"
-    elif set(using.strip().split(",")) == {"vf", "a", "Dx"}:
-        vi = (vf**2 - 2 * a * Dx) ** 0.5
-        if (a > 0 and vf < vi) or (a < 0 and vf > vi):
-            vi = -vi
-        formula = r"v_{i}^{2} &= v_{f}^{2} - 2 a \Delta x"
-    elif set(using.strip().split(",")) == {"vf", "v_avg"}:
-        vi = v_avg * 2 - vf
-        formula = r"v_{i} &= 2 v_{avg} - v_{f}"
-    return dict(value=vi, formula=formula)
-
-
-def eval_final_velocity(
-        vi: Optional[float] = None,
-        vf: Optional[float] = None,
-        t: Optional[float] = None,
-        a: Optional[float] = None,
-        Dx: Optional[float] = None,
-        v_avg: Optional[float] = None,
-        using: str = "v_avg,a,t",
-    ):
-    formula = ""
-    vf = None
-    if set(using.strip().split(",")) == {"v_avg", "a", "t"}:
-        vf = 0.5 * (v_avg + a * t)
-        formula = r"v_{f} &= \frac{1}{2} \left( v_{avg} + a t \right)"
-    elif set(using.strip().split(",")) == {"vi", "a", "t"}:
-        vf = 0.5 * (v_avg + a * t)
-        formula = r"v_{f} &= v_{i} + a t"
-    elif set(using.strip().split(",")) == {"vi", "a", "Dx"}:
-        vf = (vi**2 + 2 * a * Dx) ** 0.5
-        if (a > 0 and vf < vi) or (a < 0 and vf > vi):
-            vf = -vf
-        formula = r"v_{f}^{2} &= v_{i}^{2} + 2 a \Delta x"
-    elif set(using.strip().split(",")) == {"vi", "v_avg"}:
-        vf = v_avg * 2 - vi
-        formula = r"v_{f} &= 2 v_{avg} - v_{i}"
-    return dict(value=vf, formula=formula)
-
-
-def eval_time(vi: Optional[float]=None, vf: Optional[float]=None, a: Optional[float]=None, Dx: Optional[float]=None, v_avg: Optional[float]=None, using: str="vi,vf,a"):
-    formula = ""
-    t = None
-    if set(using.strip().split(",")) == {"vi", "vf", "a"}:
-        t = (vf - vi) / a
-        formula = r"t &= \frac{\left( v_{f} - v_{i} \right)}{a}"
-    elif set(using.strip().split(",")) == {"Dx", "v_avg"}:
-        t = Dx / v_avg
-        formula = r"t &= \frac{\Delta x}{v_{avg}}"
-    return dict(value=t, formula=formula)
-
-def known_vi_vf_t(vi: float, vf: float, t: float, ndigits: int=5):
-    """Returns displacement (Dx), acceleration (a) and average-velocity (v_avg).
-
-    Parameters:
-        vi: initial velocity (units: m/s)
-        vf: final veocity (units: m/s)
-        t: time (units: seconds)
-
-    Usage:
-
-        result, steps = known_vi_vf_t(vi=205, vf=315, t=1.75)
-
-    """
-    ## Steps:
-    # v_avg = 0.5 * (vi + vf)
-    # Dx = v_avg * t
-    # a = (vf - vi) / t
-    results = dict()
-    steps = []
-
-    # v_avg = 0.5 * (vi + vf)
-    results["v_avg"] = eval_average_velocity(vi=vi, vf=vf, using="vi,vf")
-    v_avg = results.get("v_avg",{}).get("value")
-    steps.append(results.get("v_avg",{}).get("formula"))
-
-    # Dx = v_avg * t
-    results["Dx"] = eval_displacement(v_avg=v_avg, t=t)
-    Dx = results.get("Dx",{}).get("value")
-    steps.append(results.get("Dx",{}).get("formula"))
-
-    # a = (vf - vi) / t
-    results["a"] = eval_acceleration(vi=vi, vf=vf, t=t)
-    a = results.get("a",{}).get("value")
-    steps.append(results.get("a",{}).get("formula"))
-
-    result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-    return prepare_result(ndigits=ndigits, **result), steps
-
-
-def known_vi_vf_a(vi: float, vf: float, a: float, ndigits: int=5, reuse: bool=False):
-    """Returns displacement (Dx), time (t) and average-velocity (v_avg).
-
-    Parameters:
-        vi: initial velocity (units: m/s)
-        vf: final veocity (units: m/s)
-        a: acceleration (units: m/s^2)
-
-    Usage:
-
-        result, steps = known_vi_vf_a(vi=205.0, vf=315.0, a=11.0)
-
-    """
-    results = dict()
-    steps = []
-
-    # t = (vf - vi) / a
-    results["t"] = eval_time(vi=vi, vf=vf, a=a, using="vi,vf,a")
-    t = results.get("t",{}).get("value")
-    steps.append(results.get("t",{}).get("formula"))
-
-    if not reuse:
-        # v_avg = 0.5 * (vi + vf)
-        results["v_avg"] = eval_average_velocity(vi=vi, vf=vf, using="vi,vf")
-        v_avg = results.get("v_avg",{}).get("value")
-        steps.append(results.get("v_avg",{}).get("formula"))
-
-        # Dx = v_avg * t
-        results["Dx"] = eval_displacement(v_avg=v_avg, t=t)
-        Dx = results.get("Dx",{}).get("value")
-        steps.append(results.get("Dx",{}).get("formula"))
-
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vf_t(vi=vi, vf=vf, t=t), steps
-
-
-def known_vi_vf_Dx(vi: float, vf: float, Dx: float, ndigits: int=5):
-    """Returns time (t), acceleration (a) and average-velocity (v_avg).
-
-    Parameters:
-        vi: initial velocity (units: m/s)
-        vf: final veocity (units: m/s)
-        Dx: displacement (units: m)
-
-    Usage:
-
-        result, steps = known_vi_vf_Dx(vi=205, vf=315, Dx=455)
-
-    """
-    results = dict()
-    steps = []
-
-    # v_avg = 0.5 * (vi + vf)
-    results["v_avg"] = eval_average_velocity(vi=vi, vf=vf, using="vi,vf")
-    v_avg = results.get("v_avg",{}).get("value")
-    steps.append(results.get("v_avg",{}).get("formula"))
-
-    # t = Dx / v_avg
-    results["t"] = eval_time(Dx=Dx, v_avg=v_avg, using="Dx,v_avg")
-    t = results.get("t",{}).get("value")
-    steps.append(results.get("t",{}).get("formula"))
-
-    # a = (vf - vi) / t
-    results["a"] = eval_acceleration(vi=vi, vf=vf, t=t)
-    a = results.get("a",{}).get("value")
-    steps.append(results.get("a",{}).get("formula"))
-
-    result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-    return prepare_result(ndigits=ndigits, **result), steps
-
-
-def known_Dx_a_t(Dx: float, a: float, t: float, ndigits: int=5):
-    """Returns final-velocity (vf), initial-velocity (vi) and average-velocity (v_avg).
-
-    Parameters:
-        Dx: displacement (units: m)
-        a: acceleration (units: m/s^2)
-        t: time (units: seconds)
-
-    Usage:
-
-        result = known_Dx_a_t(Dx=225, a=-1.8, t=12.75)
-
-    """
-    results = dict()
-    steps = []
-
-    # v_avg = 2 * Dx / t
-    results["v_avg"] = eval_average_velocity(Dx=Dx, t=t, using="Dx,t")
-    v_avg = results.get("v_avg",{}).get("value")
-    steps.append(results.get("v_avg",{}).get("formula"))
-
-    # vf = 0.5 * (v_avg + a*t)
-    results["vf"] = eval_final_velocity(v_avg=v_avg, a=a, t=t, using="v_avg,a,t")
-    vf = results.get("vf",{}).get("value")
-    steps.append(results.get("vf",{}).get("formula"))
-
-    # vi = 0.5 * (v_avg - a*t)
-    results["vi"] = eval_initial_velocity(v_avg=v_avg, a=a, t=t, using="v_avg,a,t")
-    vi = results.get("vi",{}).get("value")
-    steps.append(results.get("vi",{}).get("formula"))
-
-    result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-    return prepare_result(ndigits=ndigits, **result), steps
-
-
-def known_vi_a_t(vi: float, a: float, t: float, ndigits: int=5, reuse: bool=False):
-    """Returns displacement (Dx), final-velocity (vf) and average-velocity (v_avg).
-
-    Parameters:
-        vi: initial velocity (units: m/s)
-        a: acceleration (units: m/s^2)
-        t: time (units: seconds)
-
-    Usage:
-
-        result = known_vi_a_t(vi=205, a=1.75, t=10.0)
-
-    """
-    results = dict()
-    steps = []
-
-    # vf = vi + a * t
-    results["vf"] = eval_final_velocity(vi=vi, a=a, t=t, using="vi,a,t")
-    vf = results.get("vf",{}).get("value")
-    steps.append(results.get("vf",{}).get("formula"))
-    if not reuse:
-        # v_avg = 0.5 * (vi + vf)
-        results["v_avg"] = eval_average_velocity(vi=vi, vf=vf, using="vi,vf")
-        v_avg = results.get("v_avg",{}).get("value")
-        steps.append(results.get("v_avg",{}).get("formula"))
-
-        # Dx = v_avg * t
-        results["Dx"] = eval_displacement(v_avg=v_avg, t=t)
-        Dx = results.get("Dx",{}).get("value")
-        steps.append(results.get("Dx",{}).get("formula"))
-
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vf_a(vi=vi, vf=vf, a=a, ndigits=ndigits), steps
-
-
-def known_vf_a_t(vf: float, a: float, t: float, ndigits: int=5, reuse: bool=False):
-    """Returns displacement (Dx), initial-velocity (vi) and average-velocity (v_avg).
-
-    Parameters:
-        vf: final velocity (units: m/s)
-        a: acceleration (units: m/s^2)
-        t: time (units: seconds)
-
-    Usage:
-
-        result = known_vi_a_t(vi=205, a=1.75, t=10.0)
-
-    """
-    results = dict()
-    steps = []
-
-    # vi = vf - a * t
-    results["vi"] = eval_initial_velocity(vf=vf, a=a, t=t, using="vf,a,t")
-    vi = results.get("vi",{}).get("value")
-    steps.append(results.get("vi",{}).get("formula"))
-    if not reuse:
-        # v_avg = 0.5 * (vi + vf)
-        results["v_avg"] = eval_average_velocity(vi=vi, vf=vf, using="vi,vf")
-        v_avg = results.get("v_avg",{}).get("value")
-        steps.append(results.get("v_avg",{}).get("formula"))
-
-        # Dx = v_avg * t
-        results["Dx"] = eval_displacement(v_avg=v_avg, t=t)
-        Dx = results.get("Dx",{}).get("value")
-        steps.append(results.get("Dx",{}).get("formula"))
-
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vf_a(vi=vi, vf=vf, a=a, ndigits=ndigits), steps
-
-
-def known_vi_a_Dx(vi: float, a: float, Dx: float, ndigits: int=5, reuse: bool=False):
-    """Returns time (t), final-velocity (vf) and average-velocity (v_avg).
-
-    Parameters:
-        vi: initial velocity (units: m/s)
-        a: acceleration (units: m/s^2)
-        Dx: displacement (units: m)
-
-    Usage:
-
-        result = known_vi_a_Dx(vi=205.0, a=1.75, Dx=455.0)
-
-    """
-    results = dict()
-    steps = []
-
-    # vf = (vi**2 + 2 * a * Dx) ** 0.5
-    # if (a > 0 and vf < vi) or (a < 0 and vf > vi):
-    #     vf = -vf
-    results["vf"] = eval_final_velocity(vi=vi, a=a, Dx=Dx, using="vi,a,Dx")
-    vf = results.get("vf",{}).get("value")
-    steps.append(results.get("vf",{}).get("formula"))
-    if not reuse:
-        # v_avg = 0.5 * (vi + vf)
-        results["v_avg"] = eval_average_velocity(vi=vi, vf=vf, using="vi,vf")
-        v_avg = results.get("v_avg",{}).get("value")
-        steps.append(results.get("v_avg",{}).get("formula"))
-
-        # t = Dx / v_avg
-        results["t"] = eval_time(Dx=Dx, v_avg=v_avg, using="Dx,v_avg")
-        t = results.get("t",{}).get("value")
-        steps.append(results.get("t",{}).get("formula"))
-
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vf_Dx(vi=vi, vf=vf, Dx=Dx, ndigits=ndigits), steps
-
-
-def known_vf_a_Dx(vf: float, a: float, Dx: float, ndigits: int=5, reuse: bool=False):
-    """Returns time (t), initial-velocity (vi) and average-velocity (v_avg).
-
-    Parameters:
-        vf: final velocity (units: m/s)
-        a: acceleration (units: m/s^2)
-        Dx: displacement (units: m)
-
-    Usage:
-
-        result = known_vi_a_Dx(vf=315.0, a=1.75, Dx=455.0)
-
-    """
-    results = dict()
-    steps = []
-
-    # vi = (vf**2 - 2 * a * Dx) ** 0.5
-    # if (a > 0 and vf < vi) or (a < 0 and vf > vi):
-    #     vi = -vi
-    results["vi"] = eval_initial_velocity(vf=vf, a=a, Dx=Dx, using="vf,a,Dx")
-    vi = results.get("vi",{}).get("value")
-    steps.append(results.get("vi",{}).get("formula"))
-    if not reuse:
-        # v_avg = 0.5 * (vi + vf)
-        results["v_avg"] = eval_average_velocity(vi=vi, vf=vf, using="vi,vf")
-        v_avg = results.get("v_avg",{}).get("value")
-        steps.append(results.get("v_avg",{}).get("formula"))
-
-        # t = Dx / v_avg
-        results["t"] = eval_time(Dx=Dx, v_avg=v_avg, using="Dx,v_avg")
-        t = results.get("t",{}).get("value")
-        steps.append(results.get("t",{}).get("formula"))
-
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vf_Dx(vi=vi, vf=vf, Dx=Dx, ndigits=ndigits), steps
-
-
-def known_vf_vavg_t(vf: float, v_avg: float, t: float, ndigits: int = 5, reuse: bool = False):
-    """Returns displacement (Dx), initial-velocity (vi) and acceleration (a).
-
-    Parameters:
-        vf: final velocity (units: m/s)
-        v_avg: average velocity (units: m/s)
-        t: time (units: s)
-
-    Usage:
-
-        result = known_vf_vavg(vf=315.0, v_avg=300, t=10.0)
+def calculate1D(
+    vi:Optional[float]=None,
+    vf:Optional[float]=None,
+    v_avg:Optional[float]=None,
+    a:Optional[float]=None,
+    Dx:Optional[float]=None,
+    t:Optional[float]=None,
+    ndigits: int=5,
+    cache: Optional[SolveCache]=None):
+    """Evaluates the unknown parameters based on provided, known set of parameters.
 
+    The known parameters select (in O(1), through their bitmask) a precompiled
+    solve plan from :data:`kinematics.plans.SOLVE_PLANS`; its equations are then
+    evaluated in order. Pass a :class:`kinematics.cache.SolveCache` as ``cache``
+    to memoize the results.
     """
-    results = dict()
-    steps = []
-
-    # vi = v_avg * 2 - vf
-    results["vi"] = eval_initial_velocity(vf=vf, v_avg=v_avg, using="vf,v_avg")
-    vi = results.get("vi",{}).get("value")
-    steps.append(results.get("vi",{}).get("formula"))
-    if not reuse:
-
-        # a = (vf - vi) / t
-        results["a"] = eval_acceleration(vi=vi, vf=vf, t=t)
-        a = results.get("a", {}).get("value")
-        steps.append(results.get("a", {}).get("formula"))
-
-        # Dx = v_avg * t
-        results["Dx"] = eval_displacement(v_avg=v_avg, t=t)
-        Dx = results.get("Dx", {}).get("value")
-        steps.append(results.get("Dx", {}).get("formula"))
-
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vf_t(vi=vi, vf=vf, t=t, ndigits=ndigits), steps
-
-
-def known_vi_vavg_t(vi: float, v_avg: float, t: float, ndigits: int=5, reuse: bool=False):
-    """Returns displacement (Dx), final-velocity (vf) and acceleration (a).
+    params = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
+    result, plan = _solve(params, ndigits=ndigits, cache=cache)
+    return result, list(PLAN_FORMULAS[plan.mask])
 
-    Parameters:
-        vi: initial velocity (units: m/s)
-        v_avg: average velocity (units: m/s)
-        t: time (units: s)
 
-    Usage:
-
-        result = known_vi_vavg_t(vi=200.0, v_avg=300.0, t=10.0)
+def _solve(params: Dict[str, Optional[float]], ndigits: int, cache: Optional[SolveCache]=None):
+    """Returns the rounded result and the plan used, through ``cache`` if given.
 
+    Cache entries are ``(result, plan, solved)``, ``solved`` being the
+    unrounded parameters (used by :meth:`Kinematics1D.update`).
     """
-    results = dict()
-    steps = []
-
-    # vf = v_avg * 2 - vi
-    results["vf"] = eval_final_velocity(vi=vi, v_avg=v_avg, using="vi,v_avg")
-    vf = results.get("vf",{}).get("value")
-    steps.append(results.get("vf",{}).get("formula"))
-    if not reuse:
-
-        # a = (vf - vi) / t
-        results["a"] = eval_acceleration(vi=vi, vf=vf, t=t)
-        a = results.get("a", {}).get("value")
-        steps.append(results.get("a", {}).get("formula"))
-
-        # Dx = v_avg * t
-        results["Dx"] = eval_displacement(v_avg=v_avg, t=t)
-        Dx = results.get("Dx", {}).get("value")
-        steps.append(results.get("Dx", {}).get("formula"))
-
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vf_t(vi=vi, vf=vf, t=t, ndigits=ndigits), steps
-
-
-def known_vi_vavg_Dx(vi: float, v_avg: float, Dx: float, ndigits: int = 5, reuse: bool = False):
-    """Returns time (t), final-velocity (vf) and acceleration (a).
-
-    Parameters:
-        vi: initial velocity (units: m/s)
-        v_avg: average velocity (units: m/s)
-        Dx: displacement (units: m)
+    if cache is None:
+        plan = _evaluate(params)
+        return prepare_result(ndigits=ndigits, **params), plan
+    key = cache.make_key(params, ndigits)
+    entry = cache.get(key)
+    if entry is None:
+        plan = _evaluate(params)
+        entry = (prepare_result(ndigits=ndigits, **params), plan, dict(params))
+        cache.put(key, entry)
+    result, plan, _ = entry
+    return dict(result), plan
+
+
+def _evaluate(params: Dict[str, Optional[float]]) -> SolvePlan:
+    """Evaluates the unknowns of ``params`` in place and returns the plan used."""
+    mask = 0
+    for name, value in params.items():
+        if value is not None:
+            mask |= PARAM_BITS[name]
+    plan = SOLVE_PLANS.get(mask)
+    if plan is None:
+        if bin(mask).count("1") < 3:
+            raise ValueError("At least three appropriate parameters are necessary.")
+        if mask in DEPENDENT_MASKS:
+            raise ValueError(f"The known parameters are not independent ({DEPENDENT_MASKS[mask]}).")
+        raise NotImplementedError()
+    stats = _STATS.get()
+    if stats is None:
+        for target, func, getter in COMPILED_PLANS[plan.mask]:
+            params[target] = func(*getter(params))
+        return plan
+    stats.record_plan(plan.name)
+    for equation, (target, func, getter) in zip(plan.equations, COMPILED_PLANS[plan.mask]):
+        params[target] = timed(stats, equation.name, func, *getter(params))
+    return plan
+
+
+def _reevaluate(params: Dict[str, Optional[float]], plan: SolvePlan, indices: Tuple[int, ...]):
+    """Re-evaluates (in place) only the equations ``indices`` of ``plan``."""
+    stats = _STATS.get()
+    compiled = COMPILED_PLANS[plan.mask]
+    for i in indices:
+        target, func, getter = compiled[i]
+        if stats is None:
+            params[target] = func(*getter(params))
+        else:
+            params[target] = timed(stats, plan.equations[i].name, func, *getter(params))
 
-    Usage:
 
-        result = known_vi_vavg_Dx(vi=200.0, v_avg=300.0, Dx=3000.0)
+@lru_cache(maxsize=None)
+def _notebook_display():
+    """Loads (on first use) the IPython display backend of ``show_steps``.
 
+    IPython is an optional dependency: it is only needed to render the steps
+    in a notebook (``as_markdown`` or ``as_latex``).
     """
-    results = dict()
-    steps = []
-
-    # vf = v_avg * 2 - vi
-    results["vf"] = eval_final_velocity(vi=vi, v_avg=v_avg, using="vi,v_avg")
-    vf = results.get("vf", {}).get("value")
-    steps.append(results.get("vf", {}).get("formula"))
-    if not reuse:
-
-        # t = Dx / v_avg
-        results["t"] = eval_time(Dx=Dx, v_avg=v_avg, using="Dx,v_avg")
-        t = results.get("t", {}).get("value")
-        steps.append(results.get("t", {}).get("formula"))
-
-        # a = (vf - vi) / t
-        results["a"] = eval_acceleration(vi=vi, vf=vf, t=t)
-        a = results.get("a", {}).get("value")
-        steps.append(results.get("a", {}).get("formula"))
+    try:
+        from IPython.display import display, Markdown, Latex
+    except ImportError as e:
+        raise ImportError(
+            "IPython is required to display steps with as_markdown/as_latex "
+            "(pip install ipython)."
+        ) from e
+    return display, Markdown, Latex
 
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vf_Dx(vi=vi, vf=vf, Dx=Dx, ndigits=ndigits), steps
-
-
-def known_vf_vavg_Dx(vf: float, v_avg: float, Dx: float, ndigits: int = 5, reuse: bool = False):
-    """Returns time (t), initial-velocity (vi) and acceleration (a).
-
-    Parameters:
-        vf: final velocity (units: m/s)
-        v_avg: average velocity (units: m/s)
-        Dx: displacement (units: m)
-
-    Usage:
-
-        result = known_vf_vavg_Dx(vf=200.0, v_avg=300.0, Dx=3000.0)
 
+def show_steps(steps, as_markdown: bool=False, as_latex: bool=False, debug: bool=False):
+    s = r' \\' + '\n    '
+    tex = \
+    r"""
+    \begin(|equation|)
+    \begin(|aligned|)
+        {content}
+    \end(|aligned|)
+    \end(|equation|)
     """
-    results = dict()
-    steps = []
-
-    # vi = v_avg * 2 - vf
-    results["vi"] = eval_initial_velocity(vf=vf, v_avg=v_avg, using="vf,v_avg")
-    vi = results.get("vi", {}).get("value")
-    steps.append(results.get("vi", {}).get("formula"))
-    if not reuse:
-
-        # t = Dx / v_avg
-        results["t"] = eval_time(Dx=Dx, v_avg=v_avg, using="Dx,v_avg")
-        t = results.get("t", {}).get("value")
-        steps.append(results.get("t", {}).get("formula"))
-
-        # a = (vf - vi) / t
-        results["a"] = eval_acceleration(vi=vi, vf=vf, t=t)
-        a = results.get("a", {}).get("value")
-        steps.append(results.get("a", {}).get("formula"))
-
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vf_Dx(vi=vi, vf=vf, Dx=Dx, ndigits=ndigits), steps
-
+    stats = _STATS.get()
+    if stats is not None:
+        start = perf_counter()
+    payload = dedent(tex).format(content=s.join(steps) + r" \\").replace("(|", "{").replace("|)", "}")
+    if stats is not None:
+        stats.record_steps(perf_counter() - start)
+    if debug:
+        print(payload)
+    if as_markdown:
+        display, Markdown, _ = _notebook_display()
+        display(Markdown(data=payload))
+    if as_latex:
+        display, _, Latex = _notebook_display()
+        display(Latex(data=payload))
+    return payload
 
-def known_vi_vavg_a(vi: float, v_avg: float, a: float, ndigits: int = 5, reuse: bool = False):
-    """Returns time (t), final-velocity (vf) and displacement (Dx).
+class StepTrace(object):
+    """Lightweight trace of the steps of a solve, as interned formula ids.
 
-    Parameters:
-        vi: initial velocity (units: m/s)
-        v_avg: average velocity (units: m/s)
-        a: acceleration (units: m/s^2)
+    The LaTeX formulas (and the ``show_steps`` payload) are only built on first
+    access. A trace can be used wherever the list of step formulas is expected.
+    Traces are immutable, so one trace per solve plan is shared by all solves.
 
     Usage:
 
-        result = known_vi_vavg_a(vi=200.0, v_avg=300.0, a=10.0)
-
+        ```python
+        result, trace = Kinematics1D(vi=205, vf=315, t=10.0).solve(steps="lazy")
+        trace.ids       # (0, 2, 3)
+        trace.payload   # LaTeX built here, once
+        ```
     """
-    results = dict()
-    steps = []
-
-    # vf = v_avg * 2 - vi
-    results["vf"] = eval_final_velocity(vi=vi, v_avg=v_avg, using="vi,v_avg")
-    vf = results.get("vf", {}).get("value")
-    steps.append(results.get("vf", {}).get("formula"))
-    if not reuse:
-
-        # t = (vf - vi) / a
-        results["t"] = eval_time(vi=vi, vf=vf, a=a, using="vi,vf,a")
-        t = results.get("t", {}).get("value")
-        steps.append(results.get("t", {}).get("formula"))
+    __slots__ = ("ids", "_formulas", "_payload")
 
-        # Dx = v_avg * t
-        results["Dx"] = eval_displacement(v_avg=v_avg, t=t)
-        Dx = results.get("Dx", {}).get("value")
-        steps.append(results.get("Dx", {}).get("formula"))
+    def __init__(self, ids: Tuple[int, ...]):
+        self.ids = ids
+        self._formulas = None
+        self._payload = None
 
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vf_a(vi=vi, vf=vf, a=a, ndigits=ndigits), steps
+    @property
+    def formulas(self) -> Tuple[str, ...]:
+        if self._formulas is None:
+            self._formulas = tuple(FORMULAS[i] for i in self.ids)
+        return self._formulas
 
+    @property
+    def payload(self) -> str:
+        if self._payload is None:
+            self._payload = show_steps(self.formulas)
+        return self._payload
 
-def known_vf_vavg_a(vf: float, v_avg: float, a: float, ndigits: int = 5, reuse: bool = False):
-    """Returns time (t), initial-velocity (vi) and displacement (Dx).
+    def show(self, **steps_params):
+        """Shows the steps (see :func:`show_steps`) and returns the payload."""
+        return show_steps(self.formulas, **steps_params)
 
-    Parameters:
-        vf: final velocity (units: m/s)
-        v_avg: average velocity (units: m/s)
-        a: acceleration (units: m/s^2)
+    def __len__(self):
+        return len(self.ids)
 
-    Usage:
+    def __iter__(self):
+        return iter(self.formulas)
 
-        result = known_vf_vavg_a(vf=400.0, v_avg=300.0, a=10.0)
+    def __getitem__(self, index):
+        return self.formulas[index]
 
-    """
-    results = dict()
-    steps = []
+    def __eq__(self, other):
+        if isinstance(other, StepTrace):
+            return self.ids == other.ids
+        if isinstance(other, (list, tuple)):
+            return list(self.formulas) == list(other)
+        return NotImplemented
 
-    # vi = v_avg * 2 - vf
-    results["vi"] = eval_initial_velocity(vf=vf, v_avg=v_avg, using="vf,v_avg")
-    vi = results.get("vi", {}).get("value")
-    steps.append(results.get("vi", {}).get("formula"))
-    if not reuse:
+    def __hash__(self):
+        return hash(self.ids)
 
-        # t = (vf - vi) / a
-        results["t"] = eval_time(vi=vi, vf=vf, a=a, using="vi,vf,a")
-        t = results.get("t", {}).get("value")
-        steps.append(results.get("t", {}).get("formula"))
+    def __repr__(self):
+        return f"StepTrace(ids={self.ids})"
 
-        # Dx = v_avg * t
-        results["Dx"] = eval_displacement(v_avg=v_avg, t=t)
-        Dx = results.get("Dx", {}).get("value")
-        steps.append(results.get("Dx", {}).get("formula"))
 
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vf_a(vi=vi, vf=vf, a=a, ndigits=ndigits), steps
+# One shared trace per solve plan.
+PLAN_TRACES: Dict[int, StepTrace] = dict((plan.mask, StepTrace(plan.formula_ids)) for plan in PLANS)
 
 
-def known_vi_Dx_t(vi: float, Dx: float, t: float, ndigits: int = 5, reuse: bool = False):
-    """Returns average-velocity (v_avg), final-velocity (vf) and acceleration (a).
+class KinematicsResult(NamedTuple):
+    """Compact, immutable result of a solve: the six parameters (unrounded)
+    and the (shared) step trace of the plan used, if requested.
 
-    Parameters:
-        vi: initial velocity (units: m/s)
-        Dx: displacement (units: m)
-        t : time (units: s)
+    Round at display time with :meth:`rounded`.
 
     Usage:
 
-        result = known_vi_Dx_t(vi=200.0, Dx=3000.0, t=10.0)
-
+        ```python
+        res = solve1D(vi=205, vf=315, t=10.0)
+        res.a               # 11.0
+        res.rounded(2)      # {'Dx': 2600.0, 'a': 11.0, ...}
+        list(res.steps)     # step formulas
+        ```
     """
-    results = dict()
-    steps = []
-
-    # v_avg = Dx / t
-    results["v_avg"] = eval_average_velocity(Dx=Dx, t=t, using="Dx,t")
-    v_avg = results.get("v_avg", {}).get("value")  # type: ignore
-    steps.append(results.get("v_avg", {}).get("formula"))
-
-    if not reuse:
-
-        # vf = v_avg * 2 - vi
-        results["vf"] = eval_final_velocity(vi=vi, v_avg=v_avg, using="vi,v_avg")
-        vf = results.get("vf", {}).get("value")
-        steps.append(results.get("vf", {}).get("formula"))
-
-        # a = (vf - vi) / t
-        results["a"] = eval_acceleration(vi=vi, vf=vf, t=t)
-        a = results.get("a", {}).get("value")
-        steps.append(results.get("a", {}).get("formula"))
-
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vi_vavg_Dx(vi=vi, v_avg=v_avg, Dx=Dx, ndigits=ndigits), steps
-
-
-def known_vf_Dx_t(vf: float, Dx: float, t: float, ndigits: int = 5, reuse: bool = False):
-    """Returns average-velocity (v_avg), initial-velocity (vi) and acceleration (a).
-
-    Parameters:
-        vf: final velocity (units: m/s)
-        Dx: displacement (units: m)
-        t : time (units: s)
-
-    Usage:
-
-        result = known_vf_Dx_t(vf=400.0, Dx=3000.0, t=10.0)
-
+    Dx: float
+    a: float
+    v_avg: float
+    vi: float
+    vf: float
+    t: float
+    steps: Optional[StepTrace] = None
+
+    def as_dict(self) -> Dict[str, float]:
+        return dict(Dx=self.Dx, a=self.a, v_avg=self.v_avg, vi=self.vi, vf=self.vf, t=self.t)
+
+    def rounded(self, ndigits: int=5) -> Dict[str, float]:
+        """Returns the parameters rounded like :func:`prepare_result`."""
+        return prepare_result(ndigits=ndigits, **self.as_dict())
+
+
+class SolveUpdate(NamedTuple):
+    """Outcome of :meth:`Kinematics1D.update`.
+
+    - ``result``: the (rounded) parameters after the update.
+    - ``changed``: ``{name: (old, new)}`` for every parameter whose (rounded)
+      value changed, inputs included.
+    - ``recomputed``: names of the equations evaluated (every equation of the
+      plan when the set of known parameters changed).
+    - ``steps``: the step trace of the plan.
+    - ``plan_changed``: whether the update switched to another solve plan (and
+      thus other step formulas).
     """
-    results = dict()
-    steps = []
-
-    # v_avg = Dx / t
-    results["v_avg"] = eval_average_velocity(Dx=Dx, t=t, using="Dx,t")
-    v_avg = results.get("v_avg", {}).get("value")  # type: ignore
-    steps.append(results.get("v_avg", {}).get("formula"))
+    result: Dict[str, float]
+    changed: Dict[str, Tuple[Optional[float], Optional[float]]]
+    recomputed: Tuple[str, ...]
+    steps: StepTrace
+    plan_changed: bool
 
-    if not reuse:
 
-        # vi = v_avg * 2 - vf
-        results["vi"] = eval_initial_velocity(vf=vf, v_avg=v_avg, using="vf,v_avg")
-        vi = results.get("vi", {}).get("value")
-        steps.append(results.get("vi", {}).get("formula"))
-
-        # a = (vf - vi) / t
-        results["a"] = eval_acceleration(vi=vi, vf=vf, t=t)
-        a = results.get("a", {}).get("value")
-        steps.append(results.get("a", {}).get("formula"))
-
-        result = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-        return prepare_result(ndigits=ndigits, **result), steps
-    else:
-        return known_vf_vavg_Dx(vf=vf, v_avg=v_avg, Dx=Dx, ndigits=ndigits), steps
-
-
-def calculate1D(
+def solve1D(
     vi:Optional[float]=None,
     vf:Optional[float]=None,
     v_avg:Optional[float]=None,
     a:Optional[float]=None,
     Dx:Optional[float]=None,
     t:Optional[float]=None,
-    ndigits: int=5):
-    """Evaluates the unknown parameters based on provided, known set of parameters.
+    steps: bool=True) -> KinematicsResult:
+    """Like :func:`calculate1D`, but returns an unrounded :class:`KinematicsResult`
+    and no per-call step list (only a reference to the plan's shared trace).
     """
     params = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
-    params = dict((k, v) for k, v in params.items() if v is not None)
-    if len(params.keys()) < 3:
-        raise ValueError("At least three appropriate parameters are necessary.")
-    if   {'vi', 'vf', 't'} - set(params.keys()) == set():
-        return known_vi_vf_t(vi=vi, vf=vf, t=t, ndigits=ndigits)
-    elif {'vi', 'vf', 'a'} - set(params.keys()) == set():
-        return known_vi_vf_a(vi=vi, vf=vf, a=a, ndigits=ndigits)
-    elif {'vi', 'vf', 'Dx'} - set(params.keys()) == set():
-        return known_vi_vf_Dx(vi=vi, vf=vf, Dx=Dx, ndigits=ndigits)
-    elif {'Dx', 'a', 't'} - set(params.keys()) == set():
-        return known_Dx_a_t(Dx=Dx, a=a, t=t, ndigits=ndigits)
-    elif {'vi', 'a', 't'} - set(params.keys()) == set():
-        return known_vi_a_t(vi=vi, a=a, t=t, ndigits=ndigits)
-    elif {'vf', 'a', 't'} - set(params.keys()) == set():
-        return known_vf_a_t(vf=vf, a=a, t=t, ndigits=ndigits)
-    elif {'vi', 'a', 'Dx'} - set(params.keys()) == set():
-        return known_vi_a_Dx(vi=vi, a=a, Dx=Dx, ndigits=ndigits)
-    elif {'vf', 'a', 'Dx'} - set(params.keys()) == set():
-        return known_vf_a_Dx(vf=vf, a=a, Dx=Dx, ndigits=ndigits)
-    elif {'vi', 'v_avg', 't'} - set(params.keys()) == set():
-        return known_vi_vavg_t(vi=vi, v_avg=v_avg, t=t, ndigits=ndigits)
-    elif {'vf', 'v_avg', 't'} - set(params.keys()) == set():
-        return known_vf_vavg_t(vf=vf, v_avg=v_avg, t=t, ndigits=ndigits)
-    elif {'vi', 'v_avg', 'a'} - set(params.keys()) == set():
-        return known_vi_vavg_a(vi=vi, v_avg=v_avg, a=a, ndigits=ndigits)
-    elif {'vf', 'v_avg', 'a'} - set(params.keys()) == set():
-        return known_vf_vavg_a(vf=vf, v_avg=v_avg, a=a, ndigits=ndigits)
-    elif {'vi', 'v_avg', 'Dx'} - set(params.keys()) == set():
-        return known_vi_vavg_Dx(vi=vi, v_avg=v_avg, Dx=Dx, ndigits=ndigits)
-    elif {'vf', 'v_avg', 'Dx'} - set(params.keys()) == set():
-        return known_vf_vavg_Dx(vf=vf, v_avg=v_avg, Dx=Dx, ndigits=ndigits)
-    elif {'vi', 'Dx', 't'} - set(params.keys()) == set():
-        return known_vi_Dx_t(vi=vi, Dx=Dx, t=t, ndigits=ndigits)
-    elif {'vf', 'Dx', 't'} - set(params.keys()) == set():
-        return known_vf_Dx_t(vf=vf, Dx=Dx, t=t, ndigits=ndigits)
-    else:
-        raise NotImplementedError()
+    plan = _evaluate(params)
+    return KinematicsResult(
+        float(params["Dx"]), float(params["a"]), float(params["v_avg"]),
+        float(params["vi"]), float(params["vf"]), float(params["t"]),
+        PLAN_TRACES[plan.mask] if steps else None,
+    )
 
 
-def show_steps(steps, as_markdown: bool=False, as_latex: bool=False, debug: bool=False):
-    # from textwrap import dedent
-    # from IPython.display import display, Markdown, Latex
-    s = r' \\' + '\n    '
-    tex = \
-    r"""
-    \begin(|equation|)
-    \begin(|aligned|)
-        {content}
-    \end(|aligned|)
-    \end(|equation|)
-    """
-    payload = dedent(tex).format(content=s.join(steps) + r" \\").replace("(|", "{").replace("|)", "}")
-    if debug:
-        print(payload)
-    if as_markdown:
-        display(Markdown(data=payload))
-    if as_latex:
-        display(Latex(data=payload))
-    return payload
+STEPS_MODES = ("eager", "lazy", "none")
+
 
 class Kinematics1D(object):
     """Kinematics1D class to calculate `Dx`, `a`, `v_avg`, `vi`, `vf`, `t` for 1D motion.
@@ -794,19 +283,195 @@ class Kinematics1D(object):
     """
     params = dict((k, None) for k in ['Dx', 'a', 'v_avg', 'vi', 'vf', 't'])
     ndigits: int = 5
+    cache: Optional[SolveCache] = None
 
-    def __init__(self, vi:Optional[float]=None, vf:Optional[float]=None, v_avg:Optional[float]=None, a:Optional[float]=None, Dx:Optional[float]=None, t:Optional[float]=None, ndigits: bool=5):
+    def __init__(self, vi:Optional[float]=None, vf:Optional[float]=None, v_avg:Optional[float]=None, a:Optional[float]=None, Dx:Optional[float]=None, t:Optional[float]=None, ndigits: bool=5, cache: Optional[SolveCache]=None):
         self.params = dict(Dx=Dx, a=a, v_avg=v_avg, vi=vi, vf=vf, t=t)
         self.ndigits = ndigits
-
-    def solve(self, showsteps: bool=True, steps_params: Dict[str, bool]=None, **kwargs):
-        if kwargs:
-            result, steps = calculate1D(ndigits=self.ndigits, **kwargs)
-            if showsteps:
-                show_steps(steps, **steps_params)
-            return result, steps
+        self.cache = cache
+        # State of :meth:`update`: the last solved (unrounded) parameters, their
+        # rounded result and the plan.
+        self._solved: Optional[Dict[str, float]] = None
+        self._result: Optional[Dict[str, float]] = None
+        self._plan: Optional[SolvePlan] = None
+
+    def solve(self, showsteps: bool=True, steps_params: Dict[str, bool]=None, steps: str="eager", **kwargs):
+        """Solves for the unknown parameters.
+
+        Parameters:
+            showsteps: build (and, per ``steps_params``, display) the
+                ``show_steps`` payload. Only used in ``"eager"`` mode.
+            steps_params: keyword arguments for :func:`show_steps`.
+            steps: ``"eager"`` returns the list of step formulas, ``"lazy"``
+                returns a :class:`StepTrace` (formulas are built on first
+                access) and ``"none"`` returns ``None`` for the steps.
+            **kwargs: parameters to solve instead of the instance's ones.
+
+        Returns ``(result, steps)``.
+        """
+        if steps not in STEPS_MODES:
+            raise ValueError(f"steps must be one of {STEPS_MODES}, got {steps!r}.")
+        params = dict(Dx=None, a=None, v_avg=None, vi=None, vf=None, t=None)
+        if set(kwargs) - set(params):
+            raise TypeError(f"Unexpected parameters: {sorted(set(kwargs) - set(params))}.")
+        params.update(kwargs if kwargs else self.params)
+        result, plan = _solve(params, ndigits=self.ndigits, cache=self.cache)
+        if steps == "none":
+            return result, None
+        if steps == "lazy":
+            return result, PLAN_TRACES[plan.mask]
+        formulas = list(PLAN_FORMULAS[plan.mask])
+        if showsteps:
+            show_steps(formulas, **(steps_params or dict()))
+        return result, formulas
+
+    def update(self, **changed) -> SolveUpdate:
+        """Changes some parameters (``None`` makes one unknown) and re-solves
+        incrementally.
+
+        While the set of known parameters stays the same, only the equations
+        of the plan that depend (directly or transitively) on the changed
+        values are re-evaluated, following the plan's dependency graph
+        (:data:`kinematics.plans.PLAN_DEPENDENTS`); the step formulas stay
+        the same. Otherwise (or on the first call) the problem is solved
+        from scratch. With a ``cache``, every update first looks up the new
+        parameters (a hit re-evaluates nothing) and stores its result. On
+        error, the instance is left unchanged.
+
+        Usage:
+
+            ```python
+            k1 = Kinematics1D(vi=205, vf=315, t=10.0)
+            k1.update()                     # first (full) solve
+            update = k1.update(t=20.0)      # re-evaluates Dx and a only
+            update.changed                  # {'Dx': (2600.0, 5200.0), 'a': (11.0, 5.5), 't': (10.0, 20.0)}
+            update.recomputed               # ('Dx_from_v_avg_t', 'a_from_vi_vf_t')
+            ```
+        """
+        if not changed.keys() <= self.params.keys():
+            raise TypeError(f"Unexpected parameters: {sorted(set(changed) - set(self.params))}.")
+        changed = dict((name, value) for name, value in changed.items() if value != self.params[name])
+        params = dict(self.params, **changed)
+        old = self._solved
+        same_known = old is not None and all(
+            (params[name] is None) == (self.params[name] is None) for name in changed
+        )
+        key = entry = None
+        if self.cache is not None:
+            key = self.cache.make_key(params, self.ndigits)
+            entry = self.cache.get(key)
+        if entry is not None:
+            result, plan, solved = dict(entry[0]), entry[1], dict(entry[2])
+            indices = ()
         else:
-            result, steps = calculate1D(ndigits=self.ndigits, **self.params)
-            if showsteps:
-                show_steps(steps, **steps_params)
-            return result, steps
+            if same_known:
+                # Only the changed inputs and the re-evaluated targets are
+                # rounded again; the rest of the last result still holds.
+                plan = self._plan
+                solved = dict(old, **changed)
+                graph = PLAN_DEPENDENTS[plan.mask]
+                if len(changed) == 1:
+                    indices = graph[next(iter(changed))]
+                else:
+                    indices = tuple(sorted(set(i for name in changed for i in graph[name])))
+                _reevaluate(solved, plan, indices)
+                result = dict(self._result)
+                for name in changed:
+                    result[name] = round(solved[name], self.ndigits)
+                for i in indices:
+                    target = plan.equations[i].target
+                    result[target] = round(solved[target], self.ndigits)
+            else:
+                solved = dict(params)
+                plan = _evaluate(solved)
+                indices = tuple(range(len(plan.equations)))
+                result = prepare_result(ndigits=self.ndigits, **solved)
+            if self.cache is not None:
+                self.cache.put(key, (dict(result), plan, dict(solved)))
+        before = self.params if old is None else self._result
+        plan_changed = plan is not self._plan
+        self.params, self._solved, self._result, self._plan = params, solved, result, plan
+        return SolveUpdate(
+            result=dict(result),
+            changed=dict((name, (before[name], result[name])) for name in result if before[name] != result[name]),
+            recomputed=tuple(plan.equations[i].name for i in indices),
+            steps=PLAN_TRACES[plan.mask],
+            plan_changed=plan_changed,
+        )
+
+    def _motion(self):
+        """Returns the solved (unrounded) ``vi``, ``a`` and ``t``."""
+        res = solve1D(**self.params, steps=False)
+        return res.vi, res.a, res.t
+
+    def trajectory(self, n_points: int=200):
+        """Returns the position and velocity over ``[0, t]`` as a
+        :class:`kinematics.trajectory.Trajectory` of ``n_points`` samples.
+
+        Usage:
+
+            ```python
+            traj = Kinematics1D(vi=205, vf=315, t=10.0).trajectory(1000)
+            traj.time, traj.x, traj.v
+            ```
+        """
+        from .trajectory import trajectory
+        vi, a, t = self._motion()
+        return trajectory(vi=vi, a=a, t=t, n_points=n_points)
+
+    def iter_trajectory(self, n_points: int, chunk_size: int=100000):
+        """Like :meth:`trajectory`, but yields chunks of at most ``chunk_size``
+        samples (bounded memory for very large ``n_points``).
+        """
+        from .trajectory import iter_trajectory
+        vi, a, t = self._motion()
+        return iter_trajectory(vi=vi, a=a, t=t, n_points=n_points, chunk_size=chunk_size)
+
+    def uncertainty(self, n_samples: int=100000, seed: Optional[int]=None, **distributions):
+        """Monte Carlo uncertainty of the solve: known parameters given as
+        distributions (``kinematics.uncertainty.Normal``, ``Uniform``) replace
+        the instance's values. Returns a
+        :class:`kinematics.uncertainty.UncertaintyResult`.
+
+        Usage:
+
+            ```python
+            k1 = Kinematics1D(vi=205, vf=315, t=10.0)
+            res = k1.uncertainty(vi=Normal(205, 2), t=Normal(10.0, 0.1), seed=0)
+            res.mean["a"], res.std["a"]
+            ```
+        """
+        from .uncertainty import propagate
+        return propagate(dict(self.params, **distributions), n_samples=n_samples, seed=seed)
+
+    def sweep(self, **axes):
+        """Solves the problem over a grid of one or two swept parameters (in
+        one vectorized pass) and returns a :class:`kinematics.sweep.SweepResult`.
+        The other known parameters stay fixed.
+
+        Usage:
+
+            ```python
+            grid = Kinematics1D(vi=205, vf=315).sweep(a=np.linspace(1, 20, 50))
+            grid.values["t"]    # t for each a
+            ```
+        """
+        from .sweep import sweep
+        return sweep(self.params, axes, ndigits=self.ndigits)
+
+    def design(self, objective: str, sense: str="min", constraints=None, grid: int=201, **free):
+        """Inverse design: the values of the free parameters (given as
+        ``name=(low, high)`` ranges) that minimize or maximize ``objective``
+        under ``constraints``, the instance's other known parameters staying
+        fixed. Returns a :class:`kinematics.inverse.DesignResult`.
+
+        Usage:
+
+            ```python
+            k1 = Kinematics1D(vi=5, Dx=500)
+            res = k1.design("a", constraints=dict(t=(None, 12)), a=(0, 20))
+            res.known["a"], res.steps
+            ```
+        """
+        from .inverse import design
+        return design(objective, free, fixed=self.params, constraints=constraints, sense=sense, grid=grid)
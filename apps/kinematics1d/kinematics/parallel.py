@@ -0,0 +1,69 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import shared_memory
+from typing import Dict, Mapping, Optional
+
+from .batch import solve_columns
+from .plans import PARAMS
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attaches to an existing block. The creating process owns (and unlinks)
+    it; pool workers share its resource tracker, so the registration done by
+    older Pythons on attach is a no-op.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        return shared_memory.SharedMemory(name=name)
+
+
+def _solve_slice(name: str, n: int, start: int, stop: int) -> int:
+    """Worker: solves rows ``[start, stop)`` of the shared block in place."""
+    shm = _attach(name)
+    try:
+        block = np.ndarray((len(PARAMS), n), dtype=np.float64, buffer=shm.buf)
+        columns = dict((param, block[i, start:stop]) for i, param in enumerate(PARAMS))
+        solve_columns(columns)
+        del block, columns
+    finally:
+        shm.close()
+    return stop - start
+
+
+def solve_parallel(columns: Mapping[str, np.ndarray], workers: Optional[int]=None, chunks: Optional[int]=None) -> Dict[str, np.ndarray]:
+    """Solves flat float columns with a pool of ``workers`` processes.
+
+    The columns are copied once into a shared-memory block; each worker solves
+    a contiguous chunk of rows in place, so no array is pickled, and the
+    results come back in input order.
+
+    Parameters:
+        columns: flat float64 columns for every name in ``PARAMS``.
+        workers: number of processes (default: ``os.cpu_count()``).
+        chunks: number of chunks (default: ``4 * workers``).
+
+    Returns new solved columns (rows without a solve plan are left as given).
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = chunks or 4 * workers
+    n = len(columns[PARAMS[0]])
+    if n == 0:
+        return dict((name, np.array(columns[name], dtype=np.float64)) for name in PARAMS)
+    bounds = np.linspace(0, n, num=min(chunks, n) + 1, dtype=np.int64).tolist()
+
+    shm = shared_memory.SharedMemory(create=True, size=len(PARAMS) * n * 8)
+    try:
+        block = np.ndarray((len(PARAMS), n), dtype=np.float64, buffer=shm.buf)
+        for i, name in enumerate(PARAMS):
+            block[i] = columns[name]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_solve_slice, repeat(shm.name), repeat(n), bounds[:-1], bounds[1:]))
+        result = dict((name, block[i].copy()) for i, name in enumerate(PARAMS))
+        del block
+    finally:
+        shm.close()
+        shm.unlink()
+    return result
@@ -0,0 +1,256 @@
+import math
+from operator import itemgetter
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+# Order of the parameters in a result (and of the bits of a known-mask).
+PARAMS = ("Dx", "a", "v_avg", "vi", "vf", "t")
+PARAM_BITS = dict((name, 1 << i) for i, name in enumerate(PARAMS))
+
+
+class Equation(NamedTuple):
+    """One node of a solve plan: ``target = func(*inputs)``."""
+    name: str
+    target: str
+    inputs: Tuple[str, ...]
+    func: Callable
+    formula: str
+
+    def getter(self) -> Callable:
+        return itemgetter(*self.inputs)
+
+
+class SolvePlan(NamedTuple):
+    """Ordered equations that evaluate the unknowns from a set of knowns."""
+    name: str
+    known: FrozenSet[str]
+    mask: int
+    equations: Tuple[Equation, ...]
+    formula_ids: Tuple[int, ...]
+
+
+def known_mask(names: Iterable[str]) -> int:
+    """Returns the bitmask of a set of parameter names."""
+    mask = 0
+    for name in names:
+        mask |= PARAM_BITS[name]
+    return mask
+
+
+def _sqrt(x: float) -> float:
+    """Scalar square root, NaN for a negative argument (as ``np.sqrt``)."""
+    return math.sqrt(x) if x >= 0 else math.nan
+
+
+def _final_velocity_root(vi, a, Dx, sqrt: Callable=_sqrt):
+    """``vf^2 = vi^2 + 2 a Dx``; NaN when the discriminant is negative (the
+    motion never reaches ``Dx``). See :mod:`kinematics.quadratic` for both roots.
+
+    The root takes the sign that agrees with the acceleration. Written with
+    operators only, so that it also evaluates whole arrays when given
+    ``sqrt=np.sqrt`` (see :mod:`kinematics.batch`).
+    """
+    vf = sqrt(vi * vi + 2 * a * Dx)
+    flip = ((a > 0) & (vf < vi)) | ((a < 0) & (vf > vi))
+    return vf * (1 - 2 * flip)
+
+
+def _initial_velocity_root(vf, a, Dx, sqrt: Callable=_sqrt):
+    """``vi^2 = vf^2 - 2 a Dx``; NaN when the discriminant is negative. Like
+    :func:`_final_velocity_root`, it also evaluates arrays.
+    """
+    vi = sqrt(vf * vf - 2 * a * Dx)
+    flip = ((a > 0) & (vf < vi)) | ((a < 0) & (vf > vi))
+    return vi * (1 - 2 * flip)
+
+
+## Equation nodes
+v_avg_from_vi_vf = Equation(
+    "v_avg_from_vi_vf", "v_avg", ("vi", "vf"),
+    lambda vi, vf: 0.5 * (vi + vf),
+    r"v_{avg} &= \frac{\left( v_{i} + v_{f} \right)}{2}")
+v_avg_from_Dx_t = Equation(
+    "v_avg_from_Dx_t", "v_avg", ("Dx", "t"),
+    lambda Dx, t: Dx / t,
+    r"v_{avg} &= \frac{\Delta x}{t}")
+Dx_from_v_avg_t = Equation(
+    "Dx_from_v_avg_t", "Dx", ("v_avg", "t"),
+    lambda v_avg, t: v_avg * t,
+    r"\Delta x &= v_{avg} t")
+a_from_vi_vf_t = Equation(
+    "a_from_vi_vf_t", "a", ("vi", "vf", "t"),
+    lambda vi, vf, t: (vf - vi) / t,
+    r"a &= \frac{\left( v_{f} - v_{i} \right)}{t}")
+vi_from_v_avg_a_t = Equation(
+    "vi_from_v_avg_a_t", "vi", ("v_avg", "a", "t"),
+    lambda v_avg, a, t: v_avg - 0.5 * a * t,
+    r"v_{i} &= v_{avg} - \frac{1}{2} a t")
+vi_from_vf_a_t = Equation(
+    "vi_from_vf_a_t", "vi", ("vf", "a", "t"),
+    lambda vf, a, t: vf - a * t,
+    r"v_{i} &= v_{f} - a t")
+vi_from_vf_a_Dx = Equation(
+    "vi_from_vf_a_Dx", "vi", ("vf", "a", "Dx"),
+    _initial_velocity_root,
+    r"v_{i}^{2} &= v_{f}^{2} - 2 a \Delta x")
+vi_from_vf_v_avg = Equation(
+    "vi_from_vf_v_avg", "vi", ("vf", "v_avg"),
+    lambda vf, v_avg: v_avg * 2 - vf,
+    r"v_{i} &= 2 v_{avg} - v_{f}")
+vf_from_v_avg_a_t = Equation(
+    "vf_from_v_avg_a_t", "vf", ("v_avg", "a", "t"),
+    lambda v_avg, a, t: v_avg + 0.5 * a * t,
+    r"v_{f} &= v_{avg} + \frac{1}{2} a t")
+vf_from_vi_a_t = Equation(
+    "vf_from_vi_a_t", "vf", ("vi", "a", "t"),
+    lambda vi, a, t: vi + a * t,
+    r"v_{f} &= v_{i} + a t")
+vf_from_vi_a_Dx = Equation(
+    "vf_from_vi_a_Dx", "vf", ("vi", "a", "Dx"),
+    _final_velocity_root,
+    r"v_{f}^{2} &= v_{i}^{2} + 2 a \Delta x")
+vf_from_vi_v_avg = Equation(
+    "vf_from_vi_v_avg", "vf", ("vi", "v_avg"),
+    lambda vi, v_avg: v_avg * 2 - vi,
+    r"v_{f} &= 2 v_{avg} - v_{i}")
+t_from_vi_vf_a = Equation(
+    "t_from_vi_vf_a", "t", ("vi", "vf", "a"),
+    lambda vi, vf, a: (vf - vi) / a,
+    r"t &= \frac{\left( v_{f} - v_{i} \right)}{a}")
+t_from_Dx_v_avg = Equation(
+    "t_from_Dx_v_avg", "t", ("Dx", "v_avg"),
+    lambda Dx, v_avg: Dx / v_avg,
+    r"t &= \frac{\Delta x}{v_{avg}}")
+
+
+EQUATIONS: Tuple[Equation, ...] = (
+    v_avg_from_vi_vf, v_avg_from_Dx_t, Dx_from_v_avg_t, a_from_vi_vf_t,
+    vi_from_v_avg_a_t, vi_from_vf_a_t, vi_from_vf_a_Dx, vi_from_vf_v_avg,
+    vf_from_v_avg_a_t, vf_from_vi_a_t, vf_from_vi_a_Dx, vf_from_vi_v_avg,
+    t_from_vi_vf_a, t_from_Dx_v_avg,
+)
+
+# Interned formula catalog: every step formula gets a small integer id.
+FORMULAS: Tuple[str, ...] = tuple(eq.formula for eq in EQUATIONS)
+FORMULA_IDS: Dict[str, int] = dict((formula, i) for i, formula in enumerate(FORMULAS))
+
+
+def formula_id(formula: str) -> int:
+    """Returns the catalog id of a step formula."""
+    return FORMULA_IDS[formula]
+
+
+def _plan(name: str, known: Tuple[str, ...], *equations: Equation) -> SolvePlan:
+    return SolvePlan(
+        name=name,
+        known=frozenset(known),
+        mask=known_mask(known),
+        equations=equations,
+        formula_ids=tuple(FORMULA_IDS[eq.formula] for eq in equations),
+    )
+
+
+# Base plans, in priority order (the order of the former ``calculate1D``
+# ``if/elif`` chain): when more than three parameters are known, the first
+# plan whose known-set is covered wins.
+PLANS: Tuple[SolvePlan, ...] = (
+    _plan("known_vi_vf_t", ("vi", "vf", "t"), v_avg_from_vi_vf, Dx_from_v_avg_t, a_from_vi_vf_t),
+    _plan("known_vi_vf_a", ("vi", "vf", "a"), t_from_vi_vf_a, v_avg_from_vi_vf, Dx_from_v_avg_t),
+    _plan("known_vi_vf_Dx", ("vi", "vf", "Dx"), v_avg_from_vi_vf, t_from_Dx_v_avg, a_from_vi_vf_t),
+    _plan("known_Dx_a_t", ("Dx", "a", "t"), v_avg_from_Dx_t, vf_from_v_avg_a_t, vi_from_v_avg_a_t),
+    _plan("known_vi_a_t", ("vi", "a", "t"), vf_from_vi_a_t, v_avg_from_vi_vf, Dx_from_v_avg_t),
+    _plan("known_vf_a_t", ("vf", "a", "t"), vi_from_vf_a_t, v_avg_from_vi_vf, Dx_from_v_avg_t),
+    _plan("known_vi_a_Dx", ("vi", "a", "Dx"), vf_from_vi_a_Dx, v_avg_from_vi_vf, t_from_Dx_v_avg),
+    _plan("known_vf_a_Dx", ("vf", "a", "Dx"), vi_from_vf_a_Dx, v_avg_from_vi_vf, t_from_Dx_v_avg),
+    _plan("known_vi_vavg_t", ("vi", "v_avg", "t"), vf_from_vi_v_avg, a_from_vi_vf_t, Dx_from_v_avg_t),
+    _plan("known_vf_vavg_t", ("vf", "v_avg", "t"), vi_from_vf_v_avg, a_from_vi_vf_t, Dx_from_v_avg_t),
+    _plan("known_vi_vavg_a", ("vi", "v_avg", "a"), vf_from_vi_v_avg, t_from_vi_vf_a, Dx_from_v_avg_t),
+    _plan("known_vf_vavg_a", ("vf", "v_avg", "a"), vi_from_vf_v_avg, t_from_vi_vf_a, Dx_from_v_avg_t),
+    _plan("known_vi_vavg_Dx", ("vi", "v_avg", "Dx"), vf_from_vi_v_avg, t_from_Dx_v_avg, a_from_vi_vf_t),
+    _plan("known_vf_vavg_Dx", ("vf", "v_avg", "Dx"), vi_from_vf_v_avg, t_from_Dx_v_avg, a_from_vi_vf_t),
+    _plan("known_vi_Dx_t", ("vi", "Dx", "t"), v_avg_from_Dx_t, vf_from_vi_v_avg, a_from_vi_vf_t),
+    _plan("known_vf_Dx_t", ("vf", "Dx", "t"), v_avg_from_Dx_t, vi_from_vf_v_avg, a_from_vi_vf_t),
+    _plan("known_a_vavg_t", ("a", "v_avg", "t"), vi_from_v_avg_a_t, vf_from_v_avg_a_t, Dx_from_v_avg_t),
+    _plan("known_Dx_a_vavg", ("Dx", "a", "v_avg"), t_from_Dx_v_avg, vi_from_v_avg_a_t, vf_from_v_avg_a_t),
+)
+
+# The known triples that are not independent (one parameter follows from the
+# other two), with their relation: they cannot determine the motion. With the
+# plans above, they are the only sets of three or more knowns without a plan.
+DEPENDENT_SETS: Dict[FrozenSet[str], str] = {
+    frozenset(("Dx", "v_avg", "t")): "Dx = v_avg t",
+    frozenset(("vi", "vf", "v_avg")): "v_avg = (vi + vf) / 2",
+}
+DEPENDENT_MASKS: Dict[int, str] = dict((known_mask(known), relation) for known, relation in DEPENDENT_SETS.items())
+
+
+def _build_registry() -> Dict[int, SolvePlan]:
+    registry = dict()
+    for mask in range(1 << len(PARAMS)):
+        plan = next((plan for plan in PLANS if plan.mask & mask == plan.mask), None)
+        if plan is not None:
+            registry[mask] = plan
+    return registry
+
+
+# Every known-mask (including those with more than three knowns) mapped to its
+# plan, so that dispatch is a single dict lookup.
+SOLVE_PLANS: Dict[int, SolvePlan] = _build_registry()
+
+# Precompiled ``(target, func, getter)`` steps of every plan.
+COMPILED_PLANS: Dict[int, Tuple[Tuple[str, Callable, Callable], ...]] = dict(
+    (plan.mask, tuple((eq.target, eq.func, eq.getter()) for eq in plan.equations))
+    for plan in PLANS
+)
+
+# Step formulas of every plan.
+PLAN_FORMULAS: Dict[int, Tuple[str, ...]] = dict(
+    (plan.mask, tuple(eq.formula for eq in plan.equations)) for plan in PLANS
+)
+
+# Small integer id of every plan (its index in ``PLANS``), so that a batch can
+# carry one byte per row instead of its list of step formulas. ``NO_PLAN``
+# marks the rows without a plan.
+PLAN_IDS: Dict[int, int] = dict((plan.mask, i) for i, plan in enumerate(PLANS))
+NO_PLAN = 255
+
+
+
+def _dependents(equations: Tuple[Equation, ...]) -> Dict[str, Tuple[int, ...]]:
+    """For each parameter, the indices (in plan order) of the equations to
+    re-evaluate when its value changes: the equations that read it, directly
+    or through another target, and the one that overwrites it, if any.
+    """
+    graph = dict()
+    for name in PARAMS:
+        dirty = {name}
+        indices = []
+        for i, eq in enumerate(equations):
+            if eq.target == name or dirty.intersection(eq.inputs):
+                indices.append(i)
+                dirty.add(eq.target)
+        graph[name] = tuple(indices)
+    return graph
+
+
+# Dependency graph of every plan: ``PLAN_DEPENDENTS[mask][name]``.
+PLAN_DEPENDENTS: Dict[int, Dict[str, Tuple[int, ...]]] = dict(
+    (plan.mask, _dependents(plan.equations)) for plan in PLANS
+)
+
+
+def get_plan(known: Iterable[str]) -> Optional[SolvePlan]:
+    """Returns the plan used for a set of known parameters (``None`` if the
+    set has no implementation).
+
+    Usage:
+
+        plan = get_plan({"vi", "vf", "t"})
+        [eq.target for eq in plan.equations]  # ['v_avg', 'Dx', 'a']
+
+    """
+    return SOLVE_PLANS.get(known_mask(known))
+
+
+def supported_known_sets() -> List[FrozenSet[str]]:
+    """Lists the known-parameter sets with a solve plan (in priority order)."""
+    return [plan.known for plan in PLANS]
@@ -0,0 +1,135 @@
+import numpy as np
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Mapping, NamedTuple, Optional, Tuple
+
+from .batch import calculate1D_batch, known_pattern, plan_ids
+from .plans import PARAMS, SOLVE_PLANS, known_mask, supported_known_sets
+
+# Default sampling ranges of the motions: ``(low, high)``.
+DEFAULT_RANGES = dict(vi=(-30.0, 30.0), a=(-10.0, 10.0), t=(0.5, 20.0))
+
+QUESTION_FIELDS = ("row",) + PARAMS
+ANSWER_FIELDS = tuple(f"{name}_answer" for name in PARAMS)
+
+
+class ProblemChunk(NamedTuple):
+    """A chunk of generated problems, rows ``start`` to ``start + len(plan)``.
+
+    ``question`` holds the parameter columns shown (NaN for the hidden ones),
+    ``answer`` the full solution of every row and ``plan`` the ``uint8`` plan
+    id of its known set (see :func:`kinematics.batch.expand_steps` for the
+    worked steps).
+    """
+    start: int
+    question: Dict[str, np.ndarray]
+    answer: Dict[str, np.ndarray]
+    plan: np.ndarray
+
+
+def _known_masks(known_sets: Optional[Iterable[Iterable[str]]]) -> np.ndarray:
+    sets = supported_known_sets() if known_sets is None else [frozenset(known) for known in known_sets]
+    masks = []
+    for known in sets:
+        mask = known_mask(known)
+        if mask not in SOLVE_PLANS:
+            raise ValueError(f"The known set {sorted(known)} has no solve plan.")
+        masks.append(mask)
+    if not masks:
+        raise ValueError("At least one known set is necessary.")
+    return np.array(masks, dtype=np.uint8)
+
+
+def _draw(rng: np.random.Generator, n: int, ranges: Mapping[str, Tuple[float, float]], masks: np.ndarray, ndigits: Optional[int]):
+    """Draws ``n`` motions and a known set per row, and solves the shown
+    knowns in bulk; returns the valid rows only.
+    """
+    vi = rng.uniform(*ranges["vi"], n)
+    a = rng.uniform(*ranges["a"], n)
+    t = rng.uniform(*ranges["t"], n)
+    vf = vi + a * t
+    truth = dict(Dx=0.5 * (vi + vf) * t, a=a, v_avg=0.5 * (vi + vf), vi=vi, vf=vf, t=t)
+    shown = masks[rng.integers(0, len(masks), n)]
+
+    question = dict()
+    for i, name in enumerate(PARAMS):
+        values = truth[name] if ndigits is None else np.round(truth[name], ndigits)
+        question[name] = np.where((shown >> i) & 1, values, np.nan)
+    answer = calculate1D_batch(question, ndigits=None, errors="coerce")
+    # Only keep rows whose (rounded) knowns still describe a forward motion.
+    valid = np.logical_and.reduce([np.isfinite(answer[name]) for name in PARAMS]) & (answer["t"] > 0)
+    return (
+        dict((name, column[valid]) for name, column in question.items()),
+        dict((name, column[valid]) for name, column in answer.items()),
+    )
+
+
+def generate_problems(
+        n: int,
+        seed: Optional[int]=None,
+        chunk_size: int=100000,
+        ranges: Optional[Mapping[str, Tuple[float, float]]]=None,
+        known_sets: Optional[Iterable[FrozenSet[str]]]=None,
+        ndigits: Optional[int]=2,
+    ) -> Iterator[ProblemChunk]:
+    """Generates ``n`` consistent practice problems, ``chunk_size`` at a time.
+
+    Each row samples a motion (``vi``, ``a``, ``t`` uniform over ``ranges``,
+    the rest derived), picks the known set shown (uniformly among
+    ``known_sets``, default: every set with a plan) and rounds the shown
+    knowns to ``ndigits``. The hidden answers are solved from the shown
+    knowns in bulk; rows that would not solve to a finite motion with
+    ``t > 0`` are redrawn. Memory is bounded by the chunk size.
+
+    Chunk ``i`` draws from its own generator, spawned from ``seed`` with
+    ``np.random.SeedSequence``: the same ``seed`` and ``chunk_size`` give the
+    same problems.
+
+    Usage:
+
+        for chunk in generate_problems(10**7, seed=0, chunk_size=10**6):
+            chunk.question["vi"], chunk.answer["a"]
+
+    """
+    if n < 0 or chunk_size < 1:
+        raise ValueError("n must be non-negative and chunk_size at least 1.")
+    ranges = dict(DEFAULT_RANGES, **(ranges or dict()))
+    unexpected = set(ranges) - set(DEFAULT_RANGES)
+    if unexpected:
+        raise ValueError(f"Ranges can only be given for {sorted(DEFAULT_RANGES)}, got {sorted(unexpected)}.")
+    masks = _known_masks(known_sets)
+    n_chunks = -(-n // chunk_size)
+    for i, child in enumerate(np.random.SeedSequence(seed).spawn(n_chunks)):
+        rng = np.random.default_rng(child)
+        size = min(chunk_size, n - i * chunk_size)
+        questions, answers, count = [], [], 0
+        while count < size:
+            question, answer = _draw(rng, size - count + max(16, (size - count) // 16), ranges, masks, ndigits)
+            questions.append(question)
+            answers.append(answer)
+            count += len(question["t"])
+            if count == 0 and len(questions) >= 10:
+                raise ValueError("The ranges do not produce any solvable problem.")
+        question = dict((name, np.concatenate([q[name] for q in questions])[:size]) for name in PARAMS)
+        answer = dict((name, np.concatenate([a[name] for a in answers])[:size]) for name in PARAMS)
+        yield ProblemChunk(i * chunk_size, question, answer, plan_ids(known_pattern(question)))
+
+
+def write_problems(path: str, n: int, seed: Optional[int]=None, chunk_size: int=100000, **options: Any) -> int:
+    """Writes ``n`` generated problems (see :func:`generate_problems`) to a
+    CSV or Parquet file, chunk by chunk: the ``row`` number, the shown
+    parameters (empty when hidden) and the ``<name>_answer`` columns.
+    Returns the number of rows written.
+    """
+    from .stream import open_writer
+
+    writer = open_writer(path, QUESTION_FIELDS + ANSWER_FIELDS)
+    rows = 0
+    try:
+        for chunk in generate_problems(n, seed=seed, chunk_size=chunk_size, **options):
+            columns = dict(chunk.question)
+            columns["row"] = np.arange(chunk.start, chunk.start + len(chunk.plan), dtype=np.int64)
+            columns.update((f"{name}_answer", column) for name, column in chunk.answer.items())
+            writer.write(columns)
+            rows += len(chunk.plan)
+    finally:
+        writer.close()
+    return rows
@@ -0,0 +1,171 @@
+import numpy as np
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+
+from .batch import DEPENDENT, KNOWN_COUNT, SOLVABLE, broadcast_columns, known_pattern, round_column, solve_columns
+from .plans import PARAMS, SOLVE_PLANS
+
+# Bits of ``BranchSolution.flags``.
+FLAG_INSUFFICIENT = 1   # fewer than three known parameters
+FLAG_DEPENDENT = 2      # the known parameters are not independent
+FLAG_LINEAR = 4         # quadratic row with a == 0 (a single, linear root)
+FLAG_NO_REAL_ROOT = 8   # negative discriminant: the motion never reaches Dx
+FLAG_NO_PHYSICAL = 16   # real roots, but no positive time
+FLAG_NOT_FINITE = 32    # the solve produced a non-finite value (e.g. division by zero)
+
+
+class QuadraticRoots(NamedTuple):
+    """Real roots of ``a x^2 + b x + c = 0``, element-wise: ``low <= high``
+    (equal for a double or a linear root), NaN where ``real`` is False.
+    ``linear`` marks the rows where ``a == 0``.
+    """
+    low: np.ndarray
+    high: np.ndarray
+    real: np.ndarray
+    linear: np.ndarray
+
+
+def solve_quadratic(a: Any, b: Any, c: Any) -> QuadraticRoots:
+    """Vectorized, numerically stable real roots of ``a x^2 + b x + c = 0``.
+
+    Uses ``q = -(b + sign(b) sqrt(b^2 - 4ac)) / 2``, ``x = q / a, c / q`` (no
+    cancellation when ``b^2 >> 4ac``). Negative discriminants and the
+    degenerate ``a == b == 0`` give NaN roots (never an exception); ``a == 0``
+    falls back to the linear root ``-c / b``.
+
+    Usage:
+
+        roots = solve_quadratic(1.0, [-3.0, 0.0], [2.0, 1.0])
+        roots.low, roots.high, roots.real   # [1., nan], [2., nan], [True, False]
+
+    """
+    a, b, c = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (a, b, c)))
+    with np.errstate(all="ignore"):
+        discriminant = b * b - 4.0 * a * c
+        linear = a == 0
+        sign = np.where(b < 0, -1.0, 1.0)
+        q = -0.5 * (b + sign * np.sqrt(discriminant))
+        x1 = q / a
+        x2 = np.where(q == 0, x1, c / q)
+        linear_root = -c / b
+        low = np.where(linear, linear_root, np.minimum(x1, x2))
+        high = np.where(linear, linear_root, np.maximum(x1, x2))
+    real = np.where(linear, b != 0, discriminant >= 0) & np.isfinite(low) & np.isfinite(high)
+    return QuadraticRoots(
+        low=np.where(real, low, np.nan),
+        high=np.where(real, high, np.nan),
+        real=real,
+        linear=linear,
+    )
+
+
+class BranchSolution(NamedTuple):
+    """Both physical solutions of every row.
+
+    ``first`` is the solution with the earliest positive time and ``second``
+    the other one, if any (NaN otherwise): a motion through ``Dx`` with a
+    known ``a`` and one known velocity can reach ``Dx`` twice. Rows solved
+    without the quadratic (every other known set) only have a ``first``
+    branch. ``has_first``/``has_second`` mark the rows where a branch is
+    finite, ``quadratic`` those solved through the quadratic, and ``flags``
+    holds the ``FLAG_*`` bits explaining the missing solutions.
+    """
+    first: Dict[str, np.ndarray]
+    second: Dict[str, np.ndarray]
+    has_first: np.ndarray
+    has_second: np.ndarray
+    quadratic: np.ndarray
+    flags: np.ndarray
+
+
+# Plans whose unknowns follow from a quadratic in t, with their known velocity:
+# Dx = vi t + a t^2 / 2 (vi known) or Dx = vf t - a t^2 / 2 (vf known).
+QUADRATIC_PLANS = dict(known_vi_a_Dx="vi", known_vf_a_Dx="vf")
+
+# Known velocity of the quadratic plan of every known-mask ("" for the others).
+_QUADRATIC_VELOCITY = np.array([
+    QUADRATIC_PLANS.get(SOLVE_PLANS[mask].name, "") if mask in SOLVE_PLANS else ""
+    for mask in range(1 << len(PARAMS))
+])
+
+
+def _time_branches(v: np.ndarray, a: np.ndarray, Dx: np.ndarray, velocity: str):
+    """Both positive-time solutions of ``Dx = v t +- a t^2 / 2`` (``+`` when
+    ``v`` is ``vi``, ``-`` when it is ``vf``), and the ``FLAG_*`` bits.
+    """
+    sign = 1.0 if velocity == "vi" else -1.0
+    roots = solve_quadratic(0.5 * a, sign * v, -sign * Dx)
+    low_ok = roots.real & (roots.low > 0)
+    high_ok = roots.real & (roots.high > 0) & (roots.high > roots.low)
+    t1 = np.where(low_ok, roots.low, np.where(high_ok, roots.high, np.nan))
+    t2 = np.where(low_ok & high_ok, roots.high, np.nan)
+    flags = np.where(roots.linear, FLAG_LINEAR, 0)
+    flags |= np.where(~roots.real & ~roots.linear, FLAG_NO_REAL_ROOT, 0)
+    flags |= np.where(roots.real & ~low_ok & ~high_ok, FLAG_NO_PHYSICAL, 0)
+
+    other = "vf" if velocity == "vi" else "vi"
+    branches = []
+    for t in (t1, t2):
+        w = v + sign * a * t
+        branches.append({"Dx": Dx, "a": a, "t": t, velocity: v, other: w, "v_avg": 0.5 * (v + w)})
+    return branches, flags.astype(np.uint8)
+
+
+def calculate1D_branches(data: Optional[Mapping[str, Any]]=None, ndigits: Optional[int]=None, **kwargs) -> BranchSolution:
+    """Vectorized solve of any mix of known sets that never raises: every
+    row gets its physical solution(s), or NaN and flags.
+
+    Rows solved by the ``(vi, a, Dx)`` or ``(vf, a, Dx)`` plans go through
+    the quadratic in ``t`` (see :func:`solve_quadratic`), so both roots with
+    a positive time are returned, instead of the one picked by the sign
+    heuristic of :func:`kinematics.batch.calculate1D_batch`. Other rows are
+    solved as by ``calculate1D_batch``; rows with too few or dependent known
+    parameters are NaN and flagged.
+
+    Parameters:
+        data, **kwargs: the input columns, as for ``calculate1D_batch``.
+        ndigits: digits to round the results to (``None``: no rounding).
+
+    Usage:
+
+        res = calculate1D_branches(vi=10.0, a=-2.0, Dx=9.0)
+        res.first["t"], res.second["t"]     # 1.0, 9.0 (passes x = 9 twice)
+
+    """
+    inputs, shape = broadcast_columns(data, **kwargs)
+    pattern = known_pattern(inputs)
+    first = dict((name, column.copy()) for name, column in inputs.items())
+    solve_columns(first, pattern)
+    second = dict((name, np.full(pattern.shape, np.nan)) for name in PARAMS)
+
+    flags = np.zeros(pattern.shape, dtype=np.uint8)
+    flags[KNOWN_COUNT[pattern] < 3] |= FLAG_INSUFFICIENT
+    flags[DEPENDENT[pattern]] |= FLAG_DEPENDENT
+    velocities = _QUADRATIC_VELOCITY[pattern]
+    quadratic = velocities != ""
+    with np.errstate(all="ignore"):
+        for velocity in ("vi", "vf"):
+            rows = np.flatnonzero(velocities == velocity)
+            if not len(rows):
+                continue
+            v, a, Dx = (inputs[name][rows] for name in (velocity, "a", "Dx"))
+            branches, row_flags = _time_branches(v, a, Dx, velocity)
+            for target, branch in zip((first, second), branches):
+                for name in PARAMS:
+                    target[name][rows] = branch[name]
+            flags[rows] |= row_flags
+
+    has_first = np.logical_and.reduce([np.isfinite(first[name]) for name in PARAMS])
+    has_second = np.logical_and.reduce([np.isfinite(second[name]) for name in PARAMS])
+    explained = (flags & (FLAG_NO_REAL_ROOT | FLAG_NO_PHYSICAL)) != 0
+    flags[SOLVABLE[pattern] & ~has_first & ~explained] |= FLAG_NOT_FINITE
+    if ndigits is not None:
+        first = dict((name, round_column(column, ndigits)) for name, column in first.items())
+        second = dict((name, round_column(column, ndigits)) for name, column in second.items())
+    return BranchSolution(
+        first=dict((name, column.reshape(shape)) for name, column in first.items()),
+        second=dict((name, column.reshape(shape)) for name, column in second.items()),
+        has_first=has_first.reshape(shape),
+        has_second=has_second.reshape(shape),
+        quadratic=quadratic.reshape(shape),
+        flags=flags.reshape(shape),
+    )
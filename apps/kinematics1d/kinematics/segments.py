@@ -0,0 +1,111 @@
+import numpy as np
+from typing import Any, Dict
+
+from .batch import to_recarray
+from .trajectory import Trajectory
+
+
+class PiecewiseMotion(object):
+    """Motion made of consecutive constant-acceleration segments
+    (e.g. accelerate, cruise, brake).
+
+    Segment ``k`` has acceleration ``a[k]`` and duration ``t[k]``; its initial
+    velocity is the final velocity of segment ``k - 1`` (``vi`` for the first
+    one). All segments are solved at once: velocities, boundary times and
+    boundary positions are cumulative sums, so the cost is linear in the
+    number of segments with no Python loop. Position and velocity at any time
+    are then found with a binary search over the segment boundaries.
+
+    Parameters:
+        a: accelerations of the segments (units: m/s^2).
+        t: durations of the segments (units: s, positive).
+        vi: initial velocity of the first segment (units: m/s).
+        x0: initial position (units: m).
+
+    Usage:
+
+        ```python
+        route = PiecewiseMotion(a=[2.0, 0.0, -4.0], t=[10.0, 60.0, 5.0])
+        route.position([5.0, 42.0])     # array([ 25., 740.])
+        route.segments.vf               # array([20., 20.,  0.])
+        ```
+    """
+
+    def __init__(self, a: Any, t: Any, vi: float=0.0, x0: float=0.0):
+        a = np.asarray(a, dtype=np.float64).ravel()
+        t = np.asarray(t, dtype=np.float64).ravel()
+        if a.shape != t.shape:
+            raise ValueError(f"a and t must have the same length, got {len(a)} and {len(t)}.")
+        if not len(t):
+            raise ValueError("At least one segment is necessary.")
+        if not (t > 0).all():
+            raise ValueError("The durations (t) of all segments must be positive.")
+        dv = a * t
+        vf = vi + np.cumsum(dv)
+        v_start = vf - dv
+        Dx = t * (v_start + 0.5 * dv)
+        self.x0 = float(x0)
+        self.a = a
+        self.vi = v_start
+        self.vf = vf
+        self.Dx = Dx
+        # n + 1 boundaries: start time / position of every segment, then the end.
+        self.boundaries = np.concatenate(([0.0], np.cumsum(t)))
+        self.positions = np.concatenate(([0.0], np.cumsum(Dx))) + self.x0
+
+    def __len__(self):
+        return len(self.a)
+
+    @property
+    def duration(self) -> float:
+        return float(self.boundaries[-1])
+
+    @property
+    def segments(self) -> np.recarray:
+        """Per-segment ``Dx, a, v_avg, vi, vf, t`` (a record array)."""
+        t = np.diff(self.boundaries)
+        return to_recarray(dict(Dx=self.Dx, a=self.a, v_avg=self.Dx / t, vi=self.vi, vf=self.vf, t=t))
+
+    def summary(self) -> Dict[str, float]:
+        """Whole-motion parameters (``a`` is the average acceleration)."""
+        Dx = float(self.positions[-1] - self.x0)
+        t = self.duration
+        vi, vf = float(self.vi[0]), float(self.vf[-1])
+        return dict(Dx=Dx, a=(vf - vi) / t, v_avg=Dx / t, vi=vi, vf=vf, t=t)
+
+    def segment_at(self, time: Any) -> np.ndarray:
+        """Index of the segment active at each ``time`` (``-1`` outside
+        ``[0, duration]``). A boundary time belongs to the later segment.
+        """
+        time = np.asarray(time, dtype=np.float64)
+        index = np.searchsorted(self.boundaries, time, side="right") - 1
+        index = np.minimum(index, len(self) - 1)
+        return np.where((time >= 0) & (time <= self.duration), index, -1)
+
+    def _locate(self, time: Any):
+        time = np.asarray(time, dtype=np.float64)
+        index = self.segment_at(time)
+        valid = index >= 0
+        index = np.where(valid, index, 0)
+        return index, time - self.boundaries[index], valid
+
+    def position(self, time: Any) -> np.ndarray:
+        """Position at each ``time`` (NaN outside ``[0, duration]``)."""
+        k, tau, valid = self._locate(time)
+        x = self.positions[k] + tau * (self.vi[k] + 0.5 * self.a[k] * tau)
+        return np.where(valid, x, np.nan)
+
+    def velocity(self, time: Any) -> np.ndarray:
+        """Velocity at each ``time`` (NaN outside ``[0, duration]``)."""
+        k, tau, valid = self._locate(time)
+        return np.where(valid, self.vi[k] + self.a[k] * tau, np.nan)
+
+    def trajectory(self, n_points: int=200) -> Trajectory:
+        """Samples position and velocity at ``n_points`` evenly spaced times."""
+        if n_points < 2:
+            raise ValueError("n_points must be at least 2.")
+        time = np.linspace(0.0, self.duration, n_points)
+        return Trajectory(time, self.position(time), self.velocity(time))
+
+    def __repr__(self):
+        return f"PiecewiseMotion(segments={len(self)}, duration={self.duration:g})"
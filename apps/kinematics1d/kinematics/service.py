@@ -0,0 +1,333 @@
+"""Local HTTP/JSON solve service with micro-batching.
+
+Concurrent ``POST /solve`` requests that arrive within ``max_delay`` seconds
+of each other are coalesced into one vectorized
+:func:`kinematics.batch.calculate1D_batch` call (at most ``max_batch_size``
+problems). Only the standard library (asyncio) and NumPy are used.
+
+Endpoints:
+
+- ``POST /solve``: a problem (``{"vi": 205, "vf": 315, "t": 10}``, unknowns
+  omitted or ``null``) answers ``{"result": {...}}`` (or ``{"error": ...}``
+  with status 422); a list of problems answers a list of those objects.
+- ``GET /metrics``: throughput, batch sizes and latency percentiles.
+- ``GET /health``: ``{"status": "ok"}``.
+
+Start it with ``python -m kinematics serve``.
+"""
+import asyncio
+import json
+import math
+import time
+import numpy as np
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from .batch import DEPENDENT, KNOWN_COUNT, SOLVABLE, calculate1D_batch, known_pattern
+from .plans import PARAMS
+from .stream import DEPENDENT_KNOWNS, INSUFFICIENT, NOT_IMPLEMENTED, NO_SOLUTION
+
+MAX_BODY = 16 * 1024 * 1024
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+}
+
+
+class ServiceMetrics(object):
+    """Counters of the service and a window of the latest request latencies."""
+
+    def __init__(self, window: int=10000):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.problems = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched = 0
+        self.max_batch_size = 0
+        self.latencies = deque(maxlen=window)
+
+    def record_batch(self, size: int):
+        self.batches += 1
+        self.batched += size
+        self.max_batch_size = max(self.max_batch_size, size)
+
+    def record_request(self, seconds: float, problems: int, errors: int):
+        self.requests += 1
+        self.problems += problems
+        self.errors += errors
+        self.latencies.append(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        uptime = time.perf_counter() - self.started
+        latency = dict()
+        if self.latencies:
+            p50, p90, p99 = np.percentile(np.array(self.latencies), [50, 90, 99]) * 1e3
+            latency = dict(p50=p50, p90=p90, p99=p99, max=max(self.latencies) * 1e3, window=len(self.latencies))
+        return dict(
+            uptime_s=uptime,
+            requests=self.requests,
+            problems=self.problems,
+            errors=self.errors,
+            batches=self.batches,
+            mean_batch_size=self.batched / self.batches if self.batches else 0.0,
+            max_batch_size=self.max_batch_size,
+            requests_per_sec=self.requests / uptime if uptime else 0.0,
+            problems_per_sec=self.problems / uptime if uptime else 0.0,
+            latency_ms=latency,
+        )
+
+
+class MicroBatcher(object):
+    """Coalesces single problems into vectorized batches.
+
+    The first problem of a batch waits at most ``max_delay`` seconds for
+    others to join; a batch is solved as soon as it holds ``max_batch_size``
+    problems.
+    """
+
+    def __init__(self, max_batch_size: int=1024, max_delay: float=0.002, ndigits: Optional[int]=5, metrics: Optional[ServiceMetrics]=None):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.ndigits = ndigits
+        self.metrics = metrics
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Starts the batching task (in the running event loop)."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def solve(self, problem: Dict[str, Optional[float]]) -> Dict[str, Any]:
+        """Solves one problem; returns ``{"result": {...}}`` or ``{"error": ...}``."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((problem, future))
+        return await future
+
+    def _solve_one(self, problem: Dict[str, Optional[float]]) -> Dict[str, Any]:
+        try:
+            return solve_problems([problem], ndigits=self.ndigits)[0]
+        except Exception as e:  # never leave a request hanging
+            return dict(error=f"{type(e).__name__}: {e}")
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._solve_batch(batch)
+
+    def _solve_batch(self, batch: List[Tuple[Dict[str, Optional[float]], asyncio.Future]]):
+        try:
+            answers = solve_problems([problem for problem, _ in batch], ndigits=self.ndigits)
+        except Exception:
+            # Solve the problems one by one, so that a bad problem only fails its own request.
+            answers = [self._solve_one(problem) for problem, _ in batch]
+        if self.metrics is not None:
+            self.metrics.record_batch(len(batch))
+        for (_, future), answer in zip(batch, answers):
+            if not future.done():
+                future.set_result(answer)
+
+
+def solve_problems(problems: List[Dict[str, Optional[float]]], ndigits: Optional[int]=5) -> List[Dict[str, Any]]:
+    """Solves a list of problems in one vectorized call; returns one
+    ``{"result": {...}}`` or ``{"error": ...}`` per problem.
+    """
+    columns = dict(
+        (name, np.array([math.nan if p.get(name) is None else p[name] for p in problems], dtype=np.float64))
+        for name in PARAMS
+    )
+    pattern = known_pattern(columns)
+    result = calculate1D_batch(columns, ndigits=ndigits, errors="coerce")
+    finite = np.logical_and.reduce([np.isfinite(result[name]) for name in PARAMS])
+    rows = np.column_stack([result[name] for name in PARAMS]).tolist()
+    answers = []
+    for i, row in enumerate(rows):
+        if finite[i] and SOLVABLE[pattern[i]]:
+            answers.append(dict(result=dict(zip(PARAMS, row))))
+        elif KNOWN_COUNT[pattern[i]] < 3:
+            answers.append(dict(error=INSUFFICIENT))
+        elif DEPENDENT[pattern[i]]:
+            answers.append(dict(error=DEPENDENT_KNOWNS))
+        elif not SOLVABLE[pattern[i]]:
+            answers.append(dict(error=NOT_IMPLEMENTED))
+        else:
+            answers.append(dict(error=NO_SOLUTION))
+    return answers
+
+
+def parse_problem(obj: Any) -> Dict[str, Optional[float]]:
+    """Validates one JSON problem and converts its values to ``float``;
+    raises ValueError if it is malformed (e.g. an integer too large for a
+    float).
+    """
+    if not isinstance(obj, dict):
+        raise ValueError("A problem must be a JSON object.")
+    unexpected = set(obj) - set(PARAMS)
+    if unexpected:
+        raise ValueError(f"Unexpected parameters: {sorted(unexpected)}.")
+    problem = dict()
+    for name, value in obj.items():
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise ValueError(f"{name} must be a number or null.")
+        try:
+            problem[name] = None if value is None else float(value)
+        except OverflowError:
+            raise ValueError(f"{name} is too large.")
+    return problem
+
+
+class SolveService(object):
+    """The HTTP/JSON front end of a :class:`MicroBatcher` (HTTP/1.1, keep-alive).
+
+    Usage:
+
+        service = SolveService(port=8000, max_batch_size=512, max_delay=0.002)
+        asyncio.run(service.serve_forever())
+
+    """
+
+    def __init__(self, host: str="127.0.0.1", port: int=8000, max_batch_size: int=1024, max_delay: float=0.002, ndigits: Optional[int]=5):
+        self.host = host
+        self.port = port
+        self.metrics = ServiceMetrics()
+        self.batcher = MicroBatcher(max_batch_size=max_batch_size, max_delay=max_delay, ndigits=ndigits, metrics=self.metrics)
+        self._server = None
+
+    async def start(self):
+        """Starts listening (``port=0`` picks a free port, see :attr:`port`)."""
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.stop()
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                start = time.perf_counter()
+                lines = head.decode("latin-1").split("\r\n")
+                method, target, version = (lines[0].split(" ") + ["", ""])[:3]
+                headers = dict(
+                    (key.strip().lower(), value.strip())
+                    for key, _, value in (line.partition(":") for line in lines[1:] if line)
+                )
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                length = _content_length(headers.get("content-length"))
+                if length is None:
+                    writer.write(_response(400, dict(error="Invalid Content-Length."), keep_alive=False))
+                    await writer.drain()
+                    break
+                if length > MAX_BODY:
+                    writer.write(_response(413, dict(error="Request body too large."), keep_alive=False))
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b""
+                status, payload, problems, errors = await self._route(method, target, body)
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if target == "/solve":
+                    self.metrics.record_request(time.perf_counter() - start, problems, errors)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, target: str, body: bytes):
+        """Returns ``(status, payload, problems, errors)``."""
+        if target == "/health":
+            return 200, dict(status="ok"), 0, 0
+        if target == "/metrics":
+            return 200, self.metrics.snapshot(), 0, 0
+        if target != "/solve":
+            return 404, dict(error=f"No route {target}."), 0, 0
+        if method != "POST":
+            return 405, dict(error="Use POST /solve."), 0, 0
+        try:
+            data = json.loads(body)
+            problems = [parse_problem(p) for p in data] if isinstance(data, list) else [parse_problem(data)]
+        except ValueError as e:
+            return 400, dict(error=str(e)), 0, 1
+        answers = await asyncio.gather(*(self.batcher.solve(p) for p in problems))
+        errors = sum("error" in answer for answer in answers)
+        if isinstance(data, list):
+            return 200, answers, len(answers), errors
+        return (422 if errors else 200), answers[0], 1, errors
+
+
+def _content_length(value: Optional[str]) -> Optional[int]:
+    """Parses a Content-Length header (absent: 0); ``None`` if it is malformed or negative."""
+    if value is None or value == "":
+        return 0
+    if not (value.isascii() and value.isdigit()):
+        return None
+    return int(value) if len(value) <= 18 else MAX_BODY + 1
+
+
+def _response(status: int, payload: Any, keep_alive: bool) -> bytes:
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def serve(host: str="127.0.0.1", port: int=8000, max_batch_size: int=1024, max_delay: float=0.002, ndigits: Optional[int]=5):
+    """Runs the service until interrupted."""
+    service = SolveService(host=host, port=port, max_batch_size=max_batch_size, max_delay=max_delay, ndigits=ndigits)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,69 @@
+import numpy as np
+from typing import Any, Mapping, Optional
+
+from .batch import RESULT_DTYPE, calculate1D_batch
+from .plans import PARAMS
+
+
+def create_store(path: str, n: int) -> np.memmap:
+    """Creates (or overwrites) a ``.npy`` file of ``n`` ``RESULT_DTYPE``
+    records, filled with NaN, and returns it memory-mapped for writing.
+    """
+    store = np.lib.format.open_memmap(path, mode="w+", dtype=RESULT_DTYPE, shape=(n,))
+    for name in PARAMS:
+        store[name] = np.nan
+    return store
+
+
+def open_store(path: str, mode: str="r") -> np.recarray:
+    """Reopens a result store without reading it: the returned record array
+    is a view of the memory-mapped file, so slicing any range of rows only
+    touches those pages.
+
+    Usage:
+
+        results = open_store("results.npy")
+        results.t[1_000_000:1_000_010]
+
+    """
+    return np.load(path, mmap_mode=mode).view(np.recarray)
+
+
+def solve_to_store(data: Mapping[str, Any], path: str, chunk_size: int=1000000, ndigits: Optional[int]=5, errors: str="coerce") -> np.recarray:
+    """Solves 1-D columns (any of ``Dx, a, v_avg, vi, vf, t``; NaN for
+    unknowns) chunk by chunk, writing the results straight into a
+    memory-mapped ``.npy`` store preallocated to the input length.
+
+    The input columns are only sliced, so they can be memory-mapped too
+    (``np.load(..., mmap_mode="r")``): neither the inputs nor the results
+    need to fit in memory.
+
+    Parameters:
+        data: the input columns (equal lengths).
+        path: the ``.npy`` file to write (row ``i`` holds the solve of input row ``i``).
+        chunk_size: rows solved at a time.
+        ndigits: digits to round the results to (``None`` to skip rounding).
+        errors: as in :func:`kinematics.batch.calculate1D_batch`; with
+            ``"coerce"`` (the default) unsolvable rows keep NaN unknowns.
+
+    Returns the store, reopened read-only (see :func:`open_store`).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    columns = dict((name, data[name]) for name in PARAMS if name in data)
+    if not columns:
+        raise ValueError(f"None of the columns {PARAMS} were given.")
+    lengths = set(len(column) for column in columns.values())
+    if len(lengths) > 1:
+        raise ValueError(f"The columns must have equal lengths, got {sorted(lengths)}.")
+    n = lengths.pop()
+    store = create_store(path, n)
+    try:
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            chunk = dict((name, np.asarray(column[start:stop], dtype=np.float64)) for name, column in columns.items())
+            calculate1D_batch(chunk, ndigits=ndigits, errors=errors, out=store[start:stop])
+        store.flush()
+    finally:
+        del store
+    return open_store(path)
@@ -0,0 +1,263 @@
+import csv
+import os
+import time
+import numpy as np
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+
+from .arrow import arrow_to_numpy, numpy_to_arrow
+from .batch import DEPENDENT, KNOWN_COUNT, SOLVABLE, calculate1D_batch, known_pattern, round_column
+from .plans import PARAMS
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+OUTPUT_FIELDS = ("row",) + PARAMS
+REJECT_FIELDS = ("row",) + PARAMS + ("error",)
+
+# Reasons written to the ``error`` column of the reject file.
+INSUFFICIENT = "At least three appropriate parameters are necessary."
+NOT_IMPLEMENTED = "No implementation exists for the parameters."
+DEPENDENT_KNOWNS = "The known parameters are not independent."
+NO_SOLUTION = "No finite solution for the parameters."
+
+
+def _is_parquet(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in PARQUET_SUFFIXES
+
+
+def _import_parquet():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("pyarrow is required to read/write Parquet files (pip install pyarrow).") from e
+    return pa, pq
+
+
+def _csv_columns(rows: Sequence[Sequence[str]], index: Dict[str, int]) -> Dict[str, np.ndarray]:
+    """Parses the parameter cells of ``rows``. A column is converted in one
+    call; only if that fails are its cells parsed one by one, NaN and a
+    per-row reason (in the ``error`` column, ``None`` for good rows) marking
+    the cells that are missing (short rows) or not numbers. The reason
+    quotes the raw text of the bad cell.
+    """
+    n = len(rows)
+    columns = dict()
+    error = np.full(n, None, dtype=object)
+    for name, i in index.items():
+        cells = [r[i] if len(r) > i else None for r in rows]
+        try:
+            columns[name] = np.array([cell.strip() or "nan" for cell in cells], dtype=float)
+            continue
+        except (AttributeError, ValueError):
+            pass
+        column = np.full(n, np.nan)
+        for j, cell in enumerate(cells):
+            if cell is None:
+                error[j] = error[j] or f"missing column {name}"
+                continue
+            try:
+                column[j] = float(cell.strip() or "nan")
+            except ValueError:
+                error[j] = error[j] or f"parse error in column {name}: {cell!r}"
+        columns[name] = column
+    if any(reason is not None for reason in error):
+        columns["error"] = error
+    return columns
+
+
+def read_csv_chunks(path: str, chunk_size: int) -> Iterator[Dict[str, np.ndarray]]:
+    """Yields the parameter columns of a CSV file, ``chunk_size`` rows at a time.
+
+    Empty cells are unknowns; columns other than ``Dx, a, v_avg, vi, vf, t``
+    are ignored. Rows with a missing or non-numeric cell are flagged in an
+    ``error`` column (present only in the chunks that have such rows).
+
+    Raises ``ValueError`` if the file is empty (no header).
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"empty CSV: no header ({path}).")
+        header = [name.strip() for name in header]
+        index = dict((name, header.index(name)) for name in PARAMS if name in header)
+        rows = []
+        for row in reader:
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield _csv_columns(rows, index)
+                rows = []
+        if rows:
+            yield _csv_columns(rows, index)
+
+
+def read_parquet_chunks(path: str, chunk_size: int) -> Iterator[Dict[str, np.ndarray]]:
+    """Yields the parameter columns of a Parquet file, ``chunk_size`` rows at a
+    time (read incrementally, row group by row group). Nulls are unknowns.
+    """
+    _, pq = _import_parquet()
+    parquet = pq.ParquetFile(path)
+    columns = [name for name in PARAMS if name in parquet.schema_arrow.names]
+    for batch in parquet.iter_batches(batch_size=chunk_size, columns=columns):
+        yield dict((name, arrow_to_numpy(batch.column(name))) for name in columns)
+
+
+def read_chunks(path: str, chunk_size: int) -> Iterator[Dict[str, np.ndarray]]:
+    if _is_parquet(path):
+        return read_parquet_chunks(path, chunk_size)
+    return read_csv_chunks(path, chunk_size)
+
+
+class _CsvWriter(object):
+
+    def __init__(self, path: str, fields: Sequence[str]):
+        self.fields = fields
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(fields)
+
+    def write(self, columns: Dict[str, np.ndarray]):
+        cells = []
+        for name in self.fields:
+            column = columns[name]
+            if column.dtype.kind == "f":
+                cells.append(["" if v != v else repr(v) for v in column.tolist()])
+            else:
+                cells.append(column.tolist())
+        self._writer.writerows(zip(*cells))
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetWriter(object):
+
+    def __init__(self, path: str, fields: Sequence[str]):
+        pa, pq = _import_parquet()
+        self.fields = fields
+        self._pa = pa
+        types = dict(row=pa.int64(), error=pa.string())
+        self._schema = pa.schema([(name, types.get(name, pa.float64())) for name in fields])
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, columns: Dict[str, np.ndarray]):
+        arrays = []
+        for name in self.fields:
+            column = columns[name]
+            if column.dtype.kind == "f":
+                arrays.append(numpy_to_arrow(column))
+            else:
+                arrays.append(self._pa.array(column, type=self._schema.field(name).type))
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+def open_writer(path: str, fields: Sequence[str]):
+    """Opens a chunk writer (Parquet or CSV, by file extension)."""
+    if _is_parquet(path):
+        return _ParquetWriter(path, fields)
+    return _CsvWriter(path, fields)
+
+
+def default_rejects_path(output: str) -> str:
+    """``results.csv`` -> ``results.rejects.csv``"""
+    stem, ext = os.path.splitext(output)
+    return f"{stem}.rejects{ext}"
+
+
+def solve_file(
+        input: str,
+        output: str,
+        rejects: Optional[str]=None,
+        chunk_size: int=100000,
+        ndigits: Optional[int]=5,
+        progress: Optional[Callable[[Dict[str, Any]], None]]=None,
+        units: Any=None,
+        output_units: Any=None,
+    ) -> Dict[str, Any]:
+    """Solves a file of problems chunk by chunk, with constant memory.
+
+    Parameters:
+        input: CSV or Parquet file with (some of) the columns
+            ``Dx, a, v_avg, vi, vf, t``; empty cells / nulls are unknowns.
+        output: CSV or Parquet file for the solved rows.
+        rejects: file for the rows that cannot be solved (unparseable
+            cells, insufficient or dependent parameters, or no finite
+            solution), with an ``error`` column. Defaults to ``<output>.rejects.<ext>``.
+        chunk_size: rows per chunk.
+        ndigits: digits to round the results to (``None`` to skip rounding).
+        progress: optional callback, called with the running stats after
+            each chunk.
+        units: the units of the input columns, e.g. ``dict(vi="km/h")`` or
+            ``"imperial"`` (see :mod:`kinematics.units`; default: SI).
+        output_units: the units of both output files (default: SI).
+
+    Both output files carry the 0-based input ``row`` number.
+
+    Usage:
+
+        stats = solve_file("problems.csv", "results.csv", chunk_size=50000)
+        stats["rows_per_sec"]
+
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    if rejects is None:
+        rejects = default_rejects_path(output)
+    converted = units is not None or output_units is not None
+    if converted:
+        from .units import from_si, scale_factors, to_si
+        scale_factors(units), scale_factors(output_units)  # fail before opening the outputs
+    stats = dict(rows=0, solved=0, rejected=0, seconds=0.0, rows_per_sec=0.0)
+    start = time.perf_counter()
+    writer = open_writer(output, OUTPUT_FIELDS)
+    reject_writer = open_writer(rejects, REJECT_FIELDS)
+    try:
+        for chunk in read_chunks(input, chunk_size):
+            pattern = known_pattern(chunk)
+            if converted:
+                result = from_si(calculate1D_batch(to_si(chunk, units), ndigits=None, errors="coerce"), output_units)
+                if ndigits is not None:
+                    result = dict((name, round_column(col, ndigits)) for name, col in result.items())
+            else:
+                result = calculate1D_batch(chunk, ndigits=ndigits, errors="coerce")
+            n = len(pattern)
+            result["row"] = np.arange(stats["rows"], stats["rows"] + n, dtype=np.int64)
+
+            finite = np.logical_and.reduce([np.isfinite(result[name]) for name in PARAMS])
+            ok = finite & SOLVABLE[pattern]
+            parse_error = chunk.get("error")
+            if parse_error is not None:
+                # Rows with a bad cell are rejected with their parsed input
+                # (the raw text is quoted in the reason), not a solve of the rest.
+                unparsed = np.array([reason is not None for reason in parse_error], dtype=bool)
+                ok &= ~unparsed
+                given = from_si(to_si(chunk, units), output_units) if converted else chunk
+                for name in PARAMS:
+                    result[name] = np.where(unparsed, given[name] if name in given else np.nan, result[name])
+            writer.write(dict((name, col[ok]) for name, col in result.items()))
+
+            if not ok.all():
+                bad = ~ok
+                error = np.full(n, NO_SOLUTION, dtype=object)
+                error[~SOLVABLE[pattern]] = NOT_IMPLEMENTED
+                error[DEPENDENT[pattern]] = DEPENDENT_KNOWNS
+                error[KNOWN_COUNT[pattern] < 3] = INSUFFICIENT
+                if parse_error is not None:
+                    error[unparsed] = parse_error[unparsed]
+                rejected = dict((name, col[bad]) for name, col in result.items())
+                rejected["error"] = error[bad]
+                reject_writer.write(rejected)
+
+            stats["rows"] += n
+            stats["solved"] += int(ok.sum())
+            stats["rejected"] += int(n - ok.sum())
+            stats["seconds"] = time.perf_counter() - start
+            stats["rows_per_sec"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+            if progress is not None:
+                progress(dict(stats))
+    finally:
+        writer.close()
+        reject_writer.close()
+    return stats
@@ -0,0 +1,84 @@
+import numpy as np
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from .batch import calculate1D_batch
+from .plans import PARAMS, get_plan
+
+
+class SweepResult(NamedTuple):
+    """Gridded result of a parameter sweep, as labeled arrays.
+
+    ``dims`` names the swept parameters (one per grid axis), ``coords`` holds
+    their values and ``values`` all six parameters, each an array of shape
+    ``shape`` (``values[name][i, j]`` is the solve at ``coords[dims[0]][i]``,
+    ``coords[dims[1]][j]``). The solved (unknown) parameters of the cells
+    without a finite, forward-in-time (``t >= 0``) solution are NaN.
+    """
+    dims: Tuple[str, ...]
+    coords: Dict[str, np.ndarray]
+    values: Dict[str, np.ndarray]
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(len(self.coords[dim]) for dim in self.dims)
+
+    def to_frame(self):
+        """Returns the grid in long format (a ``pandas.DataFrame`` with one
+        row per cell and one column per parameter).
+        """
+        import pandas as pd
+        columns = dict((name, values.ravel()) for name, values in self.values.items())
+        return pd.DataFrame(columns, columns=list(PARAMS))
+
+
+def sweep(fixed: Mapping[str, Optional[float]], axes: Mapping[str, Any], ndigits: Optional[int]=None) -> SweepResult:
+    """Solves a grid of problems: every combination of the swept values
+    (``axes``, one or two parameters) with the ``fixed`` knowns.
+
+    The grid is solved in one vectorized pass (see
+    :func:`kinematics.batch.calculate1D_batch`), not one solve per cell.
+
+    Parameters:
+        fixed: known parameters (``None`` for unknowns); swept parameters
+            override them. The swept parameters must all be knowns of the
+            solve plan picked for the fixed and swept parameters.
+        axes: ``{name: values}`` for one or two parameters; the values can be
+            any 1-D array-like (``np.linspace(1, 20, 50)``, ``range(1, 21)``).
+        ndigits: digits to round the results to (``None``: no rounding).
+
+    Raises ``ValueError`` if a swept parameter would be ignored by the solve
+    plan (e.g. sweeping ``a`` with ``vi, vf, t`` fixed).
+
+    Usage:
+
+        grid = sweep(dict(vi=205, vf=315), dict(a=np.linspace(1, 20, 50)))
+        grid.values["t"]    # shape (50,)
+
+    """
+    if not 1 <= len(axes) <= 2:
+        raise ValueError(f"One or two parameters can be swept, got {len(axes)}.")
+    unknown = set(axes) - set(PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown parameters to sweep: {sorted(unknown)}.")
+    dims = tuple(axes)
+    fixed = dict((name, value) for name, value in fixed.items() if value is not None and name not in axes)
+    plan = get_plan(set(fixed) | set(dims))
+    if plan is not None and not plan.known.issuperset(dims):
+        raise ValueError(
+            f"Sweeping {sorted(set(dims) - plan.known)} has no effect: the known parameters "
+            f"{sorted(set(fixed) | set(dims))} are solved from {sorted(plan.known)}. "
+            f"Remove the conflicting fixed parameters."
+        )
+    coords = dict((dim, np.asarray(axes[dim], dtype=np.float64).ravel()) for dim in dims)
+    columns = dict(fixed)
+    for i, dim in enumerate(dims):
+        shape = [1] * len(dims)
+        shape[i] = -1
+        columns[dim] = coords[dim].reshape(shape)
+    values = calculate1D_batch(columns, ndigits=ndigits)
+    with np.errstate(invalid="ignore"):
+        invalid = ~np.logical_and.reduce([np.isfinite(values[name]) for name in PARAMS]) | (values["t"] < 0)
+    values = dict(
+        (name, values[name] if name in plan.known else np.where(invalid, np.nan, values[name])) for name in PARAMS
+    )
+    return SweepResult(dims, coords, values)
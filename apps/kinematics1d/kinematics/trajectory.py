@@ -0,0 +1,100 @@
+import numpy as np
+from typing import Iterable, Iterator, NamedTuple
+
+
+class Trajectory(NamedTuple):
+    """Sampled motion: time (s), position x (m) and velocity v (m/s)."""
+    time: np.ndarray
+    x: np.ndarray
+    v: np.ndarray
+
+
+def _check(t: float, n_points: int):
+    if n_points < 2:
+        raise ValueError("n_points must be at least 2.")
+    if not t > 0:
+        raise ValueError(f"The time (t) must be positive to sample a trajectory, got {t}.")
+
+
+def trajectory(vi: float, a: float, t: float, n_points: int=200) -> Trajectory:
+    """Samples ``x(t) = vi t + a t^2 / 2`` and ``v(t) = vi + a t`` at
+    ``n_points`` evenly spaced times over ``[0, t]``.
+
+    Usage:
+
+        traj = trajectory(vi=205.0, a=11.0, t=10.0, n_points=1000)
+        traj.x[-1]  # 2600.0
+
+    """
+    _check(t, n_points)
+    time = np.linspace(0.0, t, n_points)
+    return Trajectory(time, time * (vi + 0.5 * a * time), vi + a * time)
+
+
+def iter_trajectory(vi: float, a: float, t: float, n_points: int, chunk_size: int=100000) -> Iterator[Trajectory]:
+    """Like :func:`trajectory`, but yields the samples ``chunk_size`` at a time,
+    so memory stays bounded for very large ``n_points``.
+    """
+    _check(t, n_points)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    step = t / (n_points - 1)
+    for start in range(0, n_points, chunk_size):
+        stop = min(start + chunk_size, n_points)
+        time = np.arange(start, stop, dtype=np.float64) * step
+        if stop == n_points:
+            time[-1] = t
+        yield Trajectory(time, time * (vi + 0.5 * a * time), vi + a * time)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of (at most) ``n_out`` points of the series ``(x, y)``
+    that preserve its visual shape; the first and last points are always kept.
+    Each bucket is evaluated as a whole-array expression.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[stop:next_stop].mean()
+        avg_y = y[stop:next_stop].mean()
+        px, py = x[previous], y[previous]
+        area = np.abs((px - avg_x) * (y[start:stop] - py) - (px - x[start:stop]) * (avg_y - py))
+        previous = start + int(np.argmax(area))
+        indices[i + 1] = previous
+    return indices
+
+
+def downsample(traj: Trajectory, n_out: int=1000) -> Trajectory:
+    """Downsamples a trajectory with LTTB on the position curve."""
+    indices = lttb_indices(traj.time, traj.x, n_out)
+    return Trajectory(traj.time[indices], traj.x[indices], traj.v[indices])
+
+
+def downsample_chunks(chunks: Iterable[Trajectory], n_points: int, n_out: int=1000) -> Trajectory:
+    """Downsamples a trajectory given chunk by chunk (see :func:`iter_trajectory`)
+    to ``n_out`` points, without ever holding all of its ``n_points`` samples.
+
+    Each chunk is reduced with LTTB to its share of ``2 * n_out`` points as it
+    arrives; the kept points are then reduced to ``n_out``. Memory is bounded
+    by one chunk.
+
+    Usage:
+
+        shown = downsample_chunks(iter_trajectory(vi=205.0, a=11.0, t=10.0, n_points=10**7), 10**7)
+
+    """
+    parts = []
+    for chunk in chunks:
+        share = max(3, -(-2 * n_out * len(chunk.time) // n_points))
+        parts.append(downsample(chunk, n_out=share))
+    merged = Trajectory(*(np.concatenate(columns) for columns in zip(*parts)))
+    return downsample(merged, n_out=n_out)
@@ -0,0 +1,149 @@
+import numpy as np
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .batch import calculate1D_batch
+from .plans import PARAMS
+
+
+class Normal(NamedTuple):
+    """Normally distributed parameter: ``mean`` ± ``std`` (one standard deviation)."""
+    mean: float
+    std: float
+
+    @property
+    def center(self) -> float:
+        return self.mean
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.normal(self.mean, self.std, n)
+
+
+class Uniform(NamedTuple):
+    """Uniformly distributed parameter over ``[low, high)``."""
+    low: float
+    high: float
+
+    @property
+    def center(self) -> float:
+        return 0.5 * (self.low + self.high)
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.uniform(self.low, self.high, n)
+
+
+class UncertaintyResult(NamedTuple):
+    """Monte Carlo estimate of every parameter: ``mean``, ``std`` (sample
+    standard deviation) and ``percentiles`` (``{name: {q: value}}``) over the
+    ``valid`` (finite) samples of each parameter, out of ``n_samples`` draws.
+    Percentiles are estimated from a uniform reservoir of at most
+    ``reservoir_size`` samples per parameter (exact below that).
+    """
+    n_samples: int
+    valid: Dict[str, int]
+    mean: Dict[str, float]
+    std: Dict[str, float]
+    percentiles: Dict[str, Dict[float, float]]
+    reservoir_size: int
+
+    def table(self):
+        """Returns one row per parameter: ``(name, mean, std, *percentiles)``."""
+        return [
+            (name, self.mean[name], self.std[name], *self.percentiles[name].values())
+            for name in PARAMS
+        ]
+
+
+def _combine(n_a, mean_a, m2_a, n_b, mean_b, m2_b):
+    """Chan et al. pairwise update of counts, means and sums of squared deviations."""
+    n = n_a + n_b
+    safe_n = np.maximum(n, 1)
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / safe_n
+    m2 = m2_a + m2_b + delta**2 * n_a * n_b / safe_n
+    return n, mean, m2
+
+
+def propagate(
+        params: Mapping[str, Any],
+        n_samples: int=100000,
+        seed: Optional[int]=None,
+        chunk_size: int=100000,
+        percentiles: Sequence[float]=(2.5, 50.0, 97.5),
+        reservoir_size: int=20000,
+    ) -> UncertaintyResult:
+    """Propagates input uncertainty through the solver by Monte Carlo.
+
+    Each known parameter is a number or a distribution (:class:`Normal`,
+    :class:`Uniform`); ``None`` marks an unknown. ``n_samples`` draws are
+    solved vectorized, ``chunk_size`` at a time, so memory is bounded:
+    moments are merged across chunks with Chan's parallel update and
+    percentiles come from a reservoir sample (random keys, the smallest
+    ``reservoir_size`` kept with ``np.argpartition``).
+
+    Chunk ``i`` draws from its own generator, spawned from ``seed`` with
+    ``np.random.SeedSequence``: the same ``seed`` and ``chunk_size`` give the
+    same result. Draws without a finite solution are left out of the
+    statistics of the affected parameters (see ``valid``).
+
+    Usage:
+
+        res = propagate(dict(vi=Normal(205, 2), vf=315, t=Uniform(9.9, 10.1)), seed=0)
+        res.mean["a"], res.std["a"], res.percentiles["a"][97.5]
+
+    """
+    if n_samples < 1 or chunk_size < 1:
+        raise ValueError("n_samples and chunk_size must be at least 1.")
+    unexpected = set(params) - set(PARAMS)
+    if unexpected:
+        raise TypeError(f"Unexpected parameters: {sorted(unexpected)}.")
+    fixed = dict((name, value) for name, value in params.items() if value is not None and not hasattr(value, "sample"))
+    random = dict((name, value) for name, value in params.items() if hasattr(value, "sample"))
+
+    count, mean, m2 = np.zeros(len(PARAMS)), np.zeros(len(PARAMS)), np.zeros(len(PARAMS))
+    reservoirs: Dict[str, Tuple[np.ndarray, np.ndarray]] = dict(
+        (name, (np.empty(0), np.empty(0))) for name in PARAMS
+    )
+    n_chunks = -(-n_samples // chunk_size)
+    for i, child in enumerate(np.random.SeedSequence(seed).spawn(n_chunks)):
+        rng = np.random.default_rng(child)
+        size = min(chunk_size, n_samples - i * chunk_size)
+        columns = dict(fixed)
+        for name, distribution in random.items():
+            columns[name] = distribution.sample(rng, size)
+        solved = calculate1D_batch(columns, ndigits=None)
+        values = np.stack([np.broadcast_to(solved[name], (size,)) for name in PARAMS])
+
+        finite = np.isfinite(values)
+        n_b = finite.sum(axis=1)
+        mean_b = np.where(finite, values, 0.0).sum(axis=1) / np.maximum(n_b, 1)
+        m2_b = (np.where(finite, values - mean_b[:, None], 0.0) ** 2).sum(axis=1)
+        count, mean, m2 = _combine(count, mean, m2, n_b, mean_b, m2_b)
+
+        keys = rng.random(size)
+        for j, name in enumerate(PARAMS):
+            kept, kept_keys = reservoirs[name]
+            kept = np.concatenate((kept, values[j][finite[j]]))
+            kept_keys = np.concatenate((kept_keys, keys[finite[j]]))
+            if len(kept) > reservoir_size:
+                keep = np.argpartition(kept_keys, reservoir_size)[:reservoir_size]
+                kept, kept_keys = kept[keep], kept_keys[keep]
+            reservoirs[name] = (kept, kept_keys)
+
+    nan = float("nan")
+    std = np.sqrt(m2 / np.maximum(count - 1, 1))
+    return UncertaintyResult(
+        n_samples=n_samples,
+        valid=dict((name, int(count[j])) for j, name in enumerate(PARAMS)),
+        mean=dict((name, float(mean[j]) if count[j] else nan) for j, name in enumerate(PARAMS)),
+        std=dict((name, float(std[j]) if count[j] > 1 else nan) for j, name in enumerate(PARAMS)),
+        percentiles=dict(
+            (name, dict(
+                (float(q), float(v)) for q, v in zip(
+                    percentiles,
+                    np.percentile(reservoirs[name][0], percentiles) if len(reservoirs[name][0]) else [nan] * len(percentiles),
+                )
+            ))
+            for name in PARAMS
+        ),
+        reservoir_size=reservoir_size,
+    )
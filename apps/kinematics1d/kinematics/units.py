@@ -0,0 +1,170 @@
+"""Unit-aware ingest and output for the batch solver.
+
+The solver works in SI (m, m/s, m/s^2, s). Every input column can declare
+its own unit; the columns are converted to SI with one whole-array multiply
+each (a precomputed scale factor), solved, and converted back to any unit
+system on output, so a mixed-unit file costs no Python work per row.
+
+Units are given per parameter (``dict(vi="km/h", Dx="ft", t="min")``, the
+others staying SI), as the name of a system of ``UNIT_SYSTEMS``
+(``"imperial"``), or as a string ``"vi=km/h,Dx=ft"`` (see :func:`parse_units`).
+"""
+import numpy as np
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+from .batch import _is_dataframe, calculate1D_batch, round_column
+from .plans import PARAMS
+
+# Physical dimension of every parameter.
+DIMENSIONS = dict(Dx="length", a="acceleration", v_avg="velocity", vi="velocity", vf="velocity", t="time")
+
+_FOOT = 0.3048
+_MILE = 1609.344
+_HOUR = 3600.0
+
+# Every unit: ``(dimension, factor)``, with ``value_SI = value * factor``.
+UNITS: Dict[str, Tuple[str, float]] = {
+    "m": ("length", 1.0),
+    "km": ("length", 1e3),
+    "cm": ("length", 1e-2),
+    "mm": ("length", 1e-3),
+    "ft": ("length", _FOOT),
+    "in": ("length", _FOOT / 12),
+    "yd": ("length", 3 * _FOOT),
+    "mi": ("length", _MILE),
+    "s": ("time", 1.0),
+    "ms": ("time", 1e-3),
+    "min": ("time", 60.0),
+    "h": ("time", _HOUR),
+    "m/s": ("velocity", 1.0),
+    "km/h": ("velocity", 1e3 / _HOUR),
+    "ft/s": ("velocity", _FOOT),
+    "mph": ("velocity", _MILE / _HOUR),
+    "kn": ("velocity", 1852.0 / _HOUR),
+    "m/s^2": ("acceleration", 1.0),
+    "ft/s^2": ("acceleration", _FOOT),
+    "km/h/s": ("acceleration", 1e3 / _HOUR),
+    "mph/s": ("acceleration", _MILE / _HOUR),
+    "g": ("acceleration", 9.80665),
+}
+
+# Named unit systems (every parameter given).
+UNIT_SYSTEMS: Dict[str, Dict[str, str]] = dict(
+    si=dict(Dx="m", a="m/s^2", v_avg="m/s", vi="m/s", vf="m/s", t="s"),
+    imperial=dict(Dx="ft", a="ft/s^2", v_avg="ft/s", vi="ft/s", vf="ft/s", t="s"),
+    road=dict(Dx="km", a="km/h/s", v_avg="km/h", vi="km/h", vf="km/h", t="s"),
+    road_us=dict(Dx="mi", a="mph/s", v_avg="mph", vi="mph", vf="mph", t="s"),
+)
+
+Units = Union[None, str, Mapping[str, str]]
+
+
+def parse_units(spec: str) -> Dict[str, str]:
+    """Parses ``"vi=km/h,Dx=ft"`` (or the name of a unit system) into a
+    ``{parameter: unit}`` mapping.
+    """
+    spec = spec.strip()
+    if spec in UNIT_SYSTEMS:
+        return dict(UNIT_SYSTEMS[spec])
+    units = dict()
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, sep, unit = item.partition("=")
+        if not sep:
+            raise ValueError(f"Expected <parameter>=<unit> or a unit system {sorted(UNIT_SYSTEMS)}, got {item!r}.")
+        units[name.strip()] = unit.strip()
+    return units
+
+
+def scale_factors(units: Units=None) -> Dict[str, float]:
+    """Returns the SI scale factor of every parameter (``1.0`` when its unit
+    is not given). Raises ``ValueError`` for an unknown unit or parameter, or
+    a unit of the wrong dimension (e.g. ``t="km/h"``).
+
+    Usage:
+
+        scale_factors(dict(vi="km/h", t="min"))["vi"]    # 0.27777...
+
+    """
+    if units is None:
+        units = dict()
+    elif isinstance(units, str):
+        units = parse_units(units)
+    unexpected = set(units) - set(PARAMS)
+    if unexpected:
+        raise ValueError(f"Unexpected parameters: {sorted(unexpected)}.")
+    factors = dict((name, 1.0) for name in PARAMS)
+    for name, unit in units.items():
+        if unit not in UNITS:
+            raise ValueError(f"Unknown unit {unit!r} for {name} (known: {', '.join(UNITS)}).")
+        dimension, factor = UNITS[unit]
+        if dimension != DIMENSIONS[name]:
+            raise ValueError(f"{name} is a {DIMENSIONS[name]}, but {unit!r} is a unit of {dimension}.")
+        factors[name] = factor
+    return factors
+
+
+def to_si(data: Mapping[str, Any], units: Units=None) -> Dict[str, np.ndarray]:
+    """Converts the parameter columns of ``data`` (declared in ``units``) to
+    SI float arrays, one multiply per column. NaN (unknown) stays NaN.
+    """
+    factors = scale_factors(units)
+    columns = dict()
+    for name in PARAMS:
+        if name in data and data[name] is not None:
+            column = np.asarray(data[name], dtype=np.float64)
+            columns[name] = column * factors[name] if factors[name] != 1.0 else column
+    return columns
+
+
+def from_si(columns: Mapping[str, Any], units: Units=None) -> Dict[str, Any]:
+    """Converts SI parameter columns to ``units`` (other columns are kept)."""
+    factors = scale_factors(units)
+    return dict(
+        (name, np.asarray(column) / factors[name] if factors.get(name, 1.0) != 1.0 else column)
+        for name, column in columns.items()
+    )
+
+
+def calculate1D_units(
+        data: Optional[Mapping[str, Any]]=None,
+        units: Units=None,
+        output_units: Units=None,
+        ndigits: Optional[int]=5,
+        errors: str="raise",
+        **kwargs,
+    ) -> Dict[str, np.ndarray]:
+    """Unit-aware :func:`kinematics.batch.calculate1D_batch`.
+
+    Parameters:
+        data, **kwargs: the input columns (``kwargs`` override ``data``).
+        units: the units of the input columns (SI when not given).
+        output_units: the units of the results (default: SI).
+        ndigits: digits to round the results to, in the output units
+            (``None`` to skip rounding).
+        errors: as in ``calculate1D_batch``.
+
+    Returns a ``dict`` of arrays (a ``DataFrame`` with the same index when
+    ``data`` is a ``DataFrame``).
+
+    Usage:
+
+        res = calculate1D_units(vi=[0, 36], vf=[100, 72], t=[10, 0.5], units=dict(vi="km/h", vf="km/h", t="min"))
+        res["a"]            # m/s^2
+        res = calculate1D_units(vi=[60], vf=[0], Dx=[100], units="road_us", output_units="si")
+
+    """
+    source = dict()
+    if data is not None:
+        source.update((name, data[name]) for name in PARAMS if name in data)
+    source.update((name, value) for name, value in kwargs.items() if value is not None)
+    unexpected = set(source) - set(PARAMS)
+    if unexpected:
+        raise TypeError(f"Unexpected parameters: {sorted(unexpected)}.")
+    result = calculate1D_batch(to_si(source, units), ndigits=None, errors=errors)
+    result = from_si(result, output_units)
+    if ndigits is not None:
+        result = dict((name, round_column(column, ndigits)) for name, column in result.items())
+    if _is_dataframe(data):
+        import pandas as pd
+        return pd.DataFrame(result, index=data.index)
+    return result
@@ -1,5 +1,10 @@
 import streamlit as st
 import os
+import pandas as pd
+import altair as alt
+import numpy as np
+import kinematics as K
+from kinematics.trajectory import downsample_chunks
 from dataclasses import dataclass
 from typing import List, Tuple, Dict, Any, Optional
 from textwrap import dedent
@@ -16,6 +21,16 @@ def is_streamlit_cloud(watchvariable: str = "ST_IS_STREAMLIT_CLOUD") -> bool:
     """
     return bool(os.environ.get(watchvariable, "0") == "1")
 
+def solve_cache_size(watchvariable: str = "ST_SOLVE_CACHE_SIZE", value: str = "256") -> int:
+    """Max entries of the solve cache (set environment variable ``watchvariable``
+    to override). A size of 0 disables the cache.
+    """
+    try:
+        return max(int(os.environ.get(watchvariable, value)), 0)
+    except ValueError:
+        return int(value)
+
+
 @st.cache
 @dataclass
 class Defaults:
@@ -23,6 +38,29 @@ class Defaults:
     APP_URL_SHORT: str = r"https://tinyurl.com/st-kinematics1d-demo"
     ON_ST_CLOUD: bool = is_streamlit_cloud()
     USE_DEBUG_MODE: bool = use_debug_mode()
+    SOLVE_CACHE_SIZE: int = solve_cache_size()
+    MAX_PLOT_POINTS: int = 1000
+    TRAJECTORY_POINTS: Tuple[int, ...] = (100, 1_000, 10_000, 100_000, 1_000_000)
+    SWEEP_POINTS: int = 50
+    MC_SAMPLES: int = 100_000
+
+
+@st.cache(allow_output_mutation=True)
+def get_solve_cache(maxsize: int = Defaults.SOLVE_CACHE_SIZE) -> Optional[K.SolveCache]:
+    """Returns the solve cache shared by all sessions (``None`` when disabled)."""
+    return K.SolveCache(maxsize=maxsize) if maxsize else None
+
+
+def update_session_solver(params: Dict[str, Optional[float]], cache: Optional[K.SolveCache] = None) -> Tuple[K.Kinematics1D, K.SolveUpdate]:
+    """Keeps the session's ``Kinematics1D`` in ``st.session_state`` and updates
+    it incrementally, so an edit of one parameter only re-evaluates the
+    outputs that depend on it.
+    """
+    k1 = st.session_state.get("kinematics1d")
+    if k1 is None:
+        k1 = K.Kinematics1D(cache=cache)
+        st.session_state["kinematics1d"] = k1
+    return k1, k1.update(**params)
 
 
 def add_about_section():
@@ -117,6 +155,114 @@ def display_result(result: Dict[str, Any], known: Optional[List[str]]=None):
     st.warning("#### Parameters as JSON 📄")
     st.json(result)
 
+def show_trajectory(k1: K.Kinematics1D, n_points: int, max_points: int = Defaults.MAX_PLOT_POINTS):
+    """Plots position and velocity over time. The trajectory is sampled and
+    downsampled (LTTB) on the server chunk by chunk, so memory stays bounded
+    and at most ``max_points`` points are sent to the browser.
+    """
+    try:
+        shown = downsample_chunks(k1.iter_trajectory(n_points=n_points), n_points, n_out=max_points)
+    except ValueError as ve:
+        st.warning(f"{ve}")
+        return
+    st.caption(f"{n_points:,} samples, {len(shown.time):,} plotted.")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write(r"Position $x(t)$ $\scriptsize (\text{m})$")
+        st.line_chart(pd.DataFrame({"x": shown.x}, index=pd.Index(shown.time, name="t")))
+    with col2:
+        st.write(r"Velocity $v(t)$ $\scriptsize (\text{m/s})$")
+        st.line_chart(pd.DataFrame({"v": shown.v}, index=pd.Index(shown.time, name="t")))
+
+
+def show_sweep(k1: K.Kinematics1D, known: List[str], n_points: int = Defaults.SWEEP_POINTS):
+    """Sweeps one (line plot) or two (heatmap) of the known parameters. The
+    whole grid is solved in one vectorized call. Only the knowns the solve
+    plan reads are offered (sweeping another one would have no effect).
+    """
+    plan = K.get_plan(known)
+    options = [name for name in known if plan is not None and name in plan.known]
+    swept = st.multiselect(
+        label="Parameters to sweep 👇",
+        options=options,
+        default=options[:1],
+        help="One parameter gives a line plot, two give a heatmap.",
+    )
+    if not 1 <= len(swept) <= 2:
+        st.warning("Select one or two parameters to sweep.")
+        return
+    axes = dict()
+    for col, name in zip(st.columns(len(swept)), swept):
+        value = k1.params[name]
+        low, high = sorted((0.5 * value, 1.5 * value)) if value else (-1.0, 1.0)
+        with col:
+            start = st.number_input(label=f"{name} from", value=float(low))
+            stop = st.number_input(label=f"{name} to", value=float(high))
+        axes[name] = np.linspace(start, stop, n_points)
+    outputs = [name for name in k1.params if name not in swept]
+    output = st.selectbox(
+        label="Plotted parameter 👇",
+        options=outputs,
+        index=next((i for i, name in enumerate(outputs) if name not in known), 0),
+    )
+    frame = k1.sweep(**axes).to_frame()
+    if len(swept) == 1:
+        st.line_chart(frame.set_index(swept[0])[[output]])
+        return
+    x, y = swept
+    chart = alt.Chart(frame).mark_rect().encode(
+        x=alt.X(f"{x}:O", axis=alt.Axis(format=".4~g", labelOverlap=True)),
+        y=alt.Y(f"{y}:O", axis=alt.Axis(format=".4~g", labelOverlap=True), sort="descending"),
+        color=alt.Color(f"{output}:Q"),
+        tooltip=[x, y, output],
+    )
+    st.altair_chart(chart, use_container_width=True)
+
+
+def show_uncertainty(k1: K.Kinematics1D, known: List[str], result: Dict[str, Any], n_samples: int = Defaults.MC_SAMPLES):
+    """Monte Carlo uncertainty: the known parameters get (normal) error bars
+    and the spread of every parameter is shown next to its point value.
+    """
+    errors = dict()
+    for col, name in zip(st.columns(len(known)), known):
+        with col:
+            errors[name] = st.number_input(label=f"± {name} (1σ)", min_value=0.0, value=0.0, key=f"sigma_{name}")
+    seed = st.number_input(label="Seed", min_value=0, value=0, step=1, help="Same seed, same samples.")
+    distributions = dict((name, K.Normal(k1.params[name], sigma)) for name, sigma in errors.items() if sigma > 0)
+    if not distributions:
+        st.caption("Give at least one known parameter an error bar (1σ).")
+        return
+    res = k1.uncertainty(n_samples=n_samples, seed=int(seed), **distributions)
+    names = list(result)
+    frame = pd.DataFrame(
+        {
+            "value": [result[name] for name in names],
+            "mean": [res.mean[name] for name in names],
+            "std": [res.std[name] for name in names],
+            "p2.5": [res.percentiles[name][2.5] for name in names],
+            "p97.5": [res.percentiles[name][97.5] for name in names],
+        },
+        index=pd.Index(names, name="param"),
+    )
+    st.caption(f"{n_samples:,} samples (normal errors), seed {int(seed)}.")
+    st.dataframe(frame.round(k1.ndigits))
+
+
+def show_debug_info(cache: Optional[K.SolveCache] = None, stats: Optional[K.SolveStats] = None):
+    """Shows debug information (solve cache and solve instrumentation statistics)."""
+    with st.expander("Debug Info 🐞", expanded=False):
+        st.write("#### Solve Cache")
+        st.json(cache.stats() if cache is not None else dict(enabled=False))
+        st.write("#### Solve Instrumentation")
+        if stats is None:
+            st.json(dict(enabled=False))
+            return
+        info = stats.as_dict()
+        st.json(dict(solves=info["solves"], plans=info["plans"], steps=info["steps"]))
+        if info["equations"]:
+            st.dataframe(pd.DataFrame.from_dict(info["equations"], orient="index"))
+
+
 def app_introduction():
     st.write(dedent("""
     This app helps in evaluating the following parameters for 1D kinematics